@@ -0,0 +1,87 @@
+"""
+Batch engine cross-check and benchmark for the Organ Attack card game.
+Plays random-policy games on the scalar engine and on the NumPy batch engine
+with the same card set, checks that their statistics agree and compares
+games per second. The speedup it prints depends on the machine and its
+load. The batch engine is already vectorised across games, so what remains
+is NumPy work per game and move rather than interpreter overhead. The
+fixed-seed agreement check also runs as tests/test_batch.py.
+
+Usage: python -m benchmarks.bench_batch [--games N] [--batch-games M] [--players K]
+"""
+
+import argparse
+import sys
+import time
+
+from game.batch import BatchEngine, supported_catalog
+from game.simulate import game_seed, play_game
+from game.stats import SimulationStats
+
+# How far the two engines may drift apart before the check fails
+LENGTH_TOLERANCE = 0.03
+WIN_RATE_TOLERANCE = 0.03
+CARD_PLAYS_TOLERANCE = 0.2
+
+
+def compare(scalar: SimulationStats, batch: SimulationStats, num_players: int) -> bool:
+    """Print the two engines' statistics side by side and return whether they agree."""
+    ok = True
+
+    def check(label, a, b, agree):
+        nonlocal ok
+        ok &= agree
+        print(f"  {label:<40} {a:8.3f} {b:8.3f}  {'ok' if agree else 'MISMATCH'}")
+
+    print(f"\n  {'':<40} {'scalar':>8} {'batch':>8}")
+    length, batch_length = scalar.turns / scalar.games, batch.turns / batch.games
+    check("mean game length", length, batch_length,
+          abs(batch_length - length) <= LENGTH_TOLERANCE * length)
+    elimination, batch_elimination = scalar.elimination_turns.mean, batch.elimination_turns.mean
+    check("mean elimination turn", elimination, batch_elimination,
+          abs(batch_elimination - elimination) <= LENGTH_TOLERANCE * elimination)
+    for seat in range(num_players):
+        rate = scalar.wins_by_seat[seat] / scalar.games
+        batch_rate = batch.wins_by_seat[seat] / batch.games
+        check(f"seat {seat} win rate", rate, batch_rate, abs(batch_rate - rate) <= WIN_RATE_TOLERANCE)
+    for name in sorted(set(scalar.card_plays) | set(batch.card_plays)):
+        plays = scalar.card_plays[name] / scalar.games
+        batch_plays = batch.card_plays[name] / batch.games
+        check(f"{name} plays/game", plays, batch_plays,
+              abs(batch_plays - plays) <= max(CARD_PLAYS_TOLERANCE, CARD_PLAYS_TOLERANCE * plays))
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cross-check and benchmark the batch engine")
+    parser.add_argument("--games", type=int, default=1000, help="games on the scalar engine")
+    parser.add_argument("--batch-games", type=int, default=50000, help="games on the batch engine")
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    catalog = supported_catalog()
+
+    scalar = SimulationStats()
+    start = time.perf_counter()
+    for i in range(args.games):
+        play_game(game_seed(args.seed, i), args.players, ["random"], scalar, catalog=catalog)
+    scalar_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = BatchEngine(args.batch_games, args.players, seed=args.seed, catalog=catalog).run()
+    batch_elapsed = time.perf_counter() - start
+
+    ok = compare(scalar, batch, args.players)
+
+    scalar_rate = scalar.games / scalar_elapsed
+    batch_rate = batch.games / batch_elapsed
+    print(f"\nscalar: {scalar.games} games in {scalar_elapsed:.2f}s ({scalar_rate:,.0f} games/sec)")
+    print(f"batch:  {batch.games} games in {batch_elapsed:.2f}s ({batch_rate:,.0f} games/sec)")
+    print(f"speedup: {batch_rate / scalar_rate:.1f}x")
+    print("PASS" if ok else "FAIL")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Broadcast latency benchmark for the Organ Attack game server.
+Runs a server in-process with a lobby of websocket clients, plays end-turn
+actions and measures how long each state update takes to reach every player.
+With --slow-ms, sends to the host take that much longer, as over a congested
+link; the latency shown is to everyone else, and the host's send queue stats
+show how its updates were collapsed.
+
+Usage: python -m benchmarks.bench_broadcast [--players K] [--actions N] [--slow-ms MS]
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+import websockets
+
+from server.server import GameServer
+
+
+async def _reader(websocket, inbox: asyncio.Queue):
+    async for message in websocket:
+        await inbox.put((json.loads(message), time.perf_counter()))
+
+
+async def _expect(inbox: asyncio.Queue, message_type: str):
+    while True:
+        message, received = await inbox.get()
+        if message.get("type") == message_type:
+            return message, received
+
+
+def _slow_down(server: GameServer, recipient: str, delay: float):
+    """Make every send to one recipient take `delay` seconds longer."""
+    outbox = next(outbox for outbox in server.outboxes.values() if outbox.name == recipient)
+    write = outbox._write
+
+    async def slow_write(frame):
+        await asyncio.sleep(delay)
+        await write(frame)
+
+    outbox._write = slow_write
+
+
+async def run(players: int, actions: int, port: int, slow_ms: float = 0.0):
+    server = GameServer("127.0.0.1", port)
+    await server.start()
+    url = f"ws://127.0.0.1:{port}"
+    clients, inboxes, readers = [], [], []
+    try:
+        for _ in range(players):
+            websocket = await websockets.connect(url)
+            inbox = asyncio.Queue()
+            clients.append(websocket)
+            inboxes.append(inbox)
+            readers.append(asyncio.create_task(_reader(websocket, inbox)))
+
+        await clients[0].send(json.dumps({"type": "create_lobby", "player_name": "Player 1"}))
+        code = (await _expect(inboxes[0], "lobby_created"))[0]["code"]
+        for i in range(1, players):
+            await clients[i].send(json.dumps({"type": "join_lobby", "code": code, "player_name": f"Player {i + 1}"}))
+            await _expect(inboxes[i], "joined_lobby")
+        await clients[0].send(json.dumps({"type": "start_game"}))
+        for inbox in inboxes:
+            await _expect(inbox, "game_started")
+        if slow_ms:
+            _slow_down(server, "Player 1", slow_ms / 1000)
+
+        engine = server.lobby_manager.get_lobby(code).game_engine
+        latencies = []
+        for _ in range(actions):
+            seat = engine.current_player_index
+            start = time.perf_counter()
+            await clients[seat].send(json.dumps({
+                "type": "game_action", "action": "end_turn",
+                "data": {"player_name": engine.player_names[seat]}
+            }))
+            if slow_ms:
+                # The host may get a collapsed full state instead of every update
+                arrivals = [(await _expect(inbox, "game_state_update"))[1] for inbox in inboxes[1:]]
+            else:
+                arrivals = [(await _expect(inbox, "game_state_update"))[1] for inbox in inboxes]
+            latencies.append(max(arrivals) - start)
+        stats = server.connection_stats()
+    finally:
+        for reader in readers:
+            reader.cancel()
+        for websocket in clients:
+            await websocket.close()
+        await server.stop()
+    return latencies, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure state broadcast latency for one lobby")
+    parser.add_argument("--players", type=int, default=8)
+    parser.add_argument("--actions", type=int, default=500)
+    parser.add_argument("--port", type=int, default=8790)
+    parser.add_argument("--slow-ms", type=float, default=0.0, help="extra delay on every send to the host")
+    args = parser.parse_args()
+
+    latencies, stats = asyncio.run(run(args.players, args.actions, args.port, args.slow_ms))
+    latencies.sort()
+    ms = [latency * 1000 for latency in latencies]
+    audience = "last delivery" if not args.slow_ms else f"last delivery past a {args.slow_ms:g} ms host"
+    print(f"{args.players} players, {args.actions} actions: action to {audience} "
+          f"mean {statistics.mean(ms):.3f} ms, p50 {ms[len(ms) // 2]:.3f} ms, "
+          f"p99 {ms[int(len(ms) * 0.99)]:.3f} ms, max {ms[-1]:.3f} ms")
+    host = stats["Player 1"]
+    print(f"host send queue: max depth {host['max_depth']}, sent {host['sent']}, dropped {host['dropped']}, "
+          f"evicted {host['evicted']}")
+
+
+if __name__ == "__main__":
+    main()
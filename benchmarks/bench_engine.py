@@ -0,0 +1,68 @@
+"""
+Engine throughput benchmark for the Organ Attack card game.
+Plays random games through GameEngine.apply and reports turns per second.
+
+Usage: python -m benchmarks.bench_engine [--games N] [--players K]
+"""
+
+import argparse
+import random
+import time
+
+from game.game_engine import GameEngine, MAX_CARDS_PER_TURN
+from game.models import ActionType, GameAction
+
+MAX_TURNS = 500
+
+
+def _random_turn(engine: GameEngine):
+    """Play up to the per-turn card limit at random targets, then end the turn."""
+    player = engine.get_current_player()
+    for _ in range(MAX_CARDS_PER_TURN):
+        if not len(player.hand):
+            break
+        card = random.choice(list(player.hand))
+        opponents = [p for p in engine.get_active_players() if p is not player]
+        target_player = random.choice(opponents) if opponents else None
+        target_organ = card.organ_type
+        if target_player and (not target_organ or target_organ == 'Any'):
+            organs = target_player.get_available_organs()
+            target_organ = random.choice(organs).organ_type if organs else None
+        engine.apply(GameAction(
+            ActionType.PLAY_CARD, player.name, card.instance_id,
+            target_player.name if target_player else None, target_organ
+        ))
+    return engine.apply(GameAction(ActionType.END_TURN, player.name))
+
+
+def run(games: int, players: int, seed: int = 0) -> int:
+    """Play the given number of games and return the total turns taken."""
+    names = [f"Player {i + 1}" for i in range(players)]
+    turns = 0
+    for game in range(games):
+        engine = GameEngine(names, seed=seed + game)
+        for _ in range(MAX_TURNS):
+            turns += 1
+            if _random_turn(engine).get("game_over"):
+                break
+    return turns
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark GameEngine.apply throughput")
+    parser.add_argument("--games", type=int, default=200)
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    start = time.perf_counter()
+    turns = run(args.games, args.players, args.seed)
+    elapsed = time.perf_counter() - start
+
+    print(f"{args.games} games, {turns} turns in {elapsed:.2f}s")
+    print(f"{turns / elapsed:,.0f} turns/sec ({args.games / elapsed:,.1f} games/sec)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Action journal benchmark for the Organ Attack card game.
+Plays random games while journaling them, checks that replays rebuild the
+same state, and compares the journal's size with per-turn to_dict() snapshots.
+
+Usage: python -m benchmarks.bench_journal [--games N] [--players K]
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from game.game_engine import GameEngine
+from game.journal import ActionJournal, Replayer, replay
+from game.models import ActionType
+from game.policies import RandomPolicy
+from game.simulate import MAX_TURNS, policy_rng
+
+
+def play(seed: int, players: int):
+    """Play one journaled game; return the engine, journal, snapshot bytes and play time."""
+    names = [f"Player {i + 1}" for i in range(players)]
+    engine = GameEngine(names, seed=seed)
+    journal = ActionJournal(seed, names)
+    policy = RandomPolicy()
+    rng = policy_rng(seed)
+    snapshot_bytes = 0
+    elapsed = 0.0
+
+    while not engine.is_game_over() and engine.turn_count < MAX_TURNS:
+        action = policy.choose_action(engine, engine.get_current_player(), rng)
+        start = time.perf_counter()
+        result = engine.apply(action)
+        elapsed += time.perf_counter() - start
+        if result.get("success"):
+            journal.record(action)
+        if action.type == ActionType.END_TURN:
+            snapshot_bytes += len(json.dumps(engine.to_dict()))
+    return engine, journal, snapshot_bytes, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark action journaling and replay")
+    parser.add_argument("--games", type=int, default=50)
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    journal_bytes = snapshot_bytes = actions = turns = 0
+    play_time = replay_time = seek_time = 0.0
+    mismatches = 0
+    for game in range(args.games):
+        engine, journal, snapshots, elapsed = play(args.seed + game, args.players)
+        data = journal.to_bytes()
+        journal_bytes += len(data)
+        snapshot_bytes += snapshots
+        actions += len(journal)
+        turns += engine.turn_count
+        play_time += elapsed
+
+        start = time.perf_counter()
+        replayed = replay(ActionJournal.from_bytes(data))
+        replay_time += time.perf_counter() - start
+        if json.dumps(replayed.to_dict()) != json.dumps(engine.to_dict()):
+            mismatches += 1
+
+        # Seek to the middle of the game after playing to the end
+        replayer = Replayer(journal)
+        replayer.seek(len(journal))
+        start = time.perf_counter()
+        replayer.seek_turn(engine.turn_count // 2)
+        seek_time += time.perf_counter() - start
+
+    print(f"{args.games} games, {turns} turns, {actions} journaled actions")
+    print(f"journal: {journal_bytes:,} bytes; per-turn snapshots: {snapshot_bytes:,} bytes "
+          f"({journal_bytes / snapshot_bytes:.2%})")
+    print(f"replay: {actions / replay_time:,.0f} actions/sec, {turns / replay_time:,.0f} turns/sec "
+          f"(engine alone while playing: {actions / play_time:,.0f} actions/sec)")
+    print(f"seek to mid-game from the end: {seek_time / args.games * 1000:.2f} ms/game")
+    print("PASS" if not mismatches else f"FAIL: {mismatches} replays diverged")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,566 @@
+"""
+Lockstep batch engine for the Organ Attack card game.
+Holds many independent games as NumPy arrays and advances them all a turn at a
+time with every seat on the random policy, for card-balance sweeps.
+
+Needs NumPy, which ships with the "sim" extra: pip install 'organ-attack[sim]'.
+"""
+
+import time
+from collections import Counter
+from typing import List, Optional
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError("game.batch needs NumPy; install it with pip install 'organ-attack[sim]'") from e
+
+from game.catalog import CardCatalog, get_catalog
+from game.game_engine import HAND_SIZE
+from game.models import Card, CardType, OrganType
+from game.rules import MAX_CARDS_PER_TURN, MAX_ORGAN_SLOTS
+from game.simulate import MAX_TURNS
+from game.stats import QuantileSketch, SimulationStats
+
+STARTING_ORGANS = 6
+# Seats are bits of a uint8 mask
+MAX_PLAYERS = 8
+# Hands start with this many slots and widen by as many again when one fills up
+HAND_SLOTS = 8
+NEVER = np.iinfo(np.int32).max
+
+# Card kinds, one per supported effect action
+ATTACK, BLOCK, PROTECT, STEAL, DRAW, SKIP, EXTRA, LUCK, MASS = range(9)
+
+# Play condition bits
+NEEDS_ORGAN, NEEDS_UNPROTECTED, NEEDS_SLOT = 1, 2, 4
+
+ORGAN_TYPES = [organ_type.value for organ_type in OrganType]
+ORGAN_INDEX = {organ_type: i for i, organ_type in enumerate(ORGAN_TYPES)}
+
+
+def card_kind(card: Card) -> Optional[int]:
+    """The batch engine's kind for a card, or None if it can't play the card.
+
+    Only single-effect cards whose targeting matches how the scalar engine
+    targets that effect are supported; mimic_card needs the discard order and
+    is not.
+    """
+    if len(card.effects) != 1:
+        return None
+    action = card.effects[0].action
+    target = card.target
+    player_scope = target.player_scope if target else None
+    organ_type = target.organ_type if target else None
+
+    if action == 'remove_organ':
+        if player_scope == 'Other' and organ_type in ORGAN_INDEX:
+            return ATTACK
+    elif action == 'protect_organ':
+        if player_scope == 'Self' and organ_type == 'Any':
+            return PROTECT
+    elif action == 'steal_organ':
+        if player_scope == 'Other':
+            return STEAL
+    elif action == 'skip_turn':
+        if player_scope == 'Other':
+            return SKIP
+    elif action == 'test_luck':
+        if player_scope == 'Any' and organ_type == 'Any':
+            return LUCK
+    elif player_scope in (None, 'All'):
+        return {'block_attack': BLOCK, 'draw_cards': DRAW, 'extra_turn': EXTRA,
+                'mass_discard': MASS}.get(action)
+    return None
+
+
+def _add_all(sketch: QuantileSketch, values: np.ndarray):
+    """Add integer values to a sketch once per distinct value, with its count."""
+    for value, count in zip(*np.unique(values, return_counts=True)):
+        sketch.add(int(value), int(count))
+
+
+def supported_catalog(catalog: Optional[CardCatalog] = None) -> CardCatalog:
+    """A copy of the catalog without the cards the batch engine can't play."""
+    catalog = catalog if catalog is not None else get_catalog()
+    cards = [card for card in catalog.all_cards.values()
+             if card.type == CardType.ORGAN or card_kind(card) is not None]
+    return CardCatalog(cards, source=f"{catalog.source} (batch-supported)", version=catalog.version)
+
+
+class BatchEngine:
+    """Many independent games advanced in lockstep, one turn per step.
+
+    Follows the scalar engine's rules and RandomPolicy's choices: each move
+    picks uniformly among the distinct (card, target) plays, or discards a
+    random card when nothing is playable.
+
+    Organs are stored per organ type as a bitmask of the seats holding one, so
+    counting targets is a popcount. Hands are slot arrays of card indexes and
+    decks are shuffled card orders with a read position.
+    """
+
+    # Per-game arrays, compacted together when games finish
+    _STATE = ('hp', 'owners', 'guarded', 'expires', 'next_expiry', 'organ_count', 'guard_count',
+              'active', 'skip', 'hand', 'hand_size', 'deck', 'deck_pos', 'deck_len',
+              'discard', 'discard_size', 'turn', 'played', 'extra', 'current', 'done')
+
+    def __init__(self, num_games: int, num_players: int, seed: Optional[int] = None,
+                 catalog: Optional[CardCatalog] = None):
+        if not 2 <= num_players <= MAX_PLAYERS:
+            raise ValueError(f"Batch engine plays 2 to {MAX_PLAYERS} players, not {num_players}")
+        catalog = catalog if catalog is not None else get_catalog()
+        self.cards: List[Card] = list(catalog.non_organ_cards)
+        kinds = [card_kind(card) for card in self.cards]
+        unsupported = [card.name for card, kind in zip(self.cards, kinds) if kind is None]
+        if unsupported:
+            raise ValueError(f"Batch engine can't play: {', '.join(unsupported)}; "
+                             f"use supported_catalog() to leave them out")
+
+        self.num_players = num_players
+        self.num_cards = len(self.cards)
+        self.seats = np.arange(num_players, dtype=np.uint8)
+        self.seat_bit = (1 << self.seats).astype(np.uint8)
+        self.rng = np.random.default_rng(seed)
+        self._compile_cards(kinds)
+
+        templates = catalog.organ_templates
+        self.organ_hp = np.array([templates[t].hit_points for t in OrganType], dtype=np.int8)
+        self.organ_protectable = np.array([templates[t].can_be_protected for t in OrganType])
+
+        self.stats = SimulationStats()
+        self._card_plays = np.zeros(self.num_cards, dtype=np.int64)
+        self._setup(num_games)
+
+    def _compile_cards(self, kinds: List[int]):
+        """Turn the card list into per-card lookup arrays.
+
+        Lookups indexed by hand slots have one extra entry for the empty-slot
+        sentinel, card index num_cards.
+        """
+        cards = self.cards
+        self.kind = np.array(kinds + [-1])
+
+        def condition(name):
+            return np.array([bool(card.conditions and getattr(card.conditions, name)) for card in cards] + [False])
+
+        needs_unprotected = condition('organ_must_not_be_protected')
+        self.conditions = (condition('organ_must_be_present') * NEEDS_ORGAN |
+                           needs_unprotected * NEEDS_UNPROTECTED |
+                           condition('player_must_have_available_slot') * NEEDS_SLOT).astype(np.uint8)
+        self.attack_organ = np.array([ORGAN_INDEX[card.target.organ_type] if kind == ATTACK else 0
+                                      for card, kind in zip(cards, kinds)] + [0], dtype=np.intp)
+        # Seat mask of the targets that protection rules out, per card
+        self.open_mask = np.where((self.kind == ATTACK) & needs_unprotected, 0xFF, 0).astype(np.uint8)
+
+        self.draw_value = np.array([card.effects[0].value or 1 for card in cards])
+        self.draw_all = np.array([bool(card.target and card.target.player_scope == 'All') for card in cards])
+        copies = np.array([5 if card.type in (CardType.ATTACK, CardType.DEFENSE) else 2 for card in cards])
+        # The full deck, and each copy's number among the copies of its card
+        self.deck_cards = np.repeat(np.arange(len(cards)), copies)
+        self.deck_copy = np.arange(len(self.deck_cards)) - np.repeat(np.cumsum(copies) - copies, copies)
+
+    def _setup(self, num_games: int):
+        """Deal organs and starting hands for every game."""
+        n, p, o = num_games, self.num_players, len(ORGAN_TYPES)
+        rng = self.rng
+
+        self.hp = np.zeros((n, p, o), dtype=np.int8)
+        chosen = np.argsort(rng.random((n, p, o)), axis=2)[:, :, :STARTING_ORGANS]
+        np.put_along_axis(self.hp, chosen, self.organ_hp[chosen], axis=2)
+        self.owners = self._seat_bits(self.hp > 0)
+        self.guarded = np.zeros((n, o), dtype=np.uint8)
+        self.expires = np.zeros((n, p, o), dtype=np.int32)
+        self.next_expiry = np.full(n, NEVER, dtype=np.int32)
+        self.organ_count = np.full((n, p), STARTING_ORGANS, dtype=np.int8)
+        self.guard_count = np.zeros((n, p), dtype=np.int8)
+
+        self.active = np.full(n, (1 << p) - 1, dtype=np.uint8)
+        self.skip = np.zeros((n, p), dtype=bool)
+        self.hand = np.zeros((n, p, HAND_SLOTS), dtype=np.intp)
+        self.hand_size = np.zeros((n, p), dtype=np.int16)
+        size = len(self.deck_cards)
+        self.deck = self.deck_cards[np.argsort(rng.random((n, size)), axis=1)]
+        self.deck_pos = np.zeros(n, dtype=np.int32)
+        self.deck_len = np.full(n, size, dtype=np.int32)
+        self.discard = np.zeros((n, self.num_cards), dtype=np.int16)
+        self.discard_size = np.zeros(n, dtype=np.int32)
+
+        self.turn = np.zeros(n, dtype=np.int32)
+        self.played = np.zeros(n, dtype=np.int8)
+        self.extra = np.zeros(n, dtype=bool)
+        self.done = np.zeros(n, dtype=bool)
+        self._scratch = np.zeros(n * (self.num_cards + 1), dtype=np.int8)
+
+        games = np.arange(n)
+        for seat in range(p):
+            for _ in range(HAND_SIZE):
+                self._draw(games, np.full(n, seat))
+        self.current = rng.integers(0, p, n)
+
+    @property
+    def num_live(self) -> int:
+        """Games still being played."""
+        return len(self.done) - int(self.done.sum())
+
+    def _seat_bits(self, mask: np.ndarray) -> np.ndarray:
+        """Collapse a (games, seats, organs) mask into per-organ seat bitmasks."""
+        return (mask * self.seat_bit[:, None]).sum(1, dtype=np.uint8)
+
+    def _seat_mask(self, bits: np.ndarray) -> np.ndarray:
+        """Expand seat bitmasks into a boolean array with a trailing seat axis."""
+        return ((bits[..., None] >> self.seats) & 1).astype(bool)
+
+    def _draw(self, games: np.ndarray, seats: np.ndarray) -> np.ndarray:
+        """Draw one card for each (game, seat), reshuffling the discard pile into empty decks.
+
+        Games must be distinct. Returns the games that got a card.
+        """
+        empty = self.deck_pos[games] >= self.deck_len[games]
+        if empty.any():
+            self._reshuffle(games[empty])
+            drawn = self.deck_pos[games] < self.deck_len[games]
+            games, seats = games[drawn], seats[drawn]
+        positions = self.deck_pos[games]
+        self.deck_pos[games] = positions + 1
+        self._add(games, seats, self.deck.reshape(-1)[games * self.deck.shape[1] + positions])
+        return games
+
+    def _reshuffle(self, games: np.ndarray):
+        """Shuffle each game's discard pile into a new deck."""
+        keys = self.rng.random((len(games), len(self.deck_cards)))
+        keys[self.deck_copy >= self.discard[games][:, self.deck_cards]] = 2.0
+        self.deck[games] = self.deck_cards[np.argsort(keys, axis=1)]
+        self.deck_pos[games] = 0
+        self.deck_len[games] = self.discard_size[games]
+        self.discard[games] = 0
+        self.discard_size[games] = 0
+
+    def _hand_rows(self, games: np.ndarray, seats: np.ndarray) -> np.ndarray:
+        """Row numbers of (game, seat) hands in the flattened hand arrays."""
+        return games * self.num_players + seats
+
+    def _add(self, games: np.ndarray, seats: np.ndarray, cards: np.ndarray):
+        """Put one card into each (game, seat)'s hand, widening the hands if one is full."""
+        rows = self._hand_rows(games, seats)
+        hand_size = self.hand_size.reshape(-1)
+        sizes = hand_size[rows]
+        if sizes.max(initial=0) >= self.hand.shape[2]:
+            self.hand = np.pad(self.hand, ((0, 0), (0, 0), (0, HAND_SLOTS)))
+        self.hand.reshape(-1)[rows * self.hand.shape[2] + sizes] = cards
+        hand_size[rows] = sizes + 1
+
+    def _remove(self, games: np.ndarray, seats: np.ndarray, slots: np.ndarray):
+        """Take the card in each given hand slot, moving the last card into the gap."""
+        rows = self._hand_rows(games, seats)
+        hand_size = self.hand_size.reshape(-1)
+        last = hand_size[rows] - 1
+        hand_size[rows] = last
+        hand = self.hand.reshape(-1)
+        starts = rows * self.hand.shape[2]
+        hand[starts + slots] = hand[starts + last]
+
+    def _sample(self, weights: np.ndarray, totals: np.ndarray) -> np.ndarray:
+        """Pick one row per column with probability proportional to its weight.
+
+        Counts the running totals that stay at or below a uniform draw, a row at
+        a time, which beats cumsum on short columns.
+        """
+        r = self.rng.random(len(totals)) * totals
+        running = np.zeros_like(totals)
+        picked = np.zeros(len(totals), dtype=np.intp)
+        for row in weights[:-1]:
+            running += row
+            picked += running <= r
+        return picked
+
+    def _pick(self, mask: np.ndarray) -> np.ndarray:
+        """Pick one True column per row uniformly at random."""
+        keys = self.rng.random(mask.shape)
+        keys[~mask] = -1.0
+        return keys.argmax(1)
+
+    def _pick_seat(self, bits: np.ndarray) -> np.ndarray:
+        """Pick one seat per seat bitmask uniformly at random."""
+        return self._pick(self._seat_mask(bits))
+
+    def _refill(self, games: np.ndarray):
+        """Top each game's current player up to a full hand while cards last."""
+        for _ in range(HAND_SIZE):
+            games = games[self.hand_size[games, self.current[games]] < HAND_SIZE]
+            if not len(games):
+                return
+            games = self._draw(games, self.current[games])
+
+    def _eliminate(self, games: np.ndarray, seats: np.ndarray):
+        """Eliminate seats that have no organs left."""
+        gone = self.organ_count[games, seats] == 0
+        self.active[games[gone]] &= ~self.seat_bit[seats[gone]]
+
+    def _damage(self, games: np.ndarray, seats: np.ndarray, organs: np.ndarray):
+        """Deal 1 damage to each unprotected target organ."""
+        bits = self.seat_bit[seats]
+        hit = (self.guarded[games, organs] & bits) == 0
+        games, seats, organs, bits = games[hit], seats[hit], organs[hit], bits[hit]
+        hp = self.hp[games, seats, organs] - 1
+        self.hp[games, seats, organs] = hp
+        dead = hp == 0
+        games, seats = games[dead], seats[dead]
+        self.owners[games, organs[dead]] &= ~bits[dead]
+        self.organ_count[games, seats] -= 1
+        self._eliminate(games, seats)
+
+    def step(self):
+        """Play one turn in every live game: up to two moves, then end the turn."""
+        before = np.bitwise_count(self.active)
+        for _ in range(MAX_CARDS_PER_TURN):
+            self._move()
+        self._end_turn(before)
+
+    def _move(self):
+        """Each game whose current player can still act plays or discards one card."""
+        c, width = self.num_cards, self.hand.shape[2]
+        sizes = self.hand_size.reshape(-1)[self._hand_rows(np.arange(len(self.turn)), self.current)]
+        games = np.flatnonzero((self.played < MAX_CARDS_PER_TURN) & (sizes > 0))
+        if not len(games):
+            return
+        m = len(games)
+        rows = np.arange(m)
+        seat = self.current[games]
+        bit = self.seat_bit[seat]
+        active = self.active[games]
+        opponents = active & ~bit
+        organ_count = self.organ_count[games]
+        own_alive = organ_count[rows, seat].astype(np.int32)
+        own_open = own_alive - self.guard_count[games, seat]
+        # Eliminated players have no organs, so this counts organs in play
+        organs_in_play = organ_count.sum(1, dtype=np.int32)
+
+        # Hands are laid out slot-major, (slots, games), and empty slots hold
+        # the sentinel card. Each distinct card keeps one representative slot:
+        # whichever scratch write for it lands last.
+        sizes = sizes[games]
+        slots = np.arange(sizes.max())[:, None]
+        hand = np.take(self.hand.reshape(-1, width), self._hand_rows(games, seat), axis=0)[:, :len(slots)].T
+        hand = np.where(slots < sizes, hand, c)
+        scratch = hand + rows * (c + 1)
+        self._scratch[scratch] = slots
+        distinct = (self._scratch[scratch] == slots) & (hand < c)
+
+        # Number of distinct targets each card in hand could be played at
+        by_kind = np.ones((MASS + 1, m), dtype=np.int32)
+        by_kind[PROTECT] = own_alive
+        by_kind[STEAL] = organs_in_play - own_alive
+        by_kind[SKIP] = np.bitwise_count(opponents)
+        by_kind[LUCK] = organs_in_play
+        kinds = self.kind[hand]
+        counts = by_kind.reshape(-1)[kinds * m + rows]
+        organs = self.attack_organ[hand] + games * len(ORGAN_TYPES)
+        open_seats = self.owners.reshape(-1)[organs] & opponents
+        open_seats &= ~(self.guarded.reshape(-1)[organs] & self.open_mask[hand])
+        counts = np.where(kinds == ATTACK, np.bitwise_count(open_seats), counts)
+
+        failing = ((own_alive == 0) * NEEDS_ORGAN | (own_open == 0) * NEEDS_UNPROTECTED |
+                   (own_alive >= MAX_ORGAN_SLOTS) * NEEDS_SLOT)
+        weights = counts * (distinct & ((self.conditions[hand] & failing) == 0))
+        totals = weights.sum(0)
+        plays = totals > 0
+        # With nothing playable, discard a random distinct card
+        weights = np.where(plays, weights, distinct)
+        totals = np.where(plays, totals, distinct.sum(0, dtype=np.int32))
+        picked = self._sample(weights, totals)
+        cards = hand[picked, rows]
+        self._remove(games, seat, picked)
+        self.played[games] += 1
+
+        kinds = np.where(plays, self.kind[cards], -1)
+        self._card_plays += np.bincount(cards[plays], minlength=self.num_cards)
+
+        def group(kind):
+            return np.flatnonzero(kinds == kind)
+
+        # Attacks: a random opponent that has the organ
+        r = group(ATTACK)
+        if len(r):
+            g, c = games[r], cards[r]
+            organs = self.attack_organ[c]
+            targets = self.owners[g, organs] & opponents[r]
+            targets &= ~(self.guarded[g, organs] & self.open_mask[c])
+            self._damage(g, self._pick_seat(targets), organs)
+
+        # Vaccination: one of the player's own organs
+        r = group(PROTECT)
+        if len(r):
+            g, s, b = games[r], seat[r], bit[r]
+            organs = self._pick((self.owners[g] & b[:, None]) > 0)
+            ok = self.organ_protectable[organs]
+            g, s, b, organs = g[ok], s[ok], b[ok], organs[ok]
+            self.guard_count[g, s] += (self.guarded[g, organs] & b) == 0
+            self.guarded[g, organs] |= b
+            expires = self.turn[g] + self.num_players * 2
+            self.expires[g, s, organs] = expires
+            self.next_expiry[g] = np.minimum(self.next_expiry[g], expires)
+
+        # Organ steals: any organ of any opponent; blocked if protected, fails if already owned
+        r = group(STEAL)
+        if len(r):
+            g, thieves, thief_bits = games[r], seat[r], bit[r]
+            held = self._seat_mask(self.owners[g]).transpose(0, 2, 1) & self._seat_mask(opponents[r])[:, :, None]
+            victims, organs = np.divmod(self._pick(held.reshape(len(r), -1)), len(ORGAN_TYPES))
+            victim_bits = self.seat_bit[victims]
+            ok = ((self.guarded[g, organs] & victim_bits) == 0) & ((self.owners[g, organs] & thief_bits) == 0)
+            g, thieves, victims, organs = g[ok], thieves[ok], victims[ok], organs[ok]
+            self.hp[g, thieves, organs] = self.hp[g, victims, organs]
+            self.hp[g, victims, organs] = 0
+            self.owners[g, organs] ^= victim_bits[ok] | thief_bits[ok]
+            self.organ_count[g, victims] -= 1
+            self.organ_count[g, thieves] += 1
+            self._eliminate(g, victims)
+
+        # Test your luck: any organ of any active player, destroyed on tails
+        r = group(LUCK)
+        if len(r):
+            held = self._seat_mask(self.owners[games[r]] & active[r][:, None]).transpose(0, 2, 1)
+            targets, organs = np.divmod(self._pick(held.reshape(len(r), -1)), len(ORGAN_TYPES))
+            tails = self.rng.random(len(r)) < 0.5
+            self._damage(games[r][tails], targets[tails], organs[tails])
+
+        r = group(SKIP)
+        if len(r):
+            self.skip[games[r], self._pick_seat(opponents[r])] = True
+
+        r = group(EXTRA)
+        if len(r):
+            self.extra[games[r]] = True
+
+        r = group(DRAW)
+        if len(r):
+            self._draw_cards(games[r], seat[r], cards[r])
+
+        r = group(MASS)
+        if len(r):
+            self._mass_discard(games[r], seat[r])
+
+        # The played or discarded card only reaches the pile after its effects
+        self.discard[games, cards] += 1
+        self.discard_size[games] += 1
+
+    def _draw_cards(self, games: np.ndarray, seats: np.ndarray, cards: np.ndarray):
+        """Draw card effects: the player draws, or every player does for "All" cards.
+
+        Like the scalar engine, "All" includes eliminated players.
+        """
+        everyone = self.draw_all[cards]
+        values = self.draw_value[cards]
+        for seat in range(self.num_players):
+            drawing = everyone | (seats == seat)
+            for i in range(values.max()):
+                draw = drawing & (values > i)
+                if draw.any():
+                    self._draw(games[draw], np.full(draw.sum(), seat))
+
+    def _mass_discard(self, games: np.ndarray, seats: np.ndarray):
+        """Every other player discards half their hand, rounded down, at random."""
+        for seat in range(self.num_players):
+            others = games[seats != seat]
+            counts = self.hand_size[others, seat] // 2
+            for i in range(counts.max(initial=0)):
+                g = others[counts > i]
+                slots = (self.rng.random(len(g)) * self.hand_size[g, seat]).astype(np.intp)
+                cards = self.hand[g, seat, slots]
+                self._remove(g, np.full(len(g), seat), slots)
+                self.discard[g, cards] += 1
+                self.discard_size[g] += 1
+
+    def _expire(self, games: np.ndarray):
+        """Drop protections that have run out in the given games."""
+        expires = self.expires[games]
+        guarded = self._seat_mask(self.guarded[games]).transpose(0, 2, 1)
+        guarded &= expires > self.turn[games][:, None, None]
+        self.guarded[games] = self._seat_bits(guarded)
+        self.guard_count[games] = guarded.sum(2)
+        self.next_expiry[games] = np.where(guarded, expires, NEVER).min(axis=(1, 2))
+
+    def _end_turn(self, active_before: np.ndarray):
+        """Expire protections, then grant extra turns, finish games or pass play on."""
+        games = np.arange(len(self.turn))
+        due = self.next_expiry <= self.turn
+        if due.any():
+            self._expire(games[due])
+
+        extra = self.extra.copy()
+        if extra.any():
+            g = games[extra]
+            self.extra[g] = False
+            self._refill(g)
+            self.played[g] = 0
+            self.turn[g] += 1
+
+        remaining = np.bitwise_count(self.active)
+        finished = ~self.done & ~extra & (remaining <= 1)
+        passing = ~self.done & ~extra & ~finished
+
+        seat = self.current.copy()
+        searching = passing.copy()
+        for _ in range(self.num_players):
+            seat[searching] = (seat[searching] + 1) % self.num_players
+            active = ((self.active >> seat) & 1).astype(bool)
+            skipped = self.skip[games, seat]
+            clear = searching & active & skipped
+            self.skip[games[clear], seat[clear]] = False
+            searching &= ~(active & ~skipped)
+            if not searching.any():
+                break
+        self.current[passing] = seat[passing]
+
+        g = games[passing]
+        self._refill(g)
+        self.played[g] = 0
+        self.turn[g] += 1
+
+        eliminated = active_before - remaining
+        _add_all(self.stats.elimination_turns, np.repeat(self.turn, eliminated))
+
+        if finished.any():
+            # The lone survivor's seat is the number of bits below its bit
+            self._finish(finished, np.where(remaining == 1, np.bitwise_count(self.active - 1).astype(np.intp), -1))
+
+    def _finish(self, finished: np.ndarray, winners: np.ndarray):
+        """Record finished games and stop playing them.
+
+        Finished games stay in the arrays, with no moves left, until they make
+        up a quarter of them; dropping them every turn would copy all the state.
+        """
+        stats = self.stats
+        turns = self.turn[finished]
+        stats.games += int(finished.sum())
+        stats.turns += int(turns.sum())
+        stats.player_games += int(finished.sum()) * self.num_players
+        _add_all(stats.game_lengths, turns)
+        winners = winners[finished]
+        stats.wins_by_seat.update(winners[winners >= 0].tolist())
+        stats.draws += int((winners < 0).sum())
+
+        self.done |= finished
+        self.played[finished] = MAX_CARDS_PER_TURN
+        self.next_expiry[finished] = NEVER
+        if self.done.sum() * 4 >= len(self.done):
+            keep = ~self.done
+            for name in self._STATE:
+                setattr(self, name, getattr(self, name)[keep])
+
+    def run(self, max_turns: int = MAX_TURNS) -> SimulationStats:
+        """Play every game to the end, or to the turn cap, and return the results."""
+        began = time.perf_counter()
+        for _ in range(max_turns):
+            if not self.num_live:
+                break
+            self.step()
+        if self.num_live:
+            self._finish(~self.done, np.full(len(self.done), -1))
+
+        self.stats.card_plays = Counter({
+            card.name: int(plays) for card, plays in zip(self.cards, self._card_plays) if plays
+        })
+        self.stats.elapsed = time.perf_counter() - began
+        return self.stats
@@ -0,0 +1,58 @@
+"""
+Computer opponents for the Organ Attack card game.
+A bot drives one seat through the engine using a pluggable policy.
+"""
+
+import logging
+import random
+import time
+from typing import List, Optional, Tuple
+
+from game.models import ActionType, GameAction
+from game.policies import Policy, get_policy
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POLICY = "mcts"
+DEFAULT_TIME_BUDGET = 0.5
+
+
+class Bot:
+    """A computer-controlled player."""
+
+    def __init__(self, name: str, policy: Policy, seed: Optional[int] = None):
+        self.name = name
+        self.policy = policy
+        self.rng = random.Random(seed)
+
+    def choose_action(self, engine) -> GameAction:
+        """Pick the bot's next move."""
+        player = engine.get_player(self.name)
+        started = time.perf_counter()
+        action = self.policy.choose_action(engine, player, self.rng)
+        logger.debug("%s (%s) chose %s in %.0f ms", self.name, self.policy.name,
+                     action.type.value, (time.perf_counter() - started) * 1000)
+        return action
+
+    def take_turn(self, engine) -> List[Tuple[GameAction, dict]]:
+        """Play the bot's cards for this turn, stopping short of ending it.
+
+        Returns each move made with its result. The caller ends the turn, the
+        same way a human player's turn is ended.
+        """
+        moves = []
+        while engine.get_current_player().name == self.name and not engine.is_game_over():
+            action = self.choose_action(engine)
+            if action.type == ActionType.END_TURN:
+                break
+            result = engine.apply(action)
+            moves.append((action, result))
+            if not result.get("success"):
+                break
+        return moves
+
+
+def create_bot(name: str, policy: str = DEFAULT_POLICY, time_budget: Optional[float] = DEFAULT_TIME_BUDGET,
+               seed: Optional[int] = None) -> Bot:
+    """Build a bot using one of the built-in policies."""
+    return Bot(name, get_policy(policy, time_budget), seed)
@@ -0,0 +1,467 @@
+"""
+Process-wide card catalog for the Organ Attack card game.
+Loads card definitions once and shares them, read-only, across every game,
+and encodes them for clients, which cache them by etag so game states can
+refer to cards by id alone.
+"""
+
+import dataclasses
+import functools
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from game.effects import BoundEffect, UnknownEffectError, bind_effects
+from game.models import (VITAL_ORGAN_TYPES, Card, CardConditions,
+                         CardEffect, CardTarget, CardType, OrganCard,
+                         OrganCardDefinition, OrganTemplate, OrganType)
+from game.rules import PlayCheck, compile_play_checks
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CARDS_FILE = Path(__file__).resolve().parent.parent / "data" / "cards.json"
+
+# Bump to invalidate every cache, e.g. when parsing changes in another module
+CACHE_FORMAT = 3
+# Where compiled catalogs are cached; defaults to the user's cache directory
+CACHE_DIR_ENV = "ORGAN_ATTACK_CACHE_DIR"
+
+
+class CardCatalog:
+    """Immutable set of card definitions shared by reference across engines."""
+
+    def __init__(self, cards: List[Card], source: str = "", version: int = 1,
+                 content_hash: str = ""):
+        self.source = source
+        self.version = version
+        self.content_hash = content_hash
+
+        all_cards: Dict[str, Card] = {}
+        bound_effects: Dict[str, Tuple[BoundEffect, ...]] = {}
+        by_type: Dict[CardType, List[Card]] = {card_type: [] for card_type in CardType}
+        for card in cards:
+            try:
+                bound_effects[card.id] = bind_effects(card)
+            except UnknownEffectError as e:
+                logger.error(f"Rejecting card {card.id}: {e}")
+                continue
+            all_cards[card.id] = card
+            by_type[card.type].append(card)
+
+        self.all_cards: Mapping[str, Card] = MappingProxyType(all_cards)
+        self.cards_by_type: Mapping[CardType, Tuple[Card, ...]] = MappingProxyType(
+            {card_type: tuple(type_cards) for card_type, type_cards in by_type.items()}
+        )
+        self.non_organ_cards: Tuple[Card, ...] = tuple(
+            card for card_type in CardType if card_type != CardType.ORGAN
+            for card in self.cards_by_type[card_type]
+        )
+        self.organ_templates: Mapping[OrganType, OrganTemplate] = MappingProxyType(
+            _build_organ_templates(self.cards_by_type[CardType.ORGAN])
+        )
+        # Pristine organs keyed by organ type name, copied by new_organ()
+        self._organ_prototypes: Dict[str, OrganCard] = {
+            organ_type.value: template.create() for organ_type, template in self.organ_templates.items()
+        }
+        self.bound_effects: Mapping[str, Tuple[BoundEffect, ...]] = MappingProxyType(bound_effects)
+        self.play_checks: Mapping[str, Tuple[PlayCheck, ...]] = MappingProxyType(
+            {card_id: compile_play_checks(card.conditions) for card_id, card in all_cards.items()}
+        )
+        # (etag, JSON-encoded card definitions), built on first request
+        self._wire: Optional[Tuple[str, str]] = None
+
+    def __len__(self) -> int:
+        return len(self.all_cards)
+
+    def get_card(self, card_id: str) -> Optional[Card]:
+        """Get a card definition by ID."""
+        return self.all_cards.get(card_id)
+
+    @property
+    def etag(self) -> str:
+        """Short hash of the card definitions clients see; changes whenever they do."""
+        return self._wire_data()[0]
+
+    @property
+    def identity(self) -> str:
+        """Identifies the exact card definitions: the cards file's hash, or the etag for the built-in set."""
+        return self.content_hash or self.etag
+
+    def to_json(self) -> str:
+        """Every card definition keyed by id, JSON-encoded as clients receive it."""
+        return self._wire_data()[1]
+
+    def _wire_data(self) -> Tuple[str, str]:
+        if self._wire is None:
+            encoded = json.dumps({card_id: card_to_dict(card) for card_id, card in self.all_cards.items()},
+                                 separators=(',', ':'))
+            self._wire = (hashlib.sha256(encoded.encode()).hexdigest()[:16], encoded)
+        return self._wire
+
+    def new_organ(self, organ_type: str) -> OrganCard:
+        """A fresh, undamaged organ; a cheaper equivalent of organ_templates[...].create()."""
+        return self._organ_prototypes[organ_type].copy()
+
+    @classmethod
+    def load(cls, cards_file: Optional[str] = None, version: int = 1,
+             use_cache: bool = True) -> "CardCatalog":
+        """Load a catalog from a JSON file, falling back to a default card set.
+
+        The parsed cards are cached in get_cache_dir(), keyed by a hash of the
+        file's contents and of the code that parses it, so later loads skip
+        parsing until either changes.
+        """
+        start = time.perf_counter()
+        cards_path = Path(cards_file) if cards_file else DEFAULT_CARDS_FILE
+        try:
+            if not cards_path.exists():
+                logger.error(f"Cards file not found: {cards_path}")
+                return cls(_create_default_cards(), source="<default>", version=version)
+
+            raw = cards_path.read_bytes()
+            content_hash = hashlib.sha256(raw).hexdigest()
+            cache_path = get_cache_path(cards_path)
+
+            key = _cache_key(content_hash)
+            cards = _read_cache(cache_path, key) if use_cache else None
+            origin = "cache"
+            if cards is None:
+                cards = _parse_cards(json.loads(raw))
+                origin = "json"
+                if use_cache:
+                    _write_cache(cache_path, key, cards)
+
+            catalog = cls(cards, source=str(cards_path), version=version,
+                          content_hash=content_hash)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            logger.info(
+                f"Loaded {len(catalog)} cards from {cards_path} ({origin}) in {elapsed_ms:.1f} ms")
+            return catalog
+
+        except Exception as e:
+            logger.error(f"Error loading cards: {e}")
+            return cls(_create_default_cards(), source="<default>", version=version)
+
+
+def card_to_dict(card: Card) -> dict:
+    """A card definition as clients need it to show and target the card."""
+    target = card.target
+    return {
+        "id": card.id,
+        "name": card.name,
+        "type": card.type.value,
+        "description": card.description or "",
+        "organ_type": card.organ_type,
+        "target": {
+            "organ_type": target.organ_type,
+            "scope": target.scope,
+            "player_scope": target.player_scope,
+            "organ_scope": target.organ_scope,
+            "flexible": target.flexible
+        } if target else None,
+        "effects": [
+            {
+                "action": effect.action,
+                "target_organ": effect.target_organ,
+                "duration": effect.duration,
+                "value": effect.value
+            } for effect in card.effects
+        ]
+    }
+
+
+def get_cache_dir() -> Path:
+    """Directory for compiled catalogs: $ORGAN_ATTACK_CACHE_DIR, else the user's cache directory."""
+    configured = os.environ.get(CACHE_DIR_ENV)
+    if configured:
+        return Path(configured)
+    base = os.environ.get("XDG_CACHE_HOME") or os.environ.get("LOCALAPPDATA")
+    return (Path(base) if base else Path.home() / ".cache") / "organ-attack"
+
+
+def get_cache_path(cards_path: Path) -> Path:
+    """Location of the compiled cache for a cards file, unique to its path."""
+    path_hash = hashlib.sha256(str(cards_path.resolve()).encode()).hexdigest()[:12]
+    return get_cache_dir() / f"{cards_path.stem}-{path_hash}.cache"
+
+
+def compile_catalog(cards_file: Optional[str] = None) -> Path:
+    """Parse a cards file and write its compiled cache, e.g. to warm it at deploy time."""
+    cards_path = Path(cards_file) if cards_file else DEFAULT_CARDS_FILE
+    raw = cards_path.read_bytes()
+    cache_path = get_cache_path(cards_path)
+    _write_cache(cache_path, _cache_key(hashlib.sha256(raw).hexdigest()), _parse_cards(json.loads(raw)))
+    return cache_path
+
+
+def _cache_key(content_hash: str) -> str:
+    """What a cache must match to be used: the cards file's hash plus the code that built it."""
+    return f"{content_hash}:{_code_version()}"
+
+
+@functools.lru_cache(maxsize=None)
+def _code_version() -> str:
+    """Hash of the cached classes' field layout and of this module's source.
+
+    Changing either makes old caches stale without anyone bumping CACHE_FORMAT.
+    """
+    layout = [(cls.__qualname__, [(f.name, str(f.type)) for f in dataclasses.fields(cls)])
+              for cls in (Card, OrganCardDefinition, CardTarget, CardConditions, CardEffect)]
+    digest = hashlib.sha256(repr((CACHE_FORMAT, layout)).encode())
+    try:
+        digest.update(Path(__file__).read_bytes())
+    except OSError:
+        pass
+    return digest.hexdigest()[:16]
+
+
+def _card_to_row(card: Card) -> List[Any]:
+    """A card definition as a JSON row: organ flag, then field values in declaration order.
+
+    Rows are positional, which is what makes the cache cheaper than the cards
+    file; the field layout is part of the cache key, so old rows never misalign.
+    """
+    row: List[Any] = [isinstance(card, OrganCardDefinition)]
+    for field in dataclasses.fields(card):
+        value = getattr(card, field.name)
+        if field.name == "type":
+            value = value.value
+        elif field.name in ("target", "conditions"):
+            value = dataclasses.astuple(value) if value else None
+        elif field.name == "effects":
+            value = [dataclasses.astuple(effect) for effect in value]
+        row.append(value)
+    return row
+
+
+def _card_from_row(row: List[Any]) -> Card:
+    """Rebuild a card definition written by _card_to_row."""
+    is_organ, card_id, name, card_type, description, target, conditions, effects, *rest = row
+    card_class = OrganCardDefinition if is_organ else Card
+    return card_class(
+        card_id, name, CardType(card_type), description,
+        CardTarget(*target) if target else None,
+        CardConditions(*conditions) if conditions else None,
+        tuple(CardEffect(*effect) for effect in effects),
+        *rest
+    )
+
+
+def _read_cache(cache_path: Path, key: str) -> Optional[List[Card]]:
+    """Read cached cards if the cache was built from the same file contents and code.
+
+    The cache is plain JSON, so a tampered file can at worst give wrong cards,
+    never run code.
+    """
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = json.loads(f.read())
+        if cached.get("key") != key:
+            logger.info(f"Card cache {cache_path} is stale, reparsing cards")
+            return None
+        return [_card_from_row(row) for row in cached["cards"]]
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable card cache {cache_path}: {e}")
+        return None
+
+
+def _write_cache(cache_path: Path, key: str, cards: List[Card]):
+    """Atomically write the compiled cache; failures only cost the next boot a reparse."""
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"key": key, "cards": [_card_to_row(card) for card in cards]}, f,
+                      separators=(',', ':'))
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"Could not write card cache {cache_path}: {e}")
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def _build_organ_templates(organ_cards: Tuple[Card, ...]) -> Dict[OrganType, OrganTemplate]:
+    """Build an organ template for every OrganType, using card data where present."""
+    organ_defs = {card.organ_type: card for card in organ_cards}
+    templates = {}
+    for organ_type in OrganType:
+        card = organ_defs.get(organ_type.value)
+        templates[organ_type] = OrganTemplate(
+            organ_type=organ_type,
+            description=card.description if card else f"Essential {organ_type.value.lower()} organ.",
+            hit_points=card.hit_points if card else 1,
+            is_vital=organ_type in VITAL_ORGAN_TYPES,
+            can_be_protected=card.can_be_protected if card else True
+        )
+    return templates
+
+
+def _parse_cards(cards_data: Dict[str, Any]) -> List[Card]:
+    """Parse cards from JSON data."""
+    cards = []
+    for card_data in cards_data.get('cards', []):
+        try:
+            cards.append(_create_card_from_data(card_data))
+        except Exception as e:
+            logger.error(
+                f"Error parsing card {card_data.get('id', 'unknown')}: {e}")
+    return cards
+
+
+def _create_card_from_data(data: Dict[str, Any]) -> Card:
+    """Create a Card object from JSON data."""
+    target = None
+    if 'target' in data and data['target']:
+        target_data = data['target']
+        target = CardTarget(
+            organ_type=target_data.get('organ_type'),
+            scope=target_data.get('scope', 'Single'),
+            player_scope=target_data.get('player_scope', 'Other'),
+            organ_scope=target_data.get('organ_scope', 'Single'),
+            flexible=target_data.get('flexible', False)
+        )
+
+    conditions = None
+    if 'conditions' in data and data['conditions']:
+        cond_data = data['conditions']
+        conditions = CardConditions(
+            organ_must_be_present=cond_data.get(
+                'organ_must_be_present', False),
+            organ_must_not_be_protected=cond_data.get(
+                'organ_must_not_be_protected', False),
+            target_organ_must_be_present=cond_data.get(
+                'target_organ_must_be_present', False),
+            player_must_have_available_slot=cond_data.get(
+                'player_must_have_available_slot', False),
+            must_be_played_in_response_or_attack_phase=cond_data.get(
+                'must_be_played_in_response_or_attack_phase', False)
+        )
+
+    effects = []
+    for effect_data in data.get('effects', []):
+        effect = CardEffect(
+            action=effect_data['action'],
+            target_organ=effect_data.get('target_organ'),
+            duration=effect_data.get('duration', 'instant'),
+            value=effect_data.get('value'),
+            mimic_type=effect_data.get('mimic_type'),
+            from_target=effect_data.get('from'),
+            to_target=effect_data.get('to')
+        )
+        effects.append(effect)
+
+    card_type = CardType(data['type'])
+
+    if card_type == CardType.ORGAN:
+        return OrganCardDefinition(
+            id=data['id'],
+            name=data['name'],
+            type=card_type,
+            description=data['description'],
+            target=target,
+            conditions=conditions,
+            effects=tuple(effects),
+            organ_type=data.get('organ_type'),
+            is_vital=data.get('is_vital', False),
+            can_be_protected=data.get('can_be_protected', True),
+            hit_points=data.get('hit_points', 1)
+        )
+    else:
+        return Card(
+            id=data['id'],
+            name=data['name'],
+            type=card_type,
+            description=data['description'],
+            target=target,
+            conditions=conditions,
+            effects=tuple(effects),
+            organ_type=data.get('organ_type'),
+            is_vital=data.get('is_vital', False),
+            can_be_protected=data.get('can_be_protected', True)
+        )
+
+
+def _create_default_cards() -> List[Card]:
+    """Create a basic set of cards if JSON loading fails."""
+    logger.warning("Creating default card set")
+
+    basic_attacks = [
+        {
+            'id': 'attack_001',
+            'name': 'Heart Attack',
+            'type': 'Attack',
+            'description': 'Attack the heart organ.',
+            'target': {'organ_type': 'Heart'},
+            'effects': [{'action': 'remove_organ', 'target_organ': 'Heart'}]
+        },
+        {
+            'id': 'attack_002',
+            'name': 'Brain Freeze',
+            'type': 'Attack',
+            'description': 'Attack the brain organ.',
+            'target': {'organ_type': 'Brain'},
+            'effects': [{'action': 'remove_organ', 'target_organ': 'Brain'}]
+        }
+    ]
+
+    basic_defenses = [
+        {
+            'id': 'defense_001',
+            'name': 'Medical Kit',
+            'type': 'Defense',
+            'description': 'Block any attack.',
+            'effects': [{'action': 'block_attack'}]
+        }
+    ]
+
+    return _parse_cards({'cards': basic_attacks + basic_defenses})
+
+
+_catalog: Optional[CardCatalog] = None
+_catalog_lock = threading.Lock()
+
+
+def get_catalog() -> CardCatalog:
+    """Return the current process-wide catalog, loading it on first use."""
+    catalog = _catalog
+    if catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _set_catalog(CardCatalog.load())
+            catalog = _catalog
+    return catalog
+
+
+def reload_catalog(cards_file: Optional[str] = None) -> CardCatalog:
+    """Load a fresh catalog and swap it in for games created from now on.
+
+    Engines that already hold a reference keep using the catalog they
+    started with.
+    """
+    with _catalog_lock:
+        version = _catalog.version + 1 if _catalog else 1
+        _set_catalog(CardCatalog.load(cards_file, version=version))
+        return _catalog
+
+
+def _set_catalog(catalog: CardCatalog):
+    global _catalog
+    _catalog = catalog
+
+
+if __name__ == "__main__":
+    import sys
+
+    logging.basicConfig(level=logging.INFO)
+    path = compile_catalog(sys.argv[1] if len(sys.argv) > 1 else None)
+    print(f"Wrote compiled card catalog to {path}")
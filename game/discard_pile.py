@@ -0,0 +1,92 @@
+"""
+Discard pile for the Organ Attack card game.
+Keeps per-type indexes and counts so lookups and summaries don't scan the pile.
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from game.models import CardInstance, CardType
+
+
+class DiscardPile:
+    """Discard pile indexed by card type, in discard order."""
+
+    __slots__ = ('_cards', '_by_type')
+
+    def __init__(self, cards: Iterable[CardInstance] = ()):
+        self._cards: List[CardInstance] = []
+        self._by_type: Dict[CardType, List[CardInstance]] = {card_type: [] for card_type in CardType}
+        for card in cards:
+            self.append(card)
+
+    @classmethod
+    def from_groups(cls, cards: List[CardInstance],
+                    groups: Iterable[Tuple[CardType, List[CardInstance]]]) -> "DiscardPile":
+        """A pile from its cards in discard order and the same cards as groups() gives them.
+
+        Cheaper than adding the cards one by one; the two must agree.
+        """
+        pile = cls()
+        pile._cards = cards
+        for card_type, type_cards in groups:
+            pile._by_type[card_type] = type_cards
+        return pile
+
+    def append(self, card: CardInstance):
+        """Put a card on top of the pile."""
+        self._cards.append(card)
+        self._by_type[card.type].append(card)
+
+    def top(self) -> Optional[CardInstance]:
+        """The most recently discarded card."""
+        return self._cards[-1] if self._cards else None
+
+    def most_recent(self, card_type: CardType) -> Optional[CardInstance]:
+        """The most recently discarded card of a given type."""
+        cards = self._by_type[card_type]
+        return cards[-1] if cards else None
+
+    def count(self, card_type: CardType) -> int:
+        """Number of cards of a given type in the pile."""
+        return len(self._by_type[card_type])
+
+    def drain(self) -> List[CardInstance]:
+        """Remove and return every card in the pile, e.g. to reshuffle into the deck."""
+        cards = self._cards
+        self._cards = []
+        for type_cards in self._by_type.values():
+            type_cards.clear()
+        return cards
+
+    def clear(self):
+        """Remove every card from the pile."""
+        self.drain()
+
+    def copy(self) -> "DiscardPile":
+        """A pile holding the same cards, changed independently of this one."""
+        twin = DiscardPile()
+        twin._cards = self._cards.copy()
+        twin._by_type = {card_type: cards.copy() for card_type, cards in self._by_type.items()}
+        return twin
+
+    def groups(self) -> Iterator[Tuple[CardType, List[CardInstance]]]:
+        """(card type, cards of that type in discard order) for each type in the pile."""
+        return ((card_type, cards) for card_type, cards in self._by_type.items() if cards)
+
+    def summary(self) -> dict:
+        """Compact description of the pile for state updates."""
+        top = self.top()
+        return {
+            "size": len(self._cards),
+            "top": {"id": top.id, "instance_id": top.instance_id} if top else None,
+            "counts": {card_type.value: len(cards) for card_type, cards in self._by_type.items() if cards}
+        }
+
+    def __iter__(self) -> Iterator[CardInstance]:
+        return iter(self._cards)
+
+    def __len__(self) -> int:
+        return len(self._cards)
+
+    def __repr__(self) -> str:
+        return f"DiscardPile({self._cards!r})"
@@ -0,0 +1,303 @@
+"""
+Card effect handlers for the Organ Attack card game.
+Effects are looked up by action name in a registry and bound to cards once,
+when the card catalog loads.
+"""
+
+import logging
+import math
+from typing import Any, Callable, Dict, Tuple
+
+from game.models import Card, CardEffect, CardType
+
+logger = logging.getLogger(__name__)
+
+# Handlers are called as handler(processor, effect, card, player, target_player, target_organ)
+EffectHandler = Callable[..., Any]
+BoundEffect = Tuple[EffectHandler, CardEffect]
+
+_EFFECT_HANDLERS: Dict[str, EffectHandler] = {}
+
+_CARD_TYPES_BY_NAME = {card_type.value.lower(): card_type for card_type in CardType}
+
+
+class UnknownEffectError(ValueError):
+    """Raised when a card uses an effect action with no registered handler."""
+
+
+def effect_handler(action: str):
+    """Register a function as the handler for an effect action."""
+    def register(handler: EffectHandler) -> EffectHandler:
+        _EFFECT_HANDLERS[action] = handler
+        return handler
+    return register
+
+
+def get_effect_handler(action: str) -> EffectHandler:
+    """Look up the handler for an effect action."""
+    try:
+        return _EFFECT_HANDLERS[action]
+    except KeyError:
+        raise UnknownEffectError(f"Unknown effect action: {action}") from None
+
+
+def bind_effects(card: Card) -> Tuple[BoundEffect, ...]:
+    """Pair each of a card's effects with its handler."""
+    return tuple((get_effect_handler(effect.action), effect) for effect in card.effects)
+
+
+@effect_handler('remove_organ')
+def remove_organ(processor, effect: CardEffect, card, player, target_player=None, target_organ=None):
+    """Process organ damage effect. Reduces organ HP by 1."""
+    if not target_player or not target_organ:
+        return {'success': False, 'error': 'Missing target for organ removal'}
+
+    # Check if organ is protected
+    if target_player.is_organ_protected(target_organ):
+        return {'success': False, 'blocked': True, 'reason': 'Organ is protected'}
+
+    destroyed = target_player.damage_organ(target_organ)
+    return {
+        'success': True,
+        'action': 'remove_organ',
+        'target': target_organ,
+        'player': target_player.name,
+        'destroyed': destroyed
+    }
+
+
+@effect_handler('protect_organ')
+def protect_organ(processor, effect: CardEffect, card, player, target_player=None, target_organ=None):
+    """Process organ protection effect."""
+    target = target_player or player
+    organ_type = target_organ or effect.target_organ
+
+    if not organ_type:
+        return {'success': False, 'error': 'No target organ specified'}
+
+    protection_source = 'Vaccination' if card.name.lower() == 'vaccination' else f"Protected by {player.name}"
+
+    # Vaccination protection expires after 2 full rounds (num_players * 2 turns)
+    expires_at = None
+    if card.name.lower() == 'vaccination':
+        num_players = len(processor.game_engine.players)
+        expires_at = processor.game_engine.turn_count + (num_players * 2)
+
+    success = target.protect_organ(organ_type, protection_source, expires_at)
+    if success:
+        processor.game_engine.schedule_protection_expiry(target, organ_type)
+    return {
+        'success': success,
+        'action': 'protect_organ',
+        'target': organ_type,
+        'player': target.name,
+        'expires_at': expires_at
+    }
+
+
+@effect_handler('block_attack')
+def block_attack(processor, effect: CardEffect, card, player, target_player=None, target_organ=None):
+    """Process attack blocking effect. Sets the pending defense flag."""
+    game_engine = processor.game_engine
+    # Mark that this player has played a defense card
+    if game_engine.current_attack:
+        game_engine.current_attack['blocked'] = True
+        game_engine.current_attack['blocked_by'] = player.name
+    game_engine.pending_defense = False
+
+    return {
+        'success': True,
+        'action': 'block_attack',
+        'player': player.name
+    }
+
+
+@effect_handler('steal_organ')
+def steal_organ(processor, effect: CardEffect, card, player, target_player=None, target_organ=None):
+    """Process organ stealing effect. Removes organ from target, adds to player."""
+    if not target_player or not target_organ:
+        return {'success': False, 'error': 'Missing target for organ steal'}
+
+    # Check if target has the organ
+    if not target_player.has_organ(target_organ):
+        return {'success': False, 'error': f'{target_player.name} does not have {target_organ}'}
+
+    # Check if organ is protected
+    if target_player.is_organ_protected(target_organ):
+        return {'success': False, 'blocked': True, 'reason': 'Organ is protected'}
+
+    # Check if player already has this organ
+    if player.has_organ(target_organ):
+        return {'success': False, 'error': f'You already have a {target_organ}'}
+
+    # Move the organ across; the new owner gets it without the old protection
+    player.receive_organ(target_player.take_organ(target_organ))
+
+    return {
+        'success': True,
+        'action': 'steal_organ',
+        'target': target_organ,
+        'from_player': target_player.name,
+        'to_player': player.name
+    }
+
+
+@effect_handler('draw_cards')
+def draw_cards(processor, effect: CardEffect, card, player, target_player=None, target_organ=None):
+    """Process card drawing effect. If card target scope is 'All', all players draw."""
+    game_engine = processor.game_engine
+    draw_count = effect.value or 1
+    results = []
+
+    scope = card.target.player_scope if card and card.target else 'Self'
+
+    if scope == 'All':
+        for p in game_engine.players:
+            if p.status == 'eliminated':
+                continue
+            actual_count = 0
+            for _ in range(draw_count):
+                drawn = game_engine.draw_card_for_player(p)
+                if not drawn:
+                    break
+                actual_count += 1
+            results.append({
+                'success': True,
+                'action': 'draw_cards',
+                'count': actual_count,
+                'player': p.name
+            })
+    else:
+        actual_count = 0
+        for _ in range(draw_count):
+            card_drawn = game_engine.draw_card_for_player(player)
+            if not card_drawn:
+                break
+            actual_count += 1
+        results.append({
+            'success': True,
+            'action': 'draw_cards',
+            'count': actual_count,
+            'player': player.name
+        })
+
+    return results
+
+
+@effect_handler('skip_turn')
+def skip_turn(processor, effect: CardEffect, card, player, target_player=None, target_organ=None):
+    """Process turn skipping effect."""
+    if target_player:
+        target_player.skip_next_turn = True
+        return {
+            'success': True,
+            'action': 'skip_turn',
+            'player': target_player.name
+        }
+    return {'success': False, 'error': 'No target player for skip turn'}
+
+
+@effect_handler('test_luck')
+def test_luck(processor, effect: CardEffect, card, player, target_player=None, target_organ=None):
+    """Simulate a coin flip: heads does nothing, tails destroys the organ."""
+    coin = processor.game_engine.rng.choice(['heads', 'tails'])
+    logger.debug("Test luck: %s", coin)
+
+    result = {'success': True, 'action': 'test_luck', 'coin': coin}
+    if coin == 'tails' and target_player and target_organ:
+        # Check protection before destroying
+        if target_player.is_organ_protected(target_organ):
+            result['organ_destroyed'] = False
+            result['reason'] = 'Organ is protected'
+        else:
+            destroyed = target_player.damage_organ(target_organ)
+            result['organ_destroyed'] = destroyed
+            result['target_player'] = target_player.name
+            result['target_organ'] = target_organ
+    return result
+
+
+@effect_handler('extra_turn')
+def extra_turn(processor, effect: CardEffect, card, player, target_player=None, target_organ=None):
+    """Grant the player an extra turn after the current turn ends."""
+    # Mark the player to get an extra turn
+    player.can_draw_extra = True
+    return {
+        'success': True,
+        'action': 'extra_turn',
+        'player': player.name
+    }
+
+
+@effect_handler('mass_discard')
+def mass_discard(processor, effect: CardEffect, card, player, target_player=None, target_organ=None):
+    """All other players discard half their hand (rounded down)."""
+    game_engine = processor.game_engine
+    discarded = []
+    for other_player in game_engine.get_other_players(player):
+        discard_count = math.floor(len(other_player.hand) / 2)
+        for random_card in game_engine.rng.sample(list(other_player.hand), discard_count):
+            other_player.remove_card_from_hand(random_card)
+            game_engine.discard_pile.append(random_card)
+            discarded.append({
+                'player': other_player.name,
+                'card': random_card.name
+            })
+
+    return {
+        'success': True,
+        'action': 'mass_discard',
+        'discarded': discarded,
+        'player': player.name
+    }
+
+
+@effect_handler('mimic_card')
+def mimic_card(processor, effect: CardEffect, card, player, target_player=None, target_organ=None):
+    """Mimic another card's effect. Uses the mimic_type from the card effect."""
+    game_engine = processor.game_engine
+    if not effect.mimic_type:
+        return {'success': False, 'error': 'No mimic type specified'}
+
+    # Handle pipe-separated types (e.g., "Attack|Defense") — pick based on context
+    mimic_type = effect.mimic_type
+    if '|' in mimic_type:
+        options = [t.strip() for t in mimic_type.split('|')]
+        if game_engine.pending_defense and 'Defense' in options:
+            mimic_type = 'Defense'
+        elif 'Attack' in options:
+            mimic_type = 'Attack'
+        else:
+            mimic_type = options[0]
+
+    # Mimic the latest card of the specified type in the discard pile, or a virtual one
+    mimic_card = None
+    card_type = _CARD_TYPES_BY_NAME.get(mimic_type.lower())
+    if card_type:
+        mimic_card = game_engine.discard_pile.most_recent(card_type)
+
+    if not mimic_card:
+        # Create a basic virtual card of the requested type
+        if mimic_type.lower() == 'attack':
+            return remove_organ(
+                processor, CardEffect(action='remove_organ', target_organ=target_organ),
+                card, player, target_player, target_organ
+            )
+        elif mimic_type.lower() == 'defense':
+            return block_attack(processor, effect, card, player)
+        elif mimic_type.lower() == 'action':
+            return draw_cards(
+                processor, CardEffect(action='draw_cards', value=1), None, player
+            )
+        else:
+            return {'success': False, 'error': f'Cannot mimic {mimic_type}'}
+
+    # Process the mimicked card's effects
+    results = processor.process_card_effects(mimic_card, player, target_player, target_organ)
+    return {
+        'success': True,
+        'action': 'mimic_card',
+        'mimicked': mimic_card.name,
+        'effects': results,
+        'player': player.name
+    }
@@ -0,0 +1,142 @@
+"""
+Bounded game event log for the Organ Attack card game.
+Keeps the most recent events as compact tuples in a ring buffer, and can spill
+every event to an append-only file so older history can be paged back lazily.
+"""
+
+import json
+import sys
+from array import array
+from collections import deque
+from typing import Any, Dict, Iterator, List, Optional
+
+from game.models import GameEvent
+
+# Events kept in memory per game by default
+DEFAULT_CAPACITY = 256
+# One spill-file offset is indexed per this many events
+SPILL_INDEX_STRIDE = 64
+
+# Record layout: (seq, turn, event_type, player_name, card_played,
+#                 target_player, target_organ, success, details)
+SEQ = 0
+
+
+def _to_event(record: tuple) -> GameEvent:
+    seq, turn, event_type, player_name, card_played, target_player, target_organ, success, details = record
+    return GameEvent(event_type, player_name, card_played, target_player, target_organ, success,
+                     dict(details) if details else {}, seq=seq, turn=turn)
+
+
+class EventLog:
+    """Ring buffer of the last `capacity` events, numbered from 0.
+
+    With a spill_path every event is also appended to that file as a JSON
+    line, and events that have dropped out of memory are read back from it on
+    demand. Without one, they are gone.
+    """
+
+    __slots__ = ('capacity', 'spill_path', '_records', '_next_seq', '_spill', '_offsets')
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, spill_path: Optional[str] = None):
+        if capacity < 1:
+            raise ValueError("Event log capacity must be at least 1")
+        self.capacity = capacity
+        self.spill_path = spill_path
+        self._records: deque = deque(maxlen=capacity)
+        self._next_seq = 0
+        self._spill = None
+        # Byte offset of every SPILL_INDEX_STRIDE-th event in the spill file
+        self._offsets = array('Q')
+
+    def append(self, event_type: str, player_name: str, card_played: Optional[str] = None,
+               target_player: Optional[str] = None, target_organ: Optional[str] = None,
+               success: bool = True, details: Optional[Dict[str, Any]] = None, turn: int = 0) -> int:
+        """Record an event and return its sequence number."""
+        seq = self._next_seq
+        self._next_seq += 1
+        record = (seq, turn, sys.intern(event_type), player_name, card_played,
+                  target_player, target_organ, success, details or None)
+        self._records.append(record)
+        if self.spill_path is not None:
+            self._write_spill(record)
+        return seq
+
+    def _write_spill(self, record: tuple):
+        if self._spill is None:
+            self._spill = open(self.spill_path, 'a', encoding='utf-8')
+        if record[SEQ] % SPILL_INDEX_STRIDE == 0:
+            self._offsets.append(self._spill.tell())
+        self._spill.write(json.dumps(record, separators=(',', ':'), default=str) + '\n')
+
+    def __len__(self) -> int:
+        """Number of events ever recorded, including any no longer in memory."""
+        return self._next_seq
+
+    @property
+    def first_in_memory(self) -> int:
+        """Sequence number of the oldest event still held in memory."""
+        return self._records[0][SEQ] if self._records else self._next_seq
+
+    def __iter__(self) -> Iterator[GameEvent]:
+        """The events held in memory, oldest first."""
+        return map(_to_event, self._records)
+
+    def recent(self, count: Optional[int] = None) -> List[GameEvent]:
+        """The last `count` events in memory, oldest first; all of them by default."""
+        records = self._records
+        if count is not None and count < len(records):
+            records = list(records)[len(records) - count:]
+        return [_to_event(record) for record in records]
+
+    def events(self, start: int = 0, stop: Optional[int] = None) -> Iterator[GameEvent]:
+        """Events start..stop by sequence number, paging older ones back from the spill file.
+
+        Without a spill file, events that have left memory are skipped.
+        """
+        stop = self._next_seq if stop is None else min(stop, self._next_seq)
+        first = self.first_in_memory
+        if start < first and self.spill_path is not None:
+            yield from self._read_spill(start, min(stop, first))
+        for record in self._records:
+            if start <= record[SEQ] < stop:
+                yield _to_event(record)
+
+    def _read_spill(self, start: int, stop: int) -> Iterator[GameEvent]:
+        if self._spill is not None:
+            self._spill.flush()
+        block = start // SPILL_INDEX_STRIDE
+        if block >= len(self._offsets):
+            return
+        with open(self.spill_path, 'r', encoding='utf-8') as f:
+            f.seek(self._offsets[block])
+            for line in f:
+                record = json.loads(line)
+                seq = record[SEQ]
+                if seq >= stop:
+                    break
+                if seq >= start:
+                    yield _to_event(record)
+
+    def memory_bytes(self) -> int:
+        """Approximate memory held by the in-memory events and the spill index."""
+        size = sys.getsizeof(self._records) + sys.getsizeof(self._offsets)
+        for record in self._records:
+            size += sys.getsizeof(record)
+            details = record[-1]
+            if details:
+                size += sys.getsizeof(details)
+        return size
+
+    def fork(self) -> "EventLog":
+        """An in-memory copy that carries on numbering but never writes to the spill file."""
+        twin = EventLog(self.capacity)
+        twin._records.extend(self._records)
+        twin._next_seq = self._next_seq
+        return twin
+
+    def close(self):
+        """Close the spill file, if one is open. Appending reopens it."""
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
@@ -1,30 +1,59 @@
 import copy
+import itertools
 import logging
 import random
+import secrets
 from typing import Any, Dict, List, Optional
 
 from game.cards import CardEffectProcessor, CardManager
-from game.models import ActiveEffect, Card, GameEvent, GameState, TurnDirection
+from game.catalog import CardCatalog
+from game.discard_pile import DiscardPile
+from game.event_log import EventLog
+from game.models import (ActionType, ActiveEffect, CardInstance, GameAction,
+                         GameEvent, GameState, TurnDirection)
 from game.player import Player
+from game.protection import ProtectionSchedule
+from game.rules import MAX_CARDS_PER_TURN, legal_actions
+from game.snapshot import GameSnapshot, restore_snapshot, take_snapshot
 
 logger = logging.getLogger(__name__)
 
+HAND_SIZE = 5
+
+
+def new_seed() -> int:
+    """Pick a fresh game seed from the OS entropy pool."""
+    return secrets.randbits(64)
+
 
 class GameEngine:
-    def __init__(self, player_names: list[str]):
+    def __init__(self, player_names: list[str], seed: Optional[int] = None,
+                 catalog: Optional[CardCatalog] = None, event_log: Optional[EventLog] = None):
         self.player_names = player_names
         self.current_player_index = 0
-        self.players = [Player(name) for name in player_names]
+
+        # Every random decision in a game draws from this generator, so a seed replays it exactly
+        self.seed = seed if seed is not None else new_seed()
+        self.rng = random.Random(self.seed)
+
+        self.card_manager = CardManager(catalog)
+        self.players = [Player(name, rng=self.rng, catalog=self.card_manager.catalog) for name in player_names]
+        self._active_players: List[Player] = []
+        self._players_by_name: Dict[str, Player] = {}
+        self.sync_players()
         self.turn_direction = TurnDirection.CLOCKWISE
 
-        self.card_manager = CardManager()
         self.effect_processor = CardEffectProcessor(self)
 
-        self.deck: List[Card] = []
-        self.discard_pile: List[Card] = []
+        self.deck: List[CardInstance] = []
+        # Every card instance in the game, indexed by instance id
+        self.card_instances: List[Optional[CardInstance]] = [None]
+        self.discard_pile = DiscardPile()
+
+        self.protections = ProtectionSchedule()
 
         self.active_effects: List[ActiveEffect] = []
-        self.game_events: List[GameEvent] = []
+        self.event_log = event_log if event_log is not None else EventLog()
         self.turn_count: int = 0
         self.winner: Optional[Player] = None
 
@@ -34,9 +63,14 @@ class GameEngine:
         self.save_manager = None
         self.game_state = GameState.PLAY
 
+        # Bumped by every apply() and restore(); caches keyed on it go stale with the state
+        self.state_version: int = 0
+        # (state_version, moves, wire form) for the current player
+        self._legal_moves: Optional[tuple] = None
+
         self._initialize_game()
 
-    def _draw_card(self) -> Optional[Card]:
+    def _draw_card(self) -> Optional[CardInstance]:
         """Draw a card from the deck."""
         if not self.deck:
             self._reshuffle_deck()
@@ -48,10 +82,9 @@ class GameEngine:
     def _reshuffle_deck(self):
         """Reshuffle discard pile into deck when deck is empty."""
         if self.discard_pile:
-            logger.info("Reshuffling discard pile into deck")
-            self.deck = self.discard_pile.copy()
-            self.discard_pile.clear()
-            random.shuffle(self.deck)
+            logger.debug("Reshuffling discard pile into deck")
+            self.deck = self.discard_pile.drain()
+            self.rng.shuffle(self.deck)
 
     def get_current_player(self) -> Player:
         return self.players[self.current_player_index]
@@ -60,24 +93,47 @@ class GameEngine:
         """Return a list of all players except the current player."""
         return [p for p in self.players if p != current_player]
 
+    def get_player(self, name: Optional[str]) -> Optional[Player]:
+        """Look up a player by name."""
+        return self._players_by_name.get(name)
+
     def get_active_players(self):
         """Return a list of all players who are not eliminated."""
-        return [p for p in self.players if not p.is_eliminated()]
+        return list(self._active_players)
+
+    def sync_players(self):
+        """Rebuild the active-player list and elimination hooks.
+
+        Needed whenever players are replaced or their status is set directly.
+        """
+        self._active_players = [p for p in self.players if not p.is_eliminated()]
+        self._players_by_name = {p.name: p for p in self.players}
+        for player in self.players:
+            player.on_eliminated = self._on_player_eliminated
+
+    def _on_player_eliminated(self, player: Player):
+        """Drop a newly eliminated player from the active list."""
+        self._active_players = [p for p in self._active_players if p is not player]
+
+    def schedule_protection_expiry(self, player: Player, organ_type: str):
+        """Register a freshly applied protection so it lapses on time."""
+        self.protections.register(player, organ_type, self.turn_count)
+
+    def expire_protections(self) -> int:
+        """Strip protections that lapse at the end of the current turn."""
+        return self.protections.expire_due(self.turn_count)
 
     def _log_event(self, event_type: str, player_name: str, card_played: Optional[str] = None,
                    target_player: Optional[str] = None, target_organ: Optional[str] = None,
                    success: bool = True, details: Optional[Dict[str, Any]] = None):
         """Log a game event."""
-        event = GameEvent(
-            event_type=event_type,
-            player_name=player_name,
-            card_played=card_played,
-            target_player=target_player,
-            target_organ=target_organ,
-            success=success,
-            details=details or {}
-        )
-        self.game_events.append(event)
+        self.event_log.append(event_type, player_name, card_played, target_player, target_organ,
+                              success, details, turn=self.turn_count)
+
+    @property
+    def game_events(self) -> List[GameEvent]:
+        """The events still held in memory, oldest first."""
+        return self.event_log.recent()
 
     def _initialize_game(self):
         """Initialize the game with cards and starting hands."""
@@ -85,13 +141,16 @@ class GameEngine:
 
         all_cards = self.card_manager.get_all_non_organ_cards()
 
-        # Create DEEP COPIES of each card to avoid shared references
+        # Each copy is a lightweight instance pointing at the shared card definition
+        instance_ids = itertools.count(1)
         for card in all_cards:
             copies = 5 if card.type.value in ['Attack', 'Defense'] else 2
             for _ in range(copies):
-                self.deck.append(copy.deepcopy(card))
+                instance = CardInstance(next(instance_ids), card)
+                self.card_instances.append(instance)
+                self.deck.append(instance)
 
-        random.shuffle(self.deck)
+        self.rng.shuffle(self.deck)
         logger.info(f"Deck created with {len(self.deck)} cards")
 
         # Deal starting hands (5 cards each)
@@ -101,7 +160,7 @@ class GameEngine:
                 if card:
                     player.add_card_to_hand(card)
 
-        self.current_player_index = random.randint(0, len(self.players) - 1)
+        self.current_player_index = self.rng.randint(0, len(self.players) - 1)
         logger.info(f"Starting player: {self.get_current_player().name}")
 
         self.game_state = GameState.PLAY
@@ -111,7 +170,7 @@ class GameEngine:
             'starting_player': self.get_current_player().name
         })
 
-    def draw_card_for_player(self, player: Player) -> Optional[Card]:
+    def draw_card_for_player(self, player: Player) -> Optional[CardInstance]:
         """Draw a card for a specific player."""
         card = self._draw_card()
         if card:
@@ -123,46 +182,309 @@ class GameEngine:
         """Check if the game is over."""
         if self.game_state == GameState.DONE:
             return True
-        active = self.get_active_players()
-        return len(active) <= 1
+        return len(self._active_players) <= 1
+
+    def apply(self, action: GameAction) -> dict:
+        """Apply a player action and return its result.
+
+        This is the single entry point for turn logic, shared by the server,
+        the local GUI and headless simulations. It does no I/O.
+        """
+        player = self._players_by_name.get(action.player)
+        if player is None:
+            return {"success": False, "error": "Player not found in game"}
+        if player is not self.get_current_player() and action.type not in self._OUT_OF_TURN_ACTIONS:
+            return {"success": False, "error": f"It is {self.get_current_player().name}'s turn"}
+        result = self._ACTION_HANDLERS[action.type](self, player, action)
+        success = result.get("success", False)
+        self.event_log.append(
+            action.type.value, player.name,
+            result.get("card_played") or result.get("card_discarded") or result.get("card_drawn"),
+            action.target_player, action.target_organ, success,
+            None if success else {"error": result.get("error")}, turn=self.turn_count
+        )
+        self.state_version += 1
+        return result
+
+    def legal_moves(self, player: Optional[Player] = None) -> List[GameAction]:
+        """Every distinct move open to a player, the current one by default.
+
+        The current player's moves are cached until the state version changes;
+        callers must not modify the returned list.
+        """
+        current = self.get_current_player()
+        if player is not None and player is not current:
+            return legal_actions(self, player)
+        return self._cached_legal_moves()[1]
+
+    def legal_move_set(self) -> dict:
+        """The current player's legal plays in wire form.
+
+        "moves" maps each playable card id to its [target player, target organ]
+        pairs; cards in hand that are missing from it can only be discarded.
+        """
+        version, actions, wire = self._cached_legal_moves()
+        if wire is None:
+            player = self.get_current_player()
+            moves: Dict[str, List[List[Optional[str]]]] = {}
+            for action in actions:
+                if action.type == ActionType.PLAY_CARD:
+                    card = player.hand.get(action.instance_id)
+                    moves.setdefault(card.id, []).append([action.target_player, action.target_organ])
+            wire = {"version": version, "player": player.name, "moves": moves}
+            self._legal_moves = (version, actions, wire)
+        return wire
+
+    def _cached_legal_moves(self) -> tuple:
+        cached = self._legal_moves
+        if cached is None or cached[0] != self.state_version:
+            cached = (self.state_version, legal_actions(self, self.get_current_player()), None)
+            self._legal_moves = cached
+        return cached
+
+    def _apply_draw_card(self, player: Player, action: GameAction) -> dict:
+        """Draw one card for the player."""
+        if self.game_state != GameState.PLAY:
+            return {"success": False, "error": "Not in play phase"}
+
+        card = self.draw_card_for_player(player)
+        if card:
+            return {"success": True, "card_drawn": card.name}
+        return {"success": False, "error": "No cards to draw"}
+
+    def _apply_play_card(self, player: Player, action: GameAction) -> dict:
+        """Play a card from the player's hand. Max 2 cards per turn."""
+        if self.game_state != GameState.PLAY:
+            return {"success": False, "error": "Not in play phase"}
+
+        if player.cards_played_this_turn >= MAX_CARDS_PER_TURN:
+            return {"success": False, "error": "Already played 2 cards this turn"}
+
+        card = player.hand.get(action.instance_id)
+        if not card:
+            return {"success": False, "error": "Card not in hand"}
+
+        # Validate card conditions
+        valid, reason = self.card_manager.validate_card_play(card, player, self)
+        if not valid:
+            return {"success": False, "error": reason}
+
+        target_player = self._players_by_name.get(action.target_player)
+        target_organ = action.target_organ
+
+        # Validate target_organ_must_be_present condition
+        conditions = card.conditions
+        if conditions and target_player and target_organ:
+            if conditions.target_organ_must_be_present and not target_player.has_organ(target_organ):
+                return {"success": False, "error": f"{target_player.name} does not have {target_organ}"}
+
+            # Attacks are otherwise checked for protection in the effect processor
+            if conditions.organ_must_not_be_protected and target_player.is_organ_protected(target_organ):
+                return {"success": False, "error": f"{target_organ} is protected"}
+
+        player.remove_card_from_hand(card)
+        results = self.effect_processor.process_card_effects(
+            card, player, target_player, target_organ
+        )
+        self.discard_pile.append(card)
+        player.cards_played_this_turn += 1
+
+        return {
+            "success": True,
+            "card_played": card.name,
+            "cards_remaining": MAX_CARDS_PER_TURN - player.cards_played_this_turn,
+            "effects": results
+        }
+
+    def _apply_discard_card(self, player: Player, action: GameAction) -> dict:
+        """Discard a card without playing it. Counts toward the 2-card limit."""
+        if self.game_state != GameState.PLAY:
+            return {"success": False, "error": "Not in play phase"}
+
+        if player.cards_played_this_turn >= MAX_CARDS_PER_TURN:
+            return {"success": False, "error": "Already played 2 cards this turn"}
+
+        card = player.hand.get(action.instance_id)
+        if not card:
+            return {"success": False, "error": "Card not in hand"}
+
+        player.remove_card_from_hand(card)
+        self.discard_pile.append(card)
+        player.cards_played_this_turn += 1
+
+        return {
+            "success": True,
+            "card_discarded": card.name,
+            "cards_remaining": MAX_CARDS_PER_TURN - player.cards_played_this_turn
+        }
+
+    def _apply_block_attack(self, player: Player, action: GameAction) -> dict:
+        """Block the attack currently in progress, if any."""
+        if self.current_attack:
+            self.current_attack['blocked'] = True
+            self.current_attack['blocked_by'] = player.name
+            return {"success": True, "blocked_by": player.name}
+        return {"success": False, "error": "No attack to block"}
+
+    def _apply_end_turn(self, player: Player, action: GameAction) -> dict:
+        """End the current turn and hand play to the next eligible player."""
+        # Remove non-permanent protections and expired Vaccination protections
+        self.expire_protections()
+
+        # Check if current player has an extra turn (Caffeine Rush)
+        current_player = self.get_current_player()
+        if current_player.can_draw_extra:
+            # Grant extra turn: replenish hand, reset counters, stay on same player
+            current_player.can_draw_extra = False
+            self._refill_hand(current_player)
+            current_player.reset_turn_counters()
+            self.turn_count += 1
+            return {
+                "success": True,
+                "game_over": False,
+                "extra_turn": True,
+                "current_player": current_player.name,
+                "hand_size": len(current_player.hand)
+            }
+
+        # Check for game end
+        if len(self._active_players) <= 1:
+            self.game_state = GameState.DONE
+            self.winner = self._active_players[0] if self._active_players else None
+            return {
+                "success": True,
+                "game_over": True,
+                "winner": self.winner.name if self.winner else None
+            }
+
+        # Advance to next non-eliminated player, skipping those with skip_next_turn
+        num_players = len(self.players)
+        for _ in range(num_players):
+            self.current_player_index = (self.current_player_index + 1) % num_players
+            next_player = self.get_current_player()
+            if next_player.is_eliminated():
+                continue
+            if next_player.skip_next_turn:
+                next_player.skip_next_turn = False
+                continue
+            break
+
+        # Replenish hand to 5 cards for the new current player
+        current_player = self.get_current_player()
+        cards_drawn = self._refill_hand(current_player)
+        current_player.reset_turn_counters()
+
+        self.game_state = GameState.PLAY
+        self.turn_count += 1
+
+        return {
+            "success": True,
+            "game_over": False,
+            "current_player": current_player.name,
+            "cards_drawn": cards_drawn,
+            "hand_size": len(current_player.hand)
+        }
+
+    def _refill_hand(self, player: Player) -> int:
+        """Draw until the player holds a full hand or the cards run out."""
+        cards_drawn = 0
+        while len(player.hand) < HAND_SIZE:
+            if not self.draw_card_for_player(player):
+                break
+            cards_drawn += 1
+        return cards_drawn
+
+    # Responses the defender makes during someone else's turn
+    _OUT_OF_TURN_ACTIONS = frozenset({ActionType.BLOCK_ATTACK})
+
+    _ACTION_HANDLERS = {
+        ActionType.DRAW_CARD: _apply_draw_card,
+        ActionType.PLAY_CARD: _apply_play_card,
+        ActionType.DISCARD_CARD: _apply_discard_card,
+        ActionType.BLOCK_ATTACK: _apply_block_attack,
+        ActionType.END_TURN: _apply_end_turn,
+    }
+
+    def snapshot(self, include_rng: bool = True) -> GameSnapshot:
+        """Capture the game's mutable state in a compact, immutable form."""
+        return take_snapshot(self, include_rng)
+
+    def restore(self, snapshot: GameSnapshot):
+        """Return the game to a state captured by snapshot()."""
+        restore_snapshot(self, snapshot)
+        self.state_version += 1
+
+    def clone(self, rng: Optional[random.Random] = None) -> "GameEngine":
+        """Independent copy of the game for search and what-if play.
+
+        Only mutable state is copied; the catalog, card definitions and card
+        instances are immutable and shared with the original. The copy continues
+        the original's random stream unless given its own rng, which is cheaper
+        and what rollouts want anyway.
+        """
+        twin = copy.copy(self)
+        if rng is None:
+            rng = random.Random(0)
+            rng.setstate(self.rng.getstate())
+        twin.rng = rng
+        twin.players = [player.copy(rng) for player in self.players]
+        if self.winner is not None:
+            twin.winner = twin.players[self.players.index(self.winner)]
+        twin.deck = list(self.deck)
+        twin.discard_pile = self.discard_pile.copy()
+        twin.current_attack = dict(self.current_attack) if self.current_attack else None
+        twin.protections = ProtectionSchedule()
+        twin.protections.restore(self.protections.snapshot(self.players), twin.players)
+        twin.effect_processor = CardEffectProcessor(twin)
+        twin.active_effects = list(self.active_effects)
+        twin.event_log = self.event_log.fork()
+        twin._legal_moves = None
+        twin.sync_players()
+        return twin
 
     def to_dict(self) -> dict:
-        """Convert game state to dictionary for network transmission."""
+        """Convert game state to dictionary for network transmission.
+
+        This is the full state, every hand included. Players of an online game
+        get public_dict() plus their own private_dict() instead.
+        """
+        data = self._state_dict(include_hands=True)
+        data["legal_moves"] = self.legal_move_set() if not self.is_game_over() else None
+        return data
+
+    def public_dict(self) -> dict:
+        """The state every player may see: hands are given only as card counts."""
+        return self._state_dict(include_hands=False)
+
+    def private_dict(self, player_name: str) -> dict:
+        """What only the named player may see: their seat, hand and, on their turn, legal moves."""
+        player = self._players_by_name[player_name]
+        mine = player is self.get_current_player() and not self.is_game_over()
+        return {
+            "seat": self.players.index(player),
+            "hand": player.hand_to_list(),
+            "legal_moves": self.legal_move_set() if mine else None
+        }
+
+    def _state_dict(self, include_hands: bool) -> dict:
         players_data = []
         for p in self.players:
             try:
-                players_data.append(p.to_dict())
+                players_data.append(p.to_dict(include_hand=include_hands))
             except Exception as e:
                 logger.error(f"Error serializing player {p.name}: {e}")
                 players_data.append({
                     "name": p.name,
                     "organs": {},
-                    "hand": [],
+                    "hand_size": 0,
                     "status": p.status.value,
                     "cards_played_this_turn": 0,
                     "cards_drawn_this_turn": 0,
                     "can_draw_extra": False,
                     "skip_next_turn": False
                 })
-
-        discard_data = []
-        for card in self.discard_pile:
-            try:
-                discard_data.append({
-                    "id": card.id,
-                    "name": card.name,
-                    "type": card.type.value if card.type else "Unknown",
-                    "description": card.description or "",
-                    "organ_type": card.organ_type
-                })
-            except Exception:
-                discard_data.append({
-                    "id": getattr(card, 'id', '?'),
-                    "name": getattr(card, 'name', '?'),
-                    "type": "Unknown",
-                    "description": "",
-                    "organ_type": None
-                })
+                if include_hands:
+                    players_data[-1]["hand"] = []
 
         return {
             "player_names": self.player_names,
@@ -172,18 +494,22 @@ class GameEngine:
             "turn_count": self.turn_count,
             "game_state": self.game_state.value,
             "deck_size": len(self.deck),
-            "discard_pile": discard_data
+            "discard_summary": self.discard_pile.summary(),
+            # Cards are sent by id; clients fetch the catalog with this etag to show them
+            "catalog": self.card_manager.catalog.etag,
+            "state_version": self.state_version
         }
 
     @classmethod
-    def from_dict(cls, data: dict) -> "GameEngine":
+    def from_dict(cls, data: dict, catalog: Optional[CardCatalog] = None) -> "GameEngine":
         """Create game engine from dictionary. Used for client-side rendering."""
         player_names = data.get("player_names", [])
-        engine = cls(player_names)
+        engine = cls(player_names, catalog=catalog)
 
         engine.current_player_index = data.get("current_player_index", 0)
         engine.turn_direction = TurnDirection(data.get("turn_direction", 1))
         engine.turn_count = data.get("turn_count", 0)
+        engine.state_version = data.get("state_version", 0)
 
         gs = data.get("game_state", 1)
         try:
@@ -194,15 +520,18 @@ class GameEngine:
         # Restore players from dict
         engine.players = []
         for p_data in data.get("players", []):
-            player = Player.from_dict(p_data)
+            player = Player.from_dict(p_data, engine.card_manager.catalog)
+            player.rng = engine.rng
             engine.players.append(player)
+        engine.sync_players()
 
         # Rebuild deck (deck is not transmitted, just rebuild from card manager)
         engine.deck = []
-        engine.discard_pile = []
+        engine.discard_pile = DiscardPile()
 
+        engine.protections.rebuild(engine.players, engine.turn_count)
         engine.active_effects = []
-        engine.game_events = []
+        engine.event_log = EventLog()
         engine.winner = None
         engine.current_attack = None
         engine.pending_defense = False
@@ -0,0 +1,64 @@
+"""
+Hand container for the Organ Attack card game.
+Stores a player's cards keyed by card instance id for constant-time lookups.
+"""
+
+from typing import Dict, Iterable, Iterator, Optional, Union
+
+from game.models import CardInstance
+
+
+class Hand:
+    """A player's hand, indexed by card instance id and kept in draw order."""
+
+    __slots__ = ('_cards',)
+
+    def __init__(self, cards: Iterable[CardInstance] = ()):
+        self._cards: Dict[int, CardInstance] = {card.instance_id: card for card in cards}
+
+    def add(self, card: CardInstance):
+        """Add a card to the end of the hand."""
+        self._cards[card.instance_id] = card
+
+    def get(self, instance_id: int) -> Optional[CardInstance]:
+        """Get a card by its instance id."""
+        return self._cards.get(instance_id)
+
+    def find(self, card_id: str) -> Optional[CardInstance]:
+        """Get the first card in hand with the given definition id."""
+        for card in self._cards.values():
+            if card.id == card_id:
+                return card
+        return None
+
+    def remove(self, card: Union[CardInstance, int]) -> Optional[CardInstance]:
+        """Remove a card (or instance id) from the hand, returning it if it was there."""
+        instance_id = card if isinstance(card, int) else card.instance_id
+        return self._cards.pop(instance_id, None)
+
+    def ids(self) -> Iterable[int]:
+        """Instance ids of the cards in hand, in draw order."""
+        return self._cards.keys()
+
+    def clear(self):
+        """Remove every card from the hand."""
+        self._cards.clear()
+
+    def copy(self) -> "Hand":
+        """A hand holding the same cards, changed independently of this one."""
+        twin = Hand()
+        twin._cards = self._cards.copy()
+        return twin
+
+    def __contains__(self, card: object) -> bool:
+        instance_id = getattr(card, 'instance_id', None)
+        return instance_id is not None and self._cards.get(instance_id) is card
+
+    def __iter__(self) -> Iterator[CardInstance]:
+        return iter(self._cards.values())
+
+    def __len__(self) -> int:
+        return len(self._cards)
+
+    def __repr__(self) -> str:
+        return f"Hand({list(self._cards.values())!r})"
@@ -0,0 +1,184 @@
+"""
+Action journal and replay for the Organ Attack card game.
+A game is its seed plus the ordered list of accepted actions; the journal
+stores those as fixed-size binary records, and the replayer rebuilds any
+position from them, with snapshot checkpoints for fast seeking. Records
+refer to cards by id, so a journal only replays against the card catalog it
+was written with; the header carries that catalog's identity.
+"""
+
+import json
+import struct
+from typing import BinaryIO, Iterator, List, Optional, Sequence, Tuple
+
+from game.catalog import CardCatalog, get_catalog
+from game.game_engine import GameEngine
+from game.models import ActionType, GameAction, OrganType
+from game.snapshot import GameSnapshot
+
+JOURNAL_VERSION = 2
+
+# type, seat, instance id (0 for none), target seat and target organ (-1 for none)
+RECORD = struct.Struct('<BBHbb')
+
+ACTION_TYPES = list(ActionType)
+ORGAN_TYPES = [organ_type.value for organ_type in OrganType]
+_ACTION_CODES = {action_type: i for i, action_type in enumerate(ACTION_TYPES)}
+_ORGAN_CODES = {organ_type: i for i, organ_type in enumerate(ORGAN_TYPES)}
+
+# Actions between replay checkpoints
+CHECKPOINT_INTERVAL = 64
+
+
+class ActionJournal:
+    """Append-only record of a game: its seed, its players and every accepted action.
+
+    With a path, the header and each record are written to that file as they
+    happen, so a crashed server can rebuild the game with load() and replay().
+    catalog_id is the identity of the card catalog the game is played with;
+    it defaults to the current process-wide catalog's.
+    """
+
+    def __init__(self, seed: int, player_names: Sequence[str], path: Optional[str] = None,
+                 catalog_id: Optional[str] = None):
+        self.seed = seed
+        self.player_names = list(player_names)
+        self.catalog_id = catalog_id if catalog_id is not None else get_catalog().identity
+        self._seats = {name: seat for seat, name in enumerate(self.player_names)}
+        self._records = bytearray()
+        self.path = path
+        self._file: Optional[BinaryIO] = None
+        if path is not None:
+            self._file = open(path, 'wb')
+            self._file.write(self._header())
+            self._file.flush()
+
+    def _header(self) -> bytes:
+        header = {"version": JOURNAL_VERSION, "seed": self.seed, "players": self.player_names,
+                  "catalog": self.catalog_id}
+        return json.dumps(header, separators=(',', ':')).encode() + b'\n'
+
+    def record(self, action: GameAction):
+        """Append an accepted action."""
+        seat = self._seats.get(action.target_player, -1)
+        organ = _ORGAN_CODES.get(action.target_organ, -1)
+        data = RECORD.pack(_ACTION_CODES[action.type], self._seats[action.player],
+                           action.instance_id or 0, seat, organ)
+        self._records += data
+        if self._file is not None:
+            self._file.write(data)
+            self._file.flush()
+
+    def __len__(self) -> int:
+        return len(self._records) // RECORD.size
+
+    def __getitem__(self, index: int) -> GameAction:
+        if index < 0:
+            index += len(self)
+        return self._decode(RECORD.unpack_from(self._records, index * RECORD.size))
+
+    def __iter__(self) -> Iterator[GameAction]:
+        return map(self._decode, RECORD.iter_unpack(self._records))
+
+    def _decode(self, fields: Tuple[int, int, int, int, int]) -> GameAction:
+        action_code, seat, instance_id, target_seat, organ = fields
+        return GameAction(
+            ACTION_TYPES[action_code],
+            self.player_names[seat],
+            instance_id or None,
+            self.player_names[target_seat] if target_seat >= 0 else None,
+            ORGAN_TYPES[organ] if organ >= 0 else None,
+        )
+
+    def to_bytes(self) -> bytes:
+        """The journal in its file format: a JSON header line, then the records."""
+        return self._header() + bytes(self._records)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "ActionJournal":
+        header_line, _, records = data.partition(b'\n')
+        header = json.loads(header_line)
+        if header.get("version") != JOURNAL_VERSION:
+            raise ValueError(f"Unsupported journal version: {header.get('version')}")
+        journal = cls(header["seed"], header["players"], catalog_id=header["catalog"])
+        # A crash can leave a partly written last record
+        journal._records = bytearray(records[:len(records) - len(records) % RECORD.size])
+        return journal
+
+    def save(self, path: str):
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> "ActionJournal":
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+    def close(self):
+        """Close the journal file, if any. Later records are kept in memory only."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class Replayer:
+    """Steps a fresh engine through a journal, forwards or to any point.
+
+    A snapshot is kept every CHECKPOINT_INTERVAL actions, so seeking
+    backwards restores the nearest checkpoint and replays only the rest.
+    Raises ValueError if the catalog (the current one by default) is not the
+    one the journal was written with, as the replay would be a different game.
+    """
+
+    def __init__(self, journal: ActionJournal, catalog: Optional[CardCatalog] = None):
+        catalog = catalog if catalog is not None else get_catalog()
+        if catalog.identity != journal.catalog_id:
+            raise ValueError(f"Journal was written with card catalog {journal.catalog_id}, "
+                             f"not the loaded {catalog.identity}")
+        self.journal = journal
+        self.engine = GameEngine(journal.player_names, seed=journal.seed, catalog=catalog)
+        self.position = 0
+        # (position, turn, snapshot), in position order
+        self._checkpoints: List[Tuple[int, int, GameSnapshot]] = [(0, 0, self.engine.snapshot())]
+
+    def step(self) -> Optional[dict]:
+        """Apply the next action and return its result, or None at the end of the journal."""
+        if self.position >= len(self.journal):
+            return None
+        result = self.engine.apply(self.journal[self.position])
+        self.position += 1
+        if self.position % CHECKPOINT_INTERVAL == 0 and self.position > self._checkpoints[-1][0]:
+            self._checkpoints.append((self.position, self.engine.turn_count, self.engine.snapshot()))
+        return result
+
+    def seek(self, position: int) -> GameEngine:
+        """Move to just after the first `position` actions."""
+        position = max(0, min(position, len(self.journal)))
+        if position < self.position:
+            index = min(position // CHECKPOINT_INTERVAL, len(self._checkpoints) - 1)
+            checkpoint = self._checkpoints[index]
+            self.engine.restore(checkpoint[2])
+            self.position = checkpoint[0]
+        while self.position < position:
+            self.step()
+        return self.engine
+
+    def seek_turn(self, turn: int) -> GameEngine:
+        """Move to the start of the given turn, or to the end of the journal if it never got there."""
+        if self.engine.turn_count >= turn:
+            earlier = [cp for cp in self._checkpoints if cp[1] < turn] or self._checkpoints[:1]
+            position, _, snapshot = earlier[-1]
+            self.engine.restore(snapshot)
+            self.position = position
+        while self.engine.turn_count < turn and self.step() is not None:
+            pass
+        return self.engine
+
+
+def replay(journal: ActionJournal, turn: Optional[int] = None,
+           catalog: Optional[CardCatalog] = None) -> GameEngine:
+    """Rebuild a game from its journal: the final position, or the start of a given turn."""
+    replayer = Replayer(journal, catalog)
+    if turn is None:
+        return replayer.seek(len(journal))
+    return replayer.seek_turn(turn)
@@ -5,7 +5,7 @@ Defines the fundamental data structures using dataclasses and enums.
 
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional, Tuple
 
 
 class CardType(Enum):
@@ -52,7 +52,13 @@ class OrganType(Enum):
     ESOPHAGUS = "Esophagus"
 
 
-@dataclass
+VITAL_ORGAN_TYPES = (
+    OrganType.HEART, OrganType.BRAIN, OrganType.LIVER,
+    OrganType.KIDNEYS, OrganType.LUNGS, OrganType.STOMACH
+)
+
+
+@dataclass(frozen=True)
 class CardTarget:
     """Defines targeting information for a card."""
     organ_type: Optional[str] = None
@@ -62,7 +68,7 @@ class CardTarget:
     flexible: bool = False
 
 
-@dataclass
+@dataclass(frozen=True)
 class CardConditions:
     """Defines conditions that must be met for a card to be played."""
     organ_must_be_present: bool = False
@@ -72,7 +78,7 @@ class CardConditions:
     must_be_played_in_response_or_attack_phase: bool = False
 
 
-@dataclass
+@dataclass(frozen=True)
 class CardEffect:
     """Defines an effect that a card can have when played."""
     action: str
@@ -84,24 +90,86 @@ class CardEffect:
     to_target: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class Card:
-    """Base card class with all common attributes."""
+    """Base card class with all common attributes.
+
+    Definitions are shared by every game in the process, so they are frozen.
+    """
     id: str
     name: str
     type: CardType
     description: str
     target: Optional[CardTarget] = None
     conditions: Optional[CardConditions] = None
-    effects: List[CardEffect] = field(default_factory=list)
+    effects: Tuple[CardEffect, ...] = ()
     organ_type: Optional[str] = None
     is_vital: bool = False
     can_be_protected: bool = True
 
 
+@dataclass(frozen=True)
+class OrganCardDefinition(Card):
+    """Catalog definition of an organ card; organs in play are OrganCards built from it."""
+    hit_points: int = 1
+
+
+@dataclass(frozen=True, eq=False, slots=True)
+class CardInstance:
+    """A single physical copy of a card in a deck, hand or discard pile.
+
+    The definition is shared by every copy of the same card; only the
+    instance id is unique, so copies are compared by identity.
+    """
+    instance_id: int
+    definition: Card
+
+    @property
+    def id(self) -> str:
+        return self.definition.id
+
+    @property
+    def name(self) -> str:
+        return self.definition.name
+
+    @property
+    def type(self) -> CardType:
+        return self.definition.type
+
+    @property
+    def description(self) -> str:
+        return self.definition.description
+
+    @property
+    def target(self) -> Optional[CardTarget]:
+        return self.definition.target
+
+    @property
+    def conditions(self) -> Optional[CardConditions]:
+        return self.definition.conditions
+
+    @property
+    def effects(self) -> Tuple[CardEffect, ...]:
+        return self.definition.effects
+
+    @property
+    def organ_type(self) -> Optional[str]:
+        return self.definition.organ_type
+
+
 @dataclass
-class OrganCard(Card):
-    """Represents an organ card with protection status."""
+class OrganCard:
+    """An organ in play with its damage and protection status.
+
+    Unlike card definitions it belongs to one player and changes during play.
+    """
+    id: str
+    name: str
+    type: CardType
+    description: str
+    organ_type: Optional[str] = None
+    is_vital: bool = False
+    can_be_protected: bool = True
     is_removed: bool = False
     is_protected: bool = False
     protection_source: Optional[str] = None
@@ -113,6 +181,38 @@ class OrganCard(Card):
         """Set card type to Organ after initialization."""
         self.type = CardType.ORGAN
 
+    def copy(self) -> "OrganCard":
+        """An independent copy, e.g. for a cloned game."""
+        return OrganCard(
+            self.id, self.name, self.type, self.description, self.organ_type, self.is_vital,
+            self.can_be_protected, self.is_removed, self.is_protected, self.protection_source,
+            self.protection_expires_at, self.hit_points, self.max_hit_points
+        )
+
+
+@dataclass(frozen=True)
+class OrganTemplate:
+    """Immutable organ definition used to build fresh OrganCard instances."""
+    organ_type: OrganType
+    description: str
+    hit_points: int = 1
+    is_vital: bool = False
+    can_be_protected: bool = True
+
+    def create(self) -> OrganCard:
+        """Build a new, undamaged organ card from this template."""
+        return OrganCard(
+            id=f"organ_{self.organ_type.value.lower()}",
+            name=self.organ_type.value,
+            type=CardType.ORGAN,
+            description=self.description,
+            organ_type=self.organ_type.value,
+            is_vital=self.is_vital,
+            can_be_protected=self.can_be_protected,
+            hit_points=self.hit_points,
+            max_hit_points=self.hit_points
+        )
+
 
 @dataclass
 class GameEvent:
@@ -124,6 +224,8 @@ class GameEvent:
     target_organ: Optional[str] = None
     success: bool = True
     details: Dict[str, Any] = field(default_factory=dict)
+    seq: int = 0
+    turn: int = 0
 
 
 @dataclass
@@ -138,6 +240,25 @@ class ActiveEffect:
     effect_data: Dict[str, Any] = field(default_factory=dict)
 
 
+class ActionType(Enum):
+    """Player actions the engine can apply."""
+    DRAW_CARD = "draw_card"
+    PLAY_CARD = "play_card"
+    DISCARD_CARD = "discard_card"
+    BLOCK_ATTACK = "block_attack"
+    END_TURN = "end_turn"
+
+
+@dataclass(frozen=True)
+class GameAction:
+    """A single player action, addressed by player name and card instance id."""
+    type: ActionType
+    player: str
+    instance_id: Optional[int] = None
+    target_player: Optional[str] = None
+    target_organ: Optional[str] = None
+
+
 class TurnDirection(Enum):
     CLOCKWISE = 1
     ANTICLOCKWISE = -1
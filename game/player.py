@@ -3,22 +3,29 @@ Player management for the Organ Attack card game.
 Handles player state, organs, hand management, and actions.
 """
 
+import os
 import random
 import logging
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
-from game.models import Card, CardType, OrganCard, OrganType, PlayerStatus
+from game.catalog import CardCatalog, get_catalog
+from game.hand import Hand
+from game.models import (VITAL_ORGAN_TYPES, Card, CardInstance, CardType,
+                         OrganCard, OrganType, PlayerStatus)
 
 logger = logging.getLogger(__name__)
 
+# Set ORGAN_ATTACK_DEBUG=1 to check the organ counters against a full recount
+CHECK_ORGAN_COUNTERS = __debug__ and bool(os.environ.get("ORGAN_ATTACK_DEBUG"))
+
 
 @dataclass
 class Player:
     """Represents a player in the Organ Attack game."""
     name: str
     organs: Dict[str, OrganCard] = field(default_factory=dict)
-    hand: List[Card] = field(default_factory=list)
+    hand: Hand = field(default_factory=Hand)
     status: PlayerStatus = PlayerStatus.ACTIVE
     cards_played_this_turn: int = 0
     cards_drawn_this_turn: int = 0
@@ -27,64 +34,62 @@ class Player:
     organs_list: Tuple[OrganType] = tuple(
         organ for organ in OrganType
     )
-    vital_organs_list: Tuple[OrganType] = (
-        OrganType.HEART, OrganType.BRAIN, OrganType.LIVER,
-        OrganType.KIDNEYS, OrganType.LUNGS, OrganType.STOMACH
-    )
+    vital_organs_list: Tuple[OrganType] = VITAL_ORGAN_TYPES
     _skip_init: bool = field(default=False, repr=False)
+    on_eliminated: Optional[Callable[["Player"], None]] = field(default=None, repr=False, compare=False)
+    rng: Optional[random.Random] = field(default=None, repr=False, compare=False)
+    # The catalog organs are dealt and hand cards rebuilt from; the shared one if None
+    catalog: Optional[CardCatalog] = field(default=None, repr=False, compare=False)
+
+    # Incrementally maintained organ counters; see recount_organs()
+    _alive_organs: int = field(default=0, init=False, repr=False, compare=False)
+    _protected_organs: int = field(default=0, init=False, repr=False, compare=False)
+    _vital_organs: int = field(default=0, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Initialize player with starting organs."""
         if not self._skip_init and not self.organs:
             self._initialize_organs()
+        self.recount_organs()
 
     def _initialize_organs(self):
-        """Initialize player with 6 random organs, loading HP from cards.json."""
-        import json
-        from pathlib import Path
-
-        # Load organ definitions from JSON to get hit_points
-        organ_defs = {}
-        try:
-            cards_path = Path("data/cards.json")
-            if cards_path.exists():
-                with open(cards_path, 'r') as f:
-                    cards_data = json.load(f)
-                for card in cards_data.get('cards', []):
-                    if card.get('type') == 'Organ':
-                        organ_defs[card['organ_type']] = card
-        except Exception:
-            pass
-
-        organs = random.sample(list(self.organs_list), 6)
-        logger.info(f"{self.name} has the following organs: {organs}")
+        """Initialize player with 6 random organs built from the catalog's organ templates."""
+        organ_templates = (self.catalog or get_catalog()).organ_templates
 
-        for organ_type in organs:
-            organ_data = organ_defs.get(organ_type.value, {})
-            hp = organ_data.get('hit_points', 1)
-            organ_card = OrganCard(
-                id=f"organ_{organ_type.value.lower()}",
-                name=organ_type.value,
-                type=CardType.ORGAN,
-                description=organ_data.get('description', f"Essential {organ_type.value.lower()} organ."),
-                organ_type=organ_type.value,
-                is_vital=organ_type in self.vital_organs_list,
-                can_be_protected=True,
-                hit_points=hp,
-                max_hit_points=hp
-            )
-            self.organs[organ_type.value] = organ_card
+        organs = (self.rng or random).sample(self.organs_list, 6)
+        logger.debug("%s has the following organs: %s", self.name, organs)
 
-    def add_card_to_hand(self, card: Card):
+        for organ_type in organs:
+            self.organs[organ_type.value] = organ_templates[organ_type].create()
+
+    def copy(self, rng: Optional[random.Random] = None) -> "Player":
+        """An independent copy with its own organs and hand, drawing from rng if given."""
+        return Player(
+            name=self.name,
+            organs={organ_type: organ.copy() for organ_type, organ in self.organs.items()},
+            hand=self.hand.copy(),
+            status=self.status,
+            cards_played_this_turn=self.cards_played_this_turn,
+            cards_drawn_this_turn=self.cards_drawn_this_turn,
+            can_draw_extra=self.can_draw_extra,
+            skip_next_turn=self.skip_next_turn,
+            organs_list=self.organs_list,
+            vital_organs_list=self.vital_organs_list,
+            _skip_init=True,
+            on_eliminated=self.on_eliminated,
+            rng=rng if rng is not None else self.rng,
+            catalog=self.catalog,
+        )
+
+    def add_card_to_hand(self, card: CardInstance):
         """Add a card to the player's hand."""
-        self.hand.append(card)
-        logger.info(f"{self.name} drew {card.name}")
+        self.hand.add(card)
+        logger.debug("%s drew %s", self.name, card.name)
 
-    def remove_card_from_hand(self, card: Card) -> bool:
+    def remove_card_from_hand(self, card: CardInstance) -> bool:
         """Remove a card from the player's hand."""
-        if card in self.hand:
-            self.hand.remove(card)
-            logger.info(f"{self.name} played {card.name}")
+        if self.hand.remove(card.instance_id) is not None:
+            logger.debug("%s played %s", self.name, card.name)
             return True
         return False
 
@@ -102,12 +107,35 @@ class Player:
     def remove_organ(self, organ_type: str) -> bool:
         """Remove (destroy) an organ instantly, bypassing HP."""
         if self.has_organ(organ_type):
-            self.organs[organ_type].is_removed = True
-            logger.info(f"{self.name}'s {organ_type} was removed!")
+            organ = self.organs[organ_type]
+            self._count_organ(organ, -1)
+            organ.is_removed = True
+            logger.debug("%s's %s was removed!", self.name, organ_type)
             self._check_elimination()
             return True
         return False
 
+    def take_organ(self, organ_type: str) -> Optional[OrganCard]:
+        """Detach a present organ from this player, e.g. when it is stolen."""
+        if not self.has_organ(organ_type):
+            return None
+        organ = self.organs.pop(organ_type)
+        self._count_organ(organ, -1)
+        logger.debug("%s's %s was taken!", self.name, organ_type)
+        self._check_elimination()
+        return organ
+
+    def receive_organ(self, organ: OrganCard):
+        """Attach an organ taken from another player, clearing its old protection."""
+        organ.is_removed = False
+        organ.is_protected = False
+        organ.protection_source = None
+        organ.protection_expires_at = None
+        if self.has_organ(organ.organ_type):
+            self._count_organ(self.organs[organ.organ_type], -1)
+        self.organs[organ.organ_type] = organ
+        self._count_organ(organ, 1)
+
     def damage_organ(self, organ_type: str) -> bool:
         """Deal 1 damage to an organ. Returns True if organ was destroyed."""
         if not self.has_organ(organ_type):
@@ -115,11 +143,12 @@ class Player:
 
         organ = self.organs[organ_type]
         organ.hit_points -= 1
-        logger.info(f"{self.name}'s {organ_type} took 1 damage ({organ.hit_points}/{organ.max_hit_points})")
+        logger.debug("%s's %s took 1 damage (%d/%d)", self.name, organ_type, organ.hit_points, organ.max_hit_points)
 
         if organ.hit_points <= 0:
+            self._count_organ(organ, -1)
             organ.is_removed = True
-            logger.info(f"{self.name}'s {organ_type} was destroyed!")
+            logger.debug("%s's %s was destroyed!", self.name, organ_type)
             self._check_elimination()
             return True
         return False
@@ -129,11 +158,13 @@ class Player:
         if self.has_organ(organ_type):
             organ = self.organs[organ_type]
             if organ.can_be_protected:
+                if not organ.is_protected:
+                    self._protected_organs += 1
                 organ.is_protected = True
                 organ.protection_source = protection_source
                 organ.protection_expires_at = expires_at
-                logger.info(
-                    f"{self.name}'s {organ_type} is now protected by {protection_source} (expires turn {expires_at})")
+                logger.debug("%s's %s is now protected by %s (expires turn %s)",
+                             self.name, organ_type, protection_source, expires_at)
                 return True
         return False
 
@@ -142,10 +173,11 @@ class Player:
         if self.has_organ(organ_type):
             organ = self.organs[organ_type]
             if organ.is_protected:
+                self._protected_organs -= 1
                 organ.is_protected = False
                 organ.protection_source = None
-                logger.info(
-                    f"{self.name}'s {organ_type} protection was removed")
+                organ.protection_expires_at = None
+                logger.debug("%s's %s protection was removed", self.name, organ_type)
                 return True
         return False
 
@@ -159,6 +191,46 @@ class Player:
         """Get all organs that are still present (not removed)."""
         return [organ for organ in self.organs.values() if not organ.is_removed]
 
+    def alive_organ_count(self) -> int:
+        """Number of organs that are still present."""
+        return self._alive_organs
+
+    def protected_organ_count(self) -> int:
+        """Number of present organs that are protected."""
+        return self._protected_organs
+
+    def unprotected_organ_count(self) -> int:
+        """Number of present organs that are not protected."""
+        return self._alive_organs - self._protected_organs
+
+    def vital_organ_count(self) -> int:
+        """Number of present vital organs."""
+        return self._vital_organs
+
+    def recount_organs(self):
+        """Rebuild the organ counters from scratch.
+
+        Call this after editing organs directly rather than through the
+        methods above, e.g. when syncing from a serialized state.
+        """
+        alive = protected = vital = 0
+        for organ in self.organs.values():
+            if not organ.is_removed:
+                alive += 1
+                protected += organ.is_protected
+                vital += organ.is_vital
+        self._alive_organs = alive
+        self._protected_organs = protected
+        self._vital_organs = vital
+
+    def _count_organ(self, organ: OrganCard, delta: int):
+        """Add (delta=1) or drop (delta=-1) a present organ from the counters."""
+        self._alive_organs += delta
+        if organ.is_protected:
+            self._protected_organs += delta
+        if organ.is_vital:
+            self._vital_organs += delta
+
     def get_protected_organs(self) -> List[OrganCard]:
         """Get all organs that are protected."""
         return [organ for organ in self.organs.values()
@@ -166,10 +238,21 @@ class Player:
 
     def _check_elimination(self):
         """Check if player should be eliminated (no organs left)."""
-        available_organs = self.get_available_organs()
-        if not available_organs:
+        if CHECK_ORGAN_COUNTERS:
+            self._verify_organ_counters()
+
+        if self._alive_organs == 0 and self.status != PlayerStatus.ELIMINATED:
             self.status = PlayerStatus.ELIMINATED
             logger.info(f"{self.name} has been eliminated!")
+            if self.on_eliminated:
+                self.on_eliminated(self)
+
+    def _verify_organ_counters(self):
+        """Debug check: the incremental counters must match a full recount."""
+        counts = (self._alive_organs, self._protected_organs, self._vital_organs)
+        self.recount_organs()
+        recounted = (self._alive_organs, self._protected_organs, self._vital_organs)
+        assert counts == recounted, f"{self.name}: organ counters {counts} != recount {recounted}"
 
     def is_eliminated(self) -> bool:
         """Check if player is eliminated."""
@@ -183,7 +266,7 @@ class Player:
         """Check if player needs to discard cards."""
         return len(self.hand) > hand_limit
 
-    def can_play_card(self, card: Card, allow_play: bool = True) -> bool:
+    def can_play_card(self, card: CardInstance, allow_play: bool = True) -> bool:
         """Check if a card can be played. allow_play=False when checking discard-only."""
         if card not in self.hand:
             return False
@@ -191,11 +274,11 @@ class Player:
             return False
         return True
 
-    def get_playable_cards(self) -> List[Card]:
+    def get_playable_cards(self) -> List[CardInstance]:
         """Get all cards that can currently be played."""
         return [card for card in self.hand if self.can_play_card(card)]
 
-    def get_cards_by_type(self, card_type: CardType) -> List[Card]:
+    def get_cards_by_type(self, card_type: CardType) -> List[CardInstance]:
         """Get all cards of a specific type from hand."""
         return [card for card in self.hand if card.type == card_type]
 
@@ -207,15 +290,12 @@ class Player:
 
     def get_status_summary(self) -> Dict[str, any]:
         """Get a summary of player status for display."""
-        available_organs = self.get_available_organs()
-        protected_organs = self.get_protected_organs()
-
         return {
             'name': self.name,
             'status': self.status.value,
             'hand_size': len(self.hand),
-            'organs_remaining': len(available_organs),
-            'organs_protected': len(protected_organs),
+            'organs_remaining': self.alive_organ_count(),
+            'organs_protected': self.protected_organ_count(),
             'organ_details': {
                 organ.organ_type: {
                     'present': not organ.is_removed,
@@ -227,55 +307,22 @@ class Player:
 
     def __str__(self) -> str:
         """String representation of the player."""
-        available_organs = len(self.get_available_organs())
-        return f"{self.name} ({available_organs} organs, {len(self.hand)} cards)"
+        return f"{self.name} ({self.alive_organ_count()} organs, {len(self.hand)} cards)"
 
-    def to_dict(self) -> dict:
-        """Convert player to dictionary for network transmission."""
-        hand_data = []
-        for card in self.hand:
-            try:
-                card_dict = {
-                    "id": card.id,
-                    "name": card.name,
-                    "type": card.type.value if card.type else "Unknown",
-                    "description": card.description or "",
-                    "organ_type": card.organ_type,
-                    "target": None,
-                    "effects": []
-                }
-                if card.target:
-                    card_dict["target"] = {
-                        "organ_type": getattr(card.target, 'organ_type', None),
-                        "scope": getattr(card.target, 'scope', 'Single'),
-                        "player_scope": getattr(card.target, 'player_scope', 'Other'),
-                        "organ_scope": getattr(card.target, 'organ_scope', 'Single'),
-                        "flexible": getattr(card.target, 'flexible', False)
-                    }
-                if card.effects:
-                    for e in card.effects:
-                        try:
-                            card_dict["effects"].append({
-                                "action": e.action,
-                                "target_organ": e.target_organ,
-                                "duration": e.duration,
-                                "value": e.value
-                            })
-                        except Exception:
-                            pass
-                hand_data.append(card_dict)
-            except Exception as ex:
-                logger.error(f"Error serializing card {getattr(card, 'id', '?')}: {ex}")
-                hand_data.append({
-                    "id": getattr(card, 'id', 'unknown'),
-                    "name": getattr(card, 'name', 'Unknown'),
-                    "type": "Unknown",
-                    "description": "",
-                    "organ_type": None,
-                    "target": None,
-                    "effects": []
-                })
+    def hand_to_list(self) -> list:
+        """Serialize the cards in hand for network transmission.
+
+        Cards are sent as their definition id and instance id; clients look the
+        rest up in the card catalog (CardCatalog.to_json).
+        """
+        return [{"id": card.id, "instance_id": card.instance_id} for card in self.hand]
+
+    def to_dict(self, include_hand: bool = True) -> dict:
+        """Convert player to dictionary for network transmission.
 
+        Without include_hand only the number of cards in hand is given, as other
+        players see it.
+        """
         organs_data = {}
         for organ_type, organ in self.organs.items():
             try:
@@ -294,23 +341,26 @@ class Player:
             except Exception as ex:
                 logger.error(f"Error serializing organ {organ_type}: {ex}")
 
-        return {
+        data = {
             "name": self.name,
             "organs": organs_data,
-            "hand": hand_data,
+            "hand_size": len(self.hand),
             "status": self.status.value,
             "cards_played_this_turn": self.cards_played_this_turn,
             "cards_drawn_this_turn": self.cards_drawn_this_turn,
             "can_draw_extra": self.can_draw_extra,
             "skip_next_turn": self.skip_next_turn
         }
+        if include_hand:
+            data["hand"] = self.hand_to_list()
+        return data
 
     @classmethod
-    def from_dict(cls, data: dict) -> "Player":
+    def from_dict(cls, data: dict, catalog: Optional[CardCatalog] = None) -> "Player":
         """Create player from dictionary without generating random organs."""
         from game.models import CardType, Card, OrganCard
 
-        player = cls(name=data["name"], _skip_init=True)
+        player = cls(name=data["name"], _skip_init=True, catalog=catalog)
         player.status = PlayerStatus(data.get("status", "active"))
         player.cards_played_this_turn = data.get("cards_played_this_turn", 0)
         player.cards_drawn_this_turn = data.get("cards_drawn_this_turn", 0)
@@ -336,16 +386,25 @@ class Player:
                 max_hit_points=org_data.get("max_hit_points", 1)
             )
             player.organs[organ_type] = organ
+        player.recount_organs()
 
         # Restore hand
-        player.hand = []
-        for card_data in data.get("hand", []):
-            card = Card(
+        player.hand = Hand(player.card_from_dict(card_data) for card_data in data.get("hand", []))
+
+        return player
+
+    def card_from_dict(self, card_data: dict) -> CardInstance:
+        """Rebuild a hand card, sharing the player's catalog definition when the id is known.
+
+        Unknown cards keep whatever details card_data has, e.g. from a client's
+        catalog cache; a bare id gives a placeholder.
+        """
+        definition = (self.catalog or get_catalog()).get_card(card_data["id"])
+        if definition is None:
+            definition = Card(
                 id=card_data["id"],
-                name=card_data["name"],
-                type=CardType(card_data["type"]),
+                name=card_data.get("name", card_data["id"]),
+                type=CardType(card_data.get("type", CardType.ACTION.value)),
                 description=card_data.get("description", "")
             )
-            player.hand.append(card)
-
-        return player
+        return CardInstance(card_data.get("instance_id", 0), definition)
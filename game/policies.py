@@ -0,0 +1,337 @@
+"""
+Built-in player policies for the Organ Attack card game.
+A policy picks one move at a time for the current player, for simulations and bots.
+"""
+
+import math
+import random
+import time
+from itertools import islice
+from typing import Dict, List, Optional, Tuple, Type
+
+from game.models import ActionType, GameAction, GameState
+from game.rules import MAX_CARDS_PER_TURN, count_legal_targets, legal_targets, play_targets
+
+
+class Policy:
+    """Chooses the next move for a player. Subclasses override choose_action.
+
+    time_budget caps the seconds a policy may think about a single move; policies
+    that decide instantly ignore it.
+    """
+
+    name = "policy"
+
+    def __init__(self, time_budget: Optional[float] = None):
+        self.time_budget = time_budget
+
+    def choose_action(self, engine, player, rng: random.Random) -> GameAction:
+        """Pick one of the player's legal moves. Returning END_TURN ends the turn."""
+        raise NotImplementedError
+
+
+def _hand_choices(engine, player) -> List[tuple]:
+    """(card, playable) for one copy of each distinct card in hand, as legal_actions offers them.
+
+    Empty when the player can only end the turn.
+    """
+    if engine.game_state != GameState.PLAY or player.cards_played_this_turn >= MAX_CARDS_PER_TURN:
+        return []
+    choices = []
+    seen = set()
+    for card in player.hand:
+        if card.id not in seen:
+            seen.add(card.id)
+            valid, _ = engine.card_manager.validate_card_play(card, player, engine)
+            choices.append((card, valid))
+    return choices
+
+
+def _play_action(player, card, target_player, target_organ) -> GameAction:
+    return GameAction(ActionType.PLAY_CARD, player.name, card.instance_id,
+                      target_player.name if target_player else None, target_organ)
+
+
+class RandomPolicy(Policy):
+    """Plays a uniformly random card at a random legal target.
+
+    Every legal play is equally likely. Cards are weighted by their target
+    counts and only the chosen card's targets are listed, which is much
+    cheaper than building every legal move. With nothing playable it discards
+    a random card, so dead cards don't clog the hand.
+    """
+
+    name = "random"
+
+    def choose_action(self, engine, player, rng: random.Random) -> GameAction:
+        choices = _hand_choices(engine, player)
+        if not choices:
+            return GameAction(ActionType.END_TURN, player.name)
+        weights = [count_legal_targets(card, player, engine) if valid else 0 for card, valid in choices]
+        total = sum(weights)
+        if not total:
+            card, _ = rng.choice(choices)
+            return GameAction(ActionType.DISCARD_CARD, player.name, card.instance_id)
+
+        pick = rng.randrange(total)
+        for (card, _), weight in zip(choices, weights):
+            if pick < weight:
+                target_player, target_organ = next(islice(legal_targets(card, player, engine), pick, None))
+                return _play_action(player, card, target_player, target_organ)
+            pick -= weight
+        raise AssertionError("target counts disagree with legal_targets")
+
+
+class GreedyPolicy(Policy):
+    """Plays the card with the best immediate payoff, attacking the weakest opponent first."""
+
+    name = "greedy"
+
+    def choose_action(self, engine, player, rng: random.Random) -> GameAction:
+        # Plays are scored straight from the hand, without building a GameAction for each
+        best, best_score = None, 0.0
+        # Best payoff each card in hand could get; cards with none are dead weight
+        card_values = {}
+        for card, valid in _hand_choices(engine, player):
+            value = 0.0
+            if valid:
+                for target_player, target_organ in legal_targets(card, player, engine):
+                    score = self.score_play(player, card, target_player, target_organ) + rng.random() * 0.01
+                    value = max(value, score)
+                    if score > best_score:
+                        best, best_score = (card, target_player, target_organ), score
+            card_values[card.instance_id] = value
+
+        if best is not None:
+            return _play_action(player, *best)
+        dead = [instance_id for instance_id, value in card_values.items() if value <= 0.0]
+        if dead:
+            return GameAction(ActionType.DISCARD_CARD, player.name, rng.choice(dead))
+        return GameAction(ActionType.END_TURN, player.name)
+
+    @classmethod
+    def score(cls, engine, player, action: GameAction) -> float:
+        """Rough value of playing a card; zero or less means not worth playing now."""
+        return cls.score_play(player, player.hand.get(action.instance_id),
+                              engine.get_player(action.target_player), action.target_organ)
+
+    @staticmethod
+    def score_play(player, card, target, organ: Optional[str]) -> float:
+        """score() for a card and target already in hand, as legal_targets yields them."""
+        score = 0.0
+        for effect in card.effects:
+            kind = effect.action
+            if kind in ('remove_organ', 'test_luck', 'mimic_card'):
+                if target is None or target is player or target.is_organ_protected(organ):
+                    continue
+                value = 10.0 - target.alive_organ_count()
+                if target.organs[organ].is_vital:
+                    value += 1.0
+                score += value if kind != 'test_luck' else value / 2
+            elif kind == 'steal_organ':
+                if target is not None and not target.is_organ_protected(organ):
+                    score += 12.0 - target.alive_organ_count()
+            elif kind == 'protect_organ':
+                own = (target or player).get_organ(organ)
+                if own is not None and not own.is_protected:
+                    score += 4.0 + (2.0 if own.is_vital else 0.0) + 6.0 / player.alive_organ_count()
+            elif kind == 'draw_cards':
+                score += 3.0
+            elif kind == 'extra_turn':
+                score += 5.0
+            elif kind == 'skip_turn':
+                if target is not None:
+                    score += 2.0 + target.alive_organ_count() / 3
+            elif kind == 'mass_discard':
+                score += 2.0
+        return score
+
+
+# Tree edges are keyed by card definition rather than instance, so they stay
+# meaningful across determinizations that deal different copies of a card
+ActionKey = Tuple[ActionType, Optional[str], Optional[str], Optional[str]]
+
+
+def _action_key(player, action: GameAction) -> ActionKey:
+    card = player.hand.get(action.instance_id) if action.instance_id is not None else None
+    return action.type, card.id if card else None, action.target_player, action.target_organ
+
+
+def _search_actions(engine, player) -> List[GameAction]:
+    """Moves worth searching: plays and ending the turn, or discards when nothing is playable."""
+    actions = engine.legal_moves(player)
+    moves = [a for a in actions if a.type != ActionType.DISCARD_CARD]
+    if len(moves) == 1:
+        moves = actions
+    return moves
+
+
+def _rollout_action(engine, player, rng: random.Random) -> GameAction:
+    """Cheap random move for rollouts: one random card at one of its targets."""
+    if player.cards_played_this_turn >= MAX_CARDS_PER_TURN or not len(player.hand):
+        return GameAction(ActionType.END_TURN, player.name)
+    card = rng.choice(list(player.hand))
+    valid, _ = engine.card_manager.validate_card_play(card, player, engine)
+    targets = list(play_targets(card, player, engine)) if valid else None
+    if not targets:
+        return GameAction(ActionType.DISCARD_CARD, player.name, card.instance_id)
+    target_player, target_organ = rng.choice(targets)
+    return GameAction(ActionType.PLAY_CARD, player.name, card.instance_id,
+                      target_player.name if target_player else None, target_organ)
+
+
+class _Node:
+    """A search tree node; value is from the viewpoint of the player who moved into it."""
+
+    __slots__ = ('mover', 'children', 'visits', 'value')
+
+    def __init__(self, mover: Optional[str]):
+        self.mover = mover
+        self.children: Dict[ActionKey, "_Node"] = {}
+        self.visits = 0
+        self.value = 0.0
+
+
+class MCTSPolicy(Policy):
+    """Monte Carlo tree search over determinizations of the game.
+
+    The game is cloned once per move into a scratch engine with its own
+    random stream. Every redeal_every iterations the deck and the other
+    players' hands are reshuffled, since this player can't see them; each
+    iteration then starts from that deal by restoring a snapshot rather than
+    cloning again. Rollouts play cheap random moves for a limited number of
+    turns and then score the position by organs left.
+    """
+
+    name = "mcts"
+
+    def __init__(self, time_budget: Optional[float] = 0.5, max_iterations: Optional[int] = None,
+                 rollout_turns: int = 12, exploration: float = 1.4, redeal_every: int = 8):
+        super().__init__(time_budget)
+        self.max_iterations = max_iterations
+        self.rollout_turns = rollout_turns
+        self.exploration = exploration
+        self.redeal_every = redeal_every
+        self.last_iterations = 0
+
+    def choose_action(self, engine, player, rng: random.Random) -> GameAction:
+        moves = _search_actions(engine, player)
+        if len(moves) == 1:
+            return moves[0]
+
+        root = _Node(None)
+        deadline = time.perf_counter() + (self.time_budget or 0.0)
+        # Snapshots leave out the random stream, so rollouts from the same deal still differ
+        sim = engine.clone(rng=random.Random(rng.getrandbits(64)))
+        start = sim.snapshot(include_rng=False)
+        dealt = None
+        iterations = 0
+        while True:
+            if iterations % self.redeal_every == 0:
+                if iterations:
+                    sim.restore(start)
+                self._redeal(sim, player, rng)
+                dealt = sim.snapshot(include_rng=False)
+            else:
+                sim.restore(dealt)
+            self._iterate(sim, root, rng)
+            iterations += 1
+            if self.max_iterations is not None and iterations >= self.max_iterations:
+                break
+            if self.max_iterations is None and time.perf_counter() >= deadline:
+                break
+        self.last_iterations = iterations
+
+        keys = {_action_key(player, move): move for move in moves}
+        visited = [key for key in root.children if key in keys]
+        if not visited:
+            return moves[-1]
+        return keys[max(visited, key=lambda key: root.children[key].visits)]
+
+    @staticmethod
+    def _redeal(sim, player, rng: random.Random):
+        """Deal the cards this player can't see, the deck and the other hands, at random."""
+        others = [p for p in sim.players if p.name != player.name]
+        pool = list(sim.deck)
+        for other in others:
+            pool.extend(other.hand)
+        rng.shuffle(pool)
+        for other in others:
+            size = len(other.hand)
+            other.hand.clear()
+            for card in pool[len(pool) - size:]:
+                other.hand.add(card)
+            del pool[len(pool) - size:]
+        sim.deck = pool
+
+    def _iterate(self, sim, root: _Node, rng: random.Random):
+        """One selection, expansion, rollout and backpropagation pass, played out on sim."""
+        node = root
+        path = [root]
+
+        # Selection and expansion
+        while not sim.is_game_over():
+            mover = sim.get_current_player()
+            moves = {_action_key(mover, move): move for move in _search_actions(sim, mover)}
+            untried = [key for key in moves if key not in node.children]
+            if untried:
+                key = rng.choice(untried)
+                child = node.children[key] = _Node(mover.name)
+                sim.apply(moves[key])
+                path.append(child)
+                break
+
+            log_visits = math.log(node.visits or 1)
+            best_key, best_score = None, -1.0
+            for key in moves:
+                child = node.children[key]
+                score = (child.value / child.visits +
+                         self.exploration * math.sqrt(log_visits / child.visits))
+                if score > best_score:
+                    best_key, best_score = key, score
+            node = node.children[best_key]
+            sim.apply(moves[best_key])
+            path.append(node)
+
+        # Rollout
+        end_turn = sim.turn_count + self.rollout_turns
+        while not sim.is_game_over() and sim.turn_count < end_turn:
+            mover = sim.get_current_player()
+            action = _rollout_action(sim, mover, rng)
+            result = sim.apply(action)
+            if action.type != ActionType.END_TURN and not result.get("success"):
+                sim.apply(GameAction(ActionType.END_TURN, mover.name))
+
+        # Backpropagation
+        rewards = self._evaluate(sim)
+        for visited in path:
+            visited.visits += 1
+            if visited.mover is not None:
+                visited.value += rewards[visited.mover]
+
+    @staticmethod
+    def _evaluate(sim) -> Dict[str, float]:
+        """Score each player in [0, 1]: 1 for the winner, otherwise their share of surviving organs."""
+        if sim.is_game_over():
+            survivors = {p.name for p in sim.get_active_players()}
+            return {p.name: 1.0 if p.name in survivors else 0.0 for p in sim.players}
+        total = sum(p.alive_organ_count() for p in sim.players) or 1
+        return {p.name: p.alive_organ_count() / total for p in sim.players}
+
+
+POLICIES: Dict[str, Type[Policy]] = {
+    RandomPolicy.name: RandomPolicy,
+    GreedyPolicy.name: GreedyPolicy,
+    MCTSPolicy.name: MCTSPolicy,
+}
+
+
+def get_policy(name: str, time_budget: Optional[float] = None) -> Policy:
+    """Instantiate a built-in policy by name."""
+    try:
+        policy_class = POLICIES[name]
+    except KeyError:
+        raise ValueError(f"Unknown policy {name!r}; choose from {', '.join(POLICIES)}") from None
+    if time_budget is None:
+        return policy_class()
+    return policy_class(time_budget=time_budget)
@@ -0,0 +1,85 @@
+"""
+Protection expiry scheduling for the Organ Attack card game.
+Tracks when each organ protection lapses so end-of-turn processing only
+touches the protections that are due.
+"""
+
+import heapq
+from typing import List, Optional, Sequence, Tuple
+
+from game.player import Player
+
+VACCINATION = 'Vaccination'
+
+
+class ProtectionSchedule:
+    """Min-heap of pending protection expiries, ordered by the turn they lapse on."""
+
+    __slots__ = ('_heap', '_seq')
+
+    def __init__(self):
+        self._heap: List[Tuple[int, int, Player, str, str, Optional[int]]] = []
+        self._seq = 0
+
+    def register(self, player: Player, organ_type: str, current_turn: int):
+        """Schedule the expiry of an organ's current protection.
+
+        Vaccinations lapse at the end of the turn they expire on; any other
+        protection only lasts until the end of the current turn. Vaccinations
+        without an expiry turn are permanent and never scheduled.
+        """
+        organ = player.organs.get(organ_type)
+        if not organ or not organ.is_protected:
+            return
+
+        source = organ.protection_source
+        expires_at = organ.protection_expires_at
+        if source == VACCINATION:
+            if expires_at is None:
+                return
+            due_turn = expires_at
+        else:
+            due_turn = current_turn
+
+        self._seq += 1
+        heapq.heappush(self._heap, (due_turn, self._seq, player, organ_type, source, expires_at))
+
+    def expire_due(self, turn: int) -> int:
+        """Strip every protection due on or before this turn. Returns how many lapsed."""
+        heap = self._heap
+        expired = 0
+        while heap and heap[0][0] <= turn:
+            _, _, player, organ_type, source, expires_at = heapq.heappop(heap)
+            organ = player.organs.get(organ_type)
+            # Skip entries whose protection was since removed, replaced or moved
+            if (organ and organ.is_protected and organ.protection_source == source
+                    and organ.protection_expires_at == expires_at):
+                player.unprotect_organ(organ_type)
+                expired += 1
+        return expired
+
+    def rebuild(self, players: List[Player], current_turn: int):
+        """Re-register every protection currently in place, e.g. after loading a state."""
+        self._heap.clear()
+        for player in players:
+            for organ_type in player.organs:
+                self.register(player, organ_type, current_turn)
+
+    def snapshot(self, players: Sequence[Player]) -> tuple:
+        """Pending expiries with players replaced by their seat index, in heap order."""
+        seats = {id(player): seat for seat, player in enumerate(players)}
+        return self._seq, tuple(
+            (due_turn, seq, seats[id(player)], organ_type, source, expires_at)
+            for due_turn, seq, player, organ_type, source, expires_at in self._heap
+        )
+
+    def restore(self, state: tuple, players: Sequence[Player]):
+        """Load expiries saved by snapshot() against the given players."""
+        self._seq, entries = state
+        self._heap = [
+            (due_turn, seq, players[seat], organ_type, source, expires_at)
+            for due_turn, seq, seat, organ_type, source, expires_at in entries
+        ]
+
+    def __len__(self) -> int:
+        return len(self._heap)
@@ -0,0 +1,168 @@
+"""
+Card play rules for the Organ Attack card game.
+Compiles card conditions into short tuples of predicate checks at catalog load,
+and enumerates the moves open to a player.
+"""
+
+from typing import Callable, List, Optional, Tuple
+
+from game.models import ActionType, CardConditions, GameAction, GameState
+
+# A play check returns None when the play is allowed, or the reason it is not
+PlayCheck = Callable[..., Optional[str]]
+
+MAX_ORGAN_SLOTS = 6
+MAX_CARDS_PER_TURN = 2
+
+# Effect actions that need a target organ as well as a target player
+_ORGAN_TARGETED_ACTIONS = frozenset({'remove_organ', 'protect_organ', 'steal_organ', 'test_luck', 'mimic_card'})
+
+
+def _organ_must_be_present(player, game_engine) -> Optional[str]:
+    """Player must have at least one non-removed organ."""
+    if player.alive_organ_count() == 0:
+        return "No organs present to use this card"
+    return None
+
+
+def _organ_must_not_be_protected(player, game_engine) -> Optional[str]:
+    """Player must have an unprotected organ."""
+    if player.unprotected_organ_count() == 0:
+        return "All organs are protected"
+    return None
+
+
+def _player_must_have_available_slot(player, game_engine) -> Optional[str]:
+    """Player must have fewer than six organs."""
+    if player.alive_organ_count() >= MAX_ORGAN_SLOTS:
+        return "All organ slots are full"
+    return None
+
+
+def _must_be_played_during_play(player, game_engine) -> Optional[str]:
+    """Wildcard/defense cards may be played during active gameplay.
+
+    There is no separate attack phase in this game, so the PLAY state counts.
+    """
+    if game_engine and game_engine.game_state != GameState.PLAY:
+        return "Can only be played during active gameplay"
+    return None
+
+
+def compile_play_checks(conditions: Optional[CardConditions]) -> Tuple[PlayCheck, ...]:
+    """Turn a card's conditions into the checks that run when it is played.
+
+    target_organ_must_be_present is validated against the chosen target at
+    play time, so it has no check here.
+    """
+    if not conditions:
+        return ()
+
+    checks = []
+    if conditions.organ_must_be_present:
+        checks.append(_organ_must_be_present)
+    if conditions.organ_must_not_be_protected:
+        checks.append(_organ_must_not_be_protected)
+    if conditions.player_must_have_available_slot:
+        checks.append(_player_must_have_available_slot)
+    if conditions.must_be_played_in_response_or_attack_phase:
+        checks.append(_must_be_played_during_play)
+    return tuple(checks)
+
+
+def play_targets(card, player, game_engine):
+    """Yield the (target_player, target_organ) pairs a card can sensibly be aimed at."""
+    target = card.target
+    if target is None or target.player_scope == 'All':
+        yield None, None
+        return
+
+    if target.player_scope == 'Self':
+        candidates = [player]
+    elif target.player_scope == 'Any':
+        candidates = game_engine.get_active_players()
+    else:
+        candidates = [p for p in game_engine.get_active_players() if p is not player]
+
+    organ_type = target.organ_type
+    wants_organ = any(effect.action in _ORGAN_TARGETED_ACTIONS for effect in card.effects)
+    for target_player in candidates:
+        if not wants_organ:
+            yield target_player, None
+        elif organ_type and organ_type != 'Any':
+            if target_player.has_organ(organ_type):
+                yield target_player, organ_type
+        else:
+            for organ in target_player.get_available_organs():
+                yield target_player, organ.organ_type
+
+
+def legal_targets(card, player, game_engine):
+    """Yield the targets legal_actions offers for a card that passed validation.
+
+    Cards that only work on unprotected organs skip protected ones.
+    """
+    conditions = card.conditions
+    must_be_unprotected = conditions is not None and conditions.organ_must_not_be_protected
+    for target_player, target_organ in play_targets(card, player, game_engine):
+        if must_be_unprotected and target_organ and target_player.is_organ_protected(target_organ):
+            continue
+        yield target_player, target_organ
+
+
+def count_legal_targets(card, player, game_engine) -> int:
+    """How many targets legal_targets would yield, counted without listing them."""
+    target = card.target
+    if target is None or target.player_scope == 'All':
+        return 1
+
+    if target.player_scope == 'Self':
+        candidates = [player]
+    elif target.player_scope == 'Any':
+        candidates = game_engine.get_active_players()
+    else:
+        candidates = [p for p in game_engine.get_active_players() if p is not player]
+
+    if not any(effect.action in _ORGAN_TARGETED_ACTIONS for effect in card.effects):
+        return len(candidates)
+    conditions = card.conditions
+    must_be_unprotected = conditions is not None and conditions.organ_must_not_be_protected
+    organ_type = target.organ_type
+    if organ_type and organ_type != 'Any':
+        return sum(1 for p in candidates if p.has_organ(organ_type) and
+                   not (must_be_unprotected and p.organs[organ_type].is_protected))
+    if must_be_unprotected:
+        return sum(p.unprotected_organ_count() for p in candidates)
+    return sum(p.alive_organ_count() for p in candidates)
+
+
+def legal_actions(game_engine, player) -> List[GameAction]:
+    """Every distinct move the player can make right now.
+
+    Copies of the same card lead to the same outcome, so only one instance of
+    each card is offered. Ending the turn is always legal and comes last.
+    """
+    end_turn = GameAction(ActionType.END_TURN, player.name)
+    if game_engine.game_state != GameState.PLAY or player.cards_played_this_turn >= MAX_CARDS_PER_TURN:
+        return [end_turn]
+
+    actions = []
+    seen = set()
+    for card in player.hand:
+        if card.id in seen:
+            continue
+        seen.add(card.id)
+
+        actions.append(GameAction(ActionType.DISCARD_CARD, player.name, card.instance_id))
+        valid, _ = game_engine.card_manager.validate_card_play(card, player, game_engine)
+        if not valid:
+            continue
+
+        for target_player, target_organ in legal_targets(card, player, game_engine):
+            actions.append(GameAction(
+                ActionType.PLAY_CARD, player.name, card.instance_id,
+                target_player.name if target_player else None, target_organ
+            ))
+
+    actions.append(end_turn)
+    return actions
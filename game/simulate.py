@@ -0,0 +1,190 @@
+"""
+Monte Carlo game simulator for the Organ Attack card game.
+Plays many complete games with built-in policies across worker processes and
+streams aggregated results.
+
+Usage: python -m game.simulate --games N --players K --workers P --seed S [--json PATH] [--csv PATH]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Sequence
+
+from game.catalog import CardCatalog
+from game.game_engine import GameEngine
+from game.models import ActionType, GameAction
+from game.policies import POLICIES, get_policy
+from game.stats import GameRecorder, SimulationStats
+
+MAX_TURNS = 1000
+CHUNK_SIZE = 500
+
+
+def game_seed(seed: int, game_index: int) -> int:
+    """Derive a distinct, reproducible engine seed for one game of a run."""
+    return (seed << 32) | game_index
+
+
+def policy_rng(seed: int) -> random.Random:
+    """The random stream a game's policies choose moves with.
+
+    It is seeded apart from the engine's, so move choices aren't correlated with
+    deals and shuffles. String seeds are hashed with SHA-512, not hash(), so
+    the stream is the same in every worker process.
+    """
+    return random.Random(f"{seed}:policy")
+
+
+def play_game(seed: int, num_players: int, policy_names: Sequence[str], stats: SimulationStats,
+              time_budget: Optional[float] = None, catalog: Optional[CardCatalog] = None):
+    """Play one game to completion and record it into stats."""
+    engine = GameEngine([f"Seat {i}" for i in range(num_players)], seed=seed, catalog=catalog)
+    rng = policy_rng(seed)
+    policies = [get_policy(policy_names[i % len(policy_names)], time_budget) for i in range(num_players)]
+    recorder = GameRecorder(engine, stats)
+
+    for _ in range(MAX_TURNS):
+        player = engine.get_current_player()
+        policy = policies[engine.current_player_index]
+        while True:
+            action = policy.choose_action(engine, player, rng)
+            result = engine.apply(action)
+            if action.type == ActionType.END_TURN:
+                break
+            if not result.get("success"):
+                # A rejected move would be chosen again; end the turn rather than spin
+                result = engine.apply(GameAction(ActionType.END_TURN, player.name))
+                break
+            recorder.record_action(action, result)
+
+        recorder.end_turn()
+        if result.get("game_over"):
+            break
+
+    recorder.finish()
+
+
+def run_chunk(seed: int, start: int, count: int, num_players: int,
+              policy_names: Sequence[str], time_budget: Optional[float] = None) -> SimulationStats:
+    """Worker entry point: play games start..start+count of a run."""
+    stats = SimulationStats(worker=os.getpid())
+    began = time.perf_counter()
+    for game_index in range(start, start + count):
+        play_game(game_seed(seed, game_index), num_players, policy_names, stats, time_budget)
+    stats.elapsed = time.perf_counter() - began
+    return stats
+
+
+def print_report(stats: SimulationStats, num_players: int, policy_names: Sequence[str],
+                 per_worker: Dict[int, SimulationStats], wall_time: float, out=sys.stdout):
+    """Print the aggregated results of a run."""
+    games = stats.games or 1
+    print(f"\n{stats.games} games, {num_players} players, {wall_time:.2f}s wall "
+          f"({stats.games / wall_time:,.0f} games/s, {stats.turns / wall_time:,.0f} turns/s)", file=out)
+
+    print("\nWin rate by seat:", file=out)
+    for seat in range(num_players):
+        policy = policy_names[seat % len(policy_names)]
+        print(f"  seat {seat} ({policy:>6}): {stats.wins_by_seat[seat] / games:6.1%}", file=out)
+    print(f"  no winner:          {stats.draws / games:6.1%}", file=out)
+
+    lengths = stats.game_lengths
+    print(f"\nGame length (turns): mean {lengths.mean:.1f}, p10 {lengths.quantile(0.1):.0f}, "
+          f"p50 {lengths.quantile(0.5):.0f}, p90 {lengths.quantile(0.9):.0f}, "
+          f"max {lengths.max if lengths.count else 0:.0f}", file=out)
+
+    eliminations = stats.elimination_turns
+    if eliminations.count:
+        print(f"Elimination turn: mean {eliminations.mean:.1f}, p10 {eliminations.quantile(0.1):.0f}, "
+              f"p50 {eliminations.quantile(0.5):.0f}, p90 {eliminations.quantile(0.9):.0f}", file=out)
+        curve = stats.survival_curve(points=5)
+        print("Players alive: " + ", ".join(f"turn {turn} {alive:.0%}" for turn, alive in curve), file=out)
+
+    total_plays = sum(stats.card_plays.values()) or 1
+    print(f"\nCard usage (plays per game, share of plays, share played by the winner "
+          f"vs {1 / num_players:.0%} by chance):", file=out)
+    for name, card in stats.card_summary().items():
+        print(f"  {name:<30} {card['plays_per_game']:6.2f}  {card['plays'] / total_plays:6.1%}  "
+              f"{card['winner_share']:6.1%}", file=out)
+
+    loss_order = stats.organ_loss_order()
+    if loss_order:
+        print("\nOrgan loss order (share of 1st, 2nd, ... organs lost):", file=out)
+        orders = range(1 + max(order for order, _ in stats.organ_losses))
+        width = max(map(len, loss_order))
+        for organ_type, shares in sorted(loss_order.items()):
+            print(f"  {organ_type:<{width}} " + " ".join(f"{shares.get(order, 0.0):6.1%}" for order in orders),
+                  file=out)
+
+    print("\nWorker throughput:", file=out)
+    for pid, worker in sorted(per_worker.items()):
+        print(f"  pid {pid}: {worker.games} games in {worker.elapsed:.2f}s "
+              f"({worker.games / worker.elapsed:,.0f} games/s)", file=out)
+
+
+def simulate(games: int, num_players: int, workers: int, seed: int,
+             policy_names: Sequence[str], time_budget: Optional[float] = None,
+             out=sys.stdout) -> SimulationStats:
+    """Run a batch of games across worker processes, streaming progress as chunks finish."""
+    total = SimulationStats()
+    per_worker: Dict[int, SimulationStats] = {}
+    chunk_size = max(1, min(CHUNK_SIZE, games // (workers * 4) or 1))
+    began = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(run_chunk, seed, start, min(chunk_size, games - start), num_players,
+                            policy_names, time_budget)
+            for start in range(0, games, chunk_size)
+        ]
+        for future in as_completed(futures):
+            chunk = future.result()
+            total += chunk
+            worker_stats = per_worker.setdefault(chunk.worker, SimulationStats(worker=chunk.worker))
+            worker_stats += chunk
+
+            elapsed = time.perf_counter() - began
+            leader = max(range(num_players), key=lambda seat: total.wins_by_seat[seat])
+            print(f"[{total.games / games:4.0%}] {total.games}/{games} games, "
+                  f"{total.games / elapsed:,.0f} games/s, avg {total.turns / total.games:.1f} turns, "
+                  f"seat {leader} leads with {total.wins_by_seat[leader] / total.games:.1%}",
+                  file=out, flush=True)
+
+    print_report(total, num_players, policy_names, per_worker, time.perf_counter() - began, out)
+    return total
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Simulate Organ Attack games with built-in policies")
+    parser.add_argument("--games", type=int, default=1000, help="number of games to play")
+    parser.add_argument("--players", type=int, default=4, help="players per game")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument("--seed", type=int, default=0, help="base seed; the same seed replays the same games")
+    parser.add_argument("--policies", default="random",
+                        help=f"comma-separated policies assigned to seats in turn ({', '.join(POLICIES)})")
+    parser.add_argument("--time-budget", type=float, default=None,
+                        help="seconds per move for searching policies such as mcts")
+    parser.add_argument("--json", metavar="PATH", help="also write the summary to a JSON file")
+    parser.add_argument("--csv", metavar="PATH", help="also write the summary to a CSV file")
+    args = parser.parse_args(argv)
+
+    policy_names = [name.strip() for name in args.policies.split(",") if name.strip()]
+    for name in policy_names:
+        if name not in POLICIES:
+            parser.error(f"unknown policy {name!r}; choose from {', '.join(POLICIES)}")
+    if args.games < 1 or args.players < 2 or args.workers < 1:
+        parser.error("need at least 1 game, 2 players and 1 worker")
+
+    stats = simulate(args.games, args.players, args.workers, args.seed, policy_names, args.time_budget)
+    if args.json:
+        stats.write_json(args.json)
+    if args.csv:
+        stats.write_csv(args.csv)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+Compact game snapshots for the Organ Attack card game.
+Captures only the mutable state of a game, with cards as integer instance ids
+and organs as flat arrays, so search, undo and dry runs can save and restore
+a position cheaply.
+"""
+
+from array import array
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple
+
+from game.discard_pile import DiscardPile
+from game.hand import Hand
+from game.models import CardType, GameState, PlayerStatus, TurnDirection
+
+# Organ flag bits
+REMOVED = 1
+PROTECTED = 2
+
+
+@dataclass(frozen=True, slots=True)
+class GameSnapshot:
+    """Immutable copy of a game's mutable state.
+
+    Players are stored by seat. Organs are flattened across all seats in seat
+    order; organ_counts says how many belong to each seat.
+    """
+    current_player_index: int
+    turn_count: int
+    game_state: GameState
+    turn_direction: TurnDirection
+    winner: int
+    pending_defense: bool
+    current_attack: Optional[Tuple[Tuple[str, Any], ...]]
+    deck: array
+    discard: array
+    # The discard pile's cards grouped by type, so restoring it skips re-indexing
+    discard_groups: Tuple[Tuple[CardType, array], ...]
+    hands: Tuple[array, ...]
+    # (status, cards_played, cards_drawn, can_draw_extra, skip_next_turn) per seat
+    player_flags: Tuple[Tuple[PlayerStatus, int, int, bool, bool], ...]
+    organ_counts: Tuple[int, ...]
+    organ_types: Tuple[str, ...]
+    organ_hp: array
+    organ_flags: bytes
+    # (protection_source, protection_expires_at) per organ, None when unprotected
+    organ_protection: Tuple[Optional[Tuple[str, Optional[int]]], ...]
+    protections: tuple
+    rng_state: Optional[tuple]
+
+
+def take_snapshot(engine, include_rng: bool = True) -> GameSnapshot:
+    """Capture the engine's mutable state."""
+    players = engine.players
+    organ_counts = []
+    organ_types = []
+    organ_hp = array('b')
+    organ_flags = bytearray()
+    organ_protection = []
+    for player in players:
+        organs = player.organs
+        organ_counts.append(len(organs))
+        for organ_type, organ in organs.items():
+            organ_types.append(organ_type)
+            organ_hp.append(organ.hit_points)
+            if organ.is_protected:
+                organ_flags.append(PROTECTED | (REMOVED if organ.is_removed else 0))
+                organ_protection.append((organ.protection_source, organ.protection_expires_at))
+            else:
+                organ_flags.append(REMOVED if organ.is_removed else 0)
+                organ_protection.append(None)
+
+    winner = engine.winner
+    return GameSnapshot(
+        current_player_index=engine.current_player_index,
+        turn_count=engine.turn_count,
+        game_state=engine.game_state,
+        turn_direction=engine.turn_direction,
+        winner=players.index(winner) if winner is not None else -1,
+        pending_defense=engine.pending_defense,
+        current_attack=tuple(engine.current_attack.items()) if engine.current_attack else None,
+        deck=array('H', [card.instance_id for card in engine.deck]),
+        discard=array('H', [card.instance_id for card in engine.discard_pile]),
+        discard_groups=tuple((card_type, array('H', [card.instance_id for card in cards]))
+                             for card_type, cards in engine.discard_pile.groups()),
+        hands=tuple(array('H', player.hand.ids()) for player in players),
+        player_flags=tuple(
+            (p.status, p.cards_played_this_turn, p.cards_drawn_this_turn, p.can_draw_extra, p.skip_next_turn)
+            for p in players
+        ),
+        organ_counts=tuple(organ_counts),
+        organ_types=tuple(organ_types),
+        organ_hp=organ_hp,
+        organ_flags=bytes(organ_flags),
+        organ_protection=tuple(organ_protection),
+        protections=engine.protections.snapshot(players),
+        rng_state=engine.rng.getstate() if include_rng else None,
+    )
+
+
+def restore_snapshot(engine, snapshot: GameSnapshot):
+    """Put the engine back into the state captured by take_snapshot.
+
+    Organ cards already held by the right seat are updated in place; the game
+    event log is history rather than state and is left alone.
+    """
+    instances = engine.card_instances
+    catalog = engine.card_manager.catalog
+    players = engine.players
+
+    engine.current_player_index = snapshot.current_player_index
+    engine.turn_count = snapshot.turn_count
+    engine.game_state = snapshot.game_state
+    engine.turn_direction = snapshot.turn_direction
+    engine.winner = players[snapshot.winner] if snapshot.winner >= 0 else None
+    engine.pending_defense = snapshot.pending_defense
+    engine.current_attack = dict(snapshot.current_attack) if snapshot.current_attack else None
+    engine.deck = [instances[i] for i in snapshot.deck]
+    engine.discard_pile = DiscardPile.from_groups(
+        [instances[i] for i in snapshot.discard],
+        [(card_type, [instances[i] for i in ids]) for card_type, ids in snapshot.discard_groups]
+    )
+
+    types = snapshot.organ_types
+    hps = snapshot.organ_hp
+    flags = snapshot.organ_flags
+    protection = snapshot.organ_protection
+    start = 0
+    for player, hand_ids, player_flags, count in zip(
+            players, snapshot.hands, snapshot.player_flags, snapshot.organ_counts):
+        player.hand = Hand(instances[i] for i in hand_ids)
+        (player.status, player.cards_played_this_turn, player.cards_drawn_this_turn,
+         player.can_draw_extra, player.skip_next_turn) = player_flags
+
+        old_organs = player.organs
+        organs = {}
+        for i in range(start, start + count):
+            organ_type = types[i]
+            organ = old_organs.get(organ_type) or catalog.new_organ(organ_type)
+            organ.hit_points = hps[i]
+            organ.is_removed = bool(flags[i] & REMOVED)
+            if flags[i] & PROTECTED:
+                organ.is_protected = True
+                organ.protection_source, organ.protection_expires_at = protection[i]
+            else:
+                organ.is_protected = False
+                organ.protection_source = None
+                organ.protection_expires_at = None
+            organs[organ_type] = organ
+        player.organs = organs
+        player.recount_organs()
+        start += count
+
+    engine.protections.restore(snapshot.protections, players)
+    if snapshot.rng_state is not None:
+        engine.rng.setstate(snapshot.rng_state)
+    engine.sync_players()
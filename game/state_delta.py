@@ -0,0 +1,150 @@
+"""
+State deltas for the Organ Attack card game.
+Describes the change between two GameEngine.to_dict() states compactly, so
+the server can send what changed after each action instead of the whole
+state, and clients can apply it to their copy.
+
+A delta looks like:
+    {"base": 41, "version": 42,
+     "set": {"turn_count": 7, ...},               changed top-level fields
+     "players": {"1": {"set": {...},              changed player fields
+                       "organs": {"Heart": {"hit_points": 0, ...} | None},
+                       "hand_add": [{"id", "instance_id"}, ...],
+                       "hand_remove": [instance_id, ...]}}}
+It applies only to a state whose state_version is its base.
+
+Online, the state is the public view every player shares, and each player
+also gets their own private view (seat, hand and legal moves) or, with each
+delta, a private delta {"seat", "hand_add", "hand_remove", "legal_moves"}.
+"""
+
+from typing import Any, Dict, List, Optional
+
+
+class DeltaGap(ValueError):
+    """A delta does not follow on from the state it was applied to; resync."""
+
+
+def diff_state(old: dict, new: dict) -> dict:
+    """The delta that turns state `old` into state `new`."""
+    delta: Dict[str, Any] = {"base": old.get("state_version"), "version": new.get("state_version")}
+    changed = {key: value for key, value in new.items()
+               if key not in ("players", "state_version") and old.get(key) != value}
+    if changed:
+        delta["set"] = changed
+
+    old_players = old.get("players", [])
+    players = {}
+    for index, player in enumerate(new.get("players", [])):
+        player_delta = _diff_player(old_players[index] if index < len(old_players) else {}, player)
+        if player_delta:
+            players[str(index)] = player_delta
+    if players:
+        delta["players"] = players
+    return delta
+
+
+def _diff_player(old: dict, new: dict) -> dict:
+    delta: Dict[str, Any] = {}
+    changed = {key: value for key, value in new.items()
+               if key not in ("organs", "hand") and old.get(key) != value}
+    if changed:
+        delta["set"] = changed
+
+    old_organs, new_organs = old.get("organs", {}), new.get("organs", {})
+    organs: Dict[str, Optional[dict]] = {}
+    for organ_type, organ in new_organs.items():
+        before = old_organs.get(organ_type)
+        if before is None:
+            organs[organ_type] = organ
+        elif before != organ:
+            organs[organ_type] = {key: value for key, value in organ.items() if before.get(key) != value}
+    for organ_type in old_organs.keys() - new_organs.keys():
+        organs[organ_type] = None
+    if organs:
+        delta["organs"] = organs
+
+    delta.update(_diff_hand(old.get("hand", []), new.get("hand", [])))
+    return delta
+
+
+def _diff_hand(old: List[dict], new: List[dict]) -> dict:
+    delta: Dict[str, Any] = {}
+    old_ids = {card["instance_id"] for card in old}
+    new_ids = {card["instance_id"] for card in new}
+    added = [card for card in new if card["instance_id"] not in old_ids]
+    if added:
+        delta["hand_add"] = added
+    removed = sorted(old_ids - new_ids)
+    if removed:
+        delta["hand_remove"] = removed
+    return delta
+
+
+def diff_private(old: dict, new: dict) -> dict:
+    """The change in one player's private view (see GameEngine.private_dict)."""
+    delta: Dict[str, Any] = {"seat": new["seat"]}
+    delta.update(_diff_hand(old.get("hand", []), new["hand"]))
+    if old.get("legal_moves") != new.get("legal_moves"):
+        delta["legal_moves"] = new.get("legal_moves")
+    return delta
+
+
+def apply_delta(state: dict, delta: dict) -> dict:
+    """Apply a delta to a state in place and return it.
+
+    Raises DeltaGap when the state is not the delta's base, e.g. after a
+    missed update; the caller should then ask for the full state.
+    """
+    if state.get("state_version") != delta.get("base"):
+        raise DeltaGap(f"State is at version {state.get('state_version')}, delta is based on {delta.get('base')}")
+
+    state.update(delta.get("set", {}))
+    players: List[dict] = state.setdefault("players", [])
+    for index, player_delta in delta.get("players", {}).items():
+        index = int(index)
+        while len(players) <= index:
+            players.append({"organs": {}, "hand": []})
+        _apply_player(players[index], player_delta)
+    state["state_version"] = delta.get("version")
+    return state
+
+
+def _apply_player(player: dict, delta: dict):
+    player.update(delta.get("set", {}))
+
+    organs = player.setdefault("organs", {})
+    for organ_type, changes in delta.get("organs", {}).items():
+        if changes is None:
+            organs.pop(organ_type, None)
+        elif organ_type in organs:
+            organs[organ_type].update(changes)
+        else:
+            organs[organ_type] = changes
+
+    _apply_hand(player, delta)
+
+
+def _apply_hand(player: dict, delta: dict):
+    if "hand_add" not in delta and "hand_remove" not in delta:
+        return
+    removed = set(delta.get("hand_remove", ()))
+    hand = [card for card in player.get("hand", []) if card["instance_id"] not in removed]
+    hand.extend(delta.get("hand_add", ()))
+    player["hand"] = hand
+
+
+def apply_private(state: dict, private: dict) -> dict:
+    """Merge a player's private view into the public state in place and return it.
+
+    Takes either a full private view or a diff_private() delta; the delta
+    must come with the public delta it was sent with, applied first.
+    """
+    player = state["players"][private["seat"]]
+    if "hand" in private:
+        player["hand"] = list(private["hand"])
+    else:
+        _apply_hand(player, private)
+    if "legal_moves" in private:
+        state["legal_moves"] = private["legal_moves"]
+    return state
@@ -0,0 +1,325 @@
+"""
+Streaming simulation statistics for the Organ Attack card game.
+Aggregates games as they are played into fixed-size counters and mergeable
+quantile sketches, so memory does not grow with the number of games, and
+exports the summary as JSON or CSV.
+"""
+
+import csv
+import json
+import math
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from game.models import ActionType, GameAction
+from game.rules import MAX_ORGAN_SLOTS
+
+# Points on an exported survival curve
+SURVIVAL_POINTS = 20
+
+
+class QuantileSketch:
+    """Quantiles of a stream of non-negative values, within a relative error.
+
+    Values fall into logarithmic buckets (as in DDSketch), so the sketch holds
+    a few hundred counters whatever the number of values, and two sketches
+    with the same accuracy merge exactly with +=. Count, sum, min and max are
+    kept exactly.
+    """
+
+    __slots__ = ('relative_accuracy', '_log_gamma', 'buckets', 'zeros', 'count', 'total', 'min', 'max')
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("Relative accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self._log_gamma = math.log((1 + relative_accuracy) / (1 - relative_accuracy))
+        self.buckets: Counter = Counter()
+        self.zeros = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def _key(self, value: float) -> int:
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _value(self, key: int) -> float:
+        # Midpoint of the bucket, which is within the relative error of everything in it
+        return 2 * math.exp(key * self._log_gamma) / (1 + math.exp(self._log_gamma))
+
+    def add(self, value: float, count: int = 1):
+        if value < 0:
+            raise ValueError("QuantileSketch only holds non-negative values")
+        if value == 0:
+            self.zeros += count
+        else:
+            self.buckets[self._key(value)] += count
+        self.count += count
+        self.total += value * count
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def update(self, values: Iterable[float]):
+        for value in values:
+            self.add(value)
+
+    def __iadd__(self, other: "QuantileSketch") -> "QuantileSketch":
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different accuracies")
+        self.buckets.update(other.buckets)
+        self.zeros += other.zeros
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, fraction: float) -> float:
+        """Value at the given fraction of the stream, e.g. 0.5 for the median."""
+        if not self.count:
+            return 0.0
+        rank = fraction * (self.count - 1)
+        seen = self.zeros
+        if rank < seen:
+            return 0.0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if rank < seen:
+                return min(max(self._value(key), self.min), self.max)
+        return self.max
+
+    def cdf(self, value: float) -> float:
+        """Approximate fraction of the stream at or below value."""
+        if not self.count or value < 0:
+            return 0.0
+        if value == 0:
+            return self.zeros / self.count
+        limit = self._key(value)
+        return (self.zeros + sum(n for key, n in self.buckets.items() if key <= limit)) / self.count
+
+    def to_dict(self) -> dict:
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "buckets": {str(key): n for key, n in sorted(self.buckets.items())},
+            "zeros": self.zeros,
+            "count": self.count,
+            "total": self.total,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "QuantileSketch":
+        sketch = cls(data.get("relative_accuracy", 0.01))
+        sketch.buckets = Counter({int(key): n for key, n in data.get("buckets", {}).items()})
+        sketch.zeros = data.get("zeros", 0)
+        sketch.count = data.get("count", 0)
+        sketch.total = data.get("total", 0.0)
+        if sketch.count:
+            sketch.min = data["min"]
+            sketch.max = data["max"]
+        return sketch
+
+
+@dataclass
+class SimulationStats:
+    """Aggregated results of a batch of games. Batches merge with +=.
+
+    Every field is a counter keyed by something bounded (seat, card, organ,
+    loss order) or a sketch, so a million games take no more memory than one.
+    """
+    games: int = 0
+    draws: int = 0
+    turns: int = 0
+    # Seats played across all games; the denominator of the survival curve
+    player_games: int = 0
+    wins_by_seat: Counter = field(default_factory=Counter)
+    game_lengths: QuantileSketch = field(default_factory=QuantileSketch)
+    card_plays: Counter = field(default_factory=Counter)
+    # Plays of each card made by the player who went on to win
+    card_winner_plays: Counter = field(default_factory=Counter)
+    elimination_turns: QuantileSketch = field(default_factory=QuantileSketch)
+    # (n, organ type): organs of that type that were a player's nth organ lost, from 0
+    organ_losses: Counter = field(default_factory=Counter)
+    elapsed: float = 0.0
+    worker: Optional[int] = None
+
+    def __iadd__(self, other: "SimulationStats") -> "SimulationStats":
+        self.games += other.games
+        self.draws += other.draws
+        self.turns += other.turns
+        self.player_games += other.player_games
+        self.wins_by_seat.update(other.wins_by_seat)
+        self.game_lengths += other.game_lengths
+        self.card_plays.update(other.card_plays)
+        self.card_winner_plays.update(other.card_winner_plays)
+        self.elimination_turns += other.elimination_turns
+        self.organ_losses.update(other.organ_losses)
+        self.elapsed += other.elapsed
+        return self
+
+    def survival_curve(self, points: int = SURVIVAL_POINTS) -> List[Tuple[int, float]]:
+        """(turn, share of players not yet eliminated) from turn 0 to the longest game."""
+        last = int(self.game_lengths.max) if self.game_lengths.count else 0
+        step = max(1, math.ceil(last / points))
+        eliminated = self.elimination_turns
+        seats = self.player_games or 1
+        return [(turn, 1.0 - eliminated.cdf(turn) * eliminated.count / seats)
+                for turn in range(0, last + step, step)]
+
+    def card_summary(self) -> Dict[str, Dict[str, float]]:
+        """Plays per game and the share of each card's plays made by the eventual winner."""
+        games = self.games or 1
+        return {
+            name: {
+                "plays": plays,
+                "plays_per_game": plays / games,
+                "winner_share": self.card_winner_plays[name] / plays,
+            }
+            for name, plays in self.card_plays.most_common()
+        }
+
+    def organ_loss_order(self) -> Dict[str, Dict[int, float]]:
+        """For each nth organ lost, the share of each organ type among those losses."""
+        totals: Counter = Counter()
+        for (order, _), n in self.organ_losses.items():
+            totals[order] += n
+        summary: Dict[str, Dict[int, float]] = {}
+        for (order, organ_type), n in sorted(self.organ_losses.items()):
+            summary.setdefault(organ_type, {})[order] = n / totals[order]
+        return summary
+
+    def summary(self) -> dict:
+        """Everything worth reporting, in plain JSON-ready types."""
+        games = self.games or 1
+        lengths, eliminations = self.game_lengths, self.elimination_turns
+        return {
+            "games": self.games,
+            "draws": self.draws,
+            "turns": self.turns,
+            "elapsed": self.elapsed,
+            "win_rate_by_seat": {seat: wins / games for seat, wins in sorted(self.wins_by_seat.items())},
+            "game_length": _quantile_summary(lengths),
+            "elimination_turn": _quantile_summary(eliminations),
+            "survival": self.survival_curve(),
+            "cards": self.card_summary(),
+            "organ_loss_order": self.organ_loss_order(),
+        }
+
+    def write_json(self, path: str):
+        """Write the summary, plus the mergeable raw counters, as JSON."""
+        data = self.summary()
+        data["sketches"] = {
+            "game_length": self.game_lengths.to_dict(),
+            "elimination_turn": self.elimination_turns.to_dict(),
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+
+    def write_csv(self, path: str):
+        """Write the summary as flat (section, key, metric, value) rows."""
+        summary = self.summary()
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(["section", "key", "metric", "value"])
+            for metric in ("games", "draws", "turns", "elapsed"):
+                writer.writerow(["run", "", metric, summary[metric]])
+            for seat, rate in summary["win_rate_by_seat"].items():
+                writer.writerow(["seat", seat, "win_rate", rate])
+            for section in ("game_length", "elimination_turn"):
+                for metric, value in summary[section].items():
+                    writer.writerow([section, "", metric, value])
+            for turn, alive in summary["survival"]:
+                writer.writerow(["survival", turn, "alive", alive])
+            for name, card in summary["cards"].items():
+                for metric, value in card.items():
+                    writer.writerow(["card", name, metric, value])
+            for organ_type, orders in summary["organ_loss_order"].items():
+                for order, share in orders.items():
+                    writer.writerow(["organ_loss", organ_type, f"loss_{order + 1}_share", share])
+
+
+def _quantile_summary(sketch: QuantileSketch) -> Dict[str, float]:
+    return {
+        "count": sketch.count,
+        "mean": sketch.mean,
+        "p10": sketch.quantile(0.1),
+        "p50": sketch.quantile(0.5),
+        "p90": sketch.quantile(0.9),
+        "max": sketch.max if sketch.count else 0,
+    }
+
+
+class GameRecorder:
+    """Feeds one game's actions into a SimulationStats as they are applied.
+
+    Only bounded per-game state is kept: each seat's plays by card and the
+    organ types each player still has, to spot losses and their order.
+    """
+
+    def __init__(self, engine, stats: SimulationStats):
+        self.engine = engine
+        self.stats = stats
+        self._seats = {player.name: seat for seat, player in enumerate(engine.players)}
+        self._plays: Counter = Counter()
+        self._organs = {player.name: self._organ_types(player) for player in engine.players}
+        self._lost = Counter()
+        self._alive = len(engine.get_active_players())
+
+    @staticmethod
+    def _organ_types(player) -> frozenset:
+        return frozenset(organ.organ_type for organ in player.get_available_organs())
+
+    def record_action(self, action: GameAction, result: dict):
+        """Account for an action engine.apply() has just processed."""
+        if action.type != ActionType.PLAY_CARD or not result.get("success"):
+            return
+        self.stats.card_plays[result["card_played"]] += 1
+        self._plays[self._seats[action.player], result["card_played"]] += 1
+
+        if action.target_player is not None:
+            touched = (self.engine.get_player(action.target_player), self.engine.get_player(action.player))
+        else:
+            touched = self.engine.players
+        for player in touched:
+            before = self._organs[player.name]
+            if player.alive_organ_count() == len(before):
+                continue
+            after = self._organ_types(player)
+            for organ_type in sorted(before - after):
+                order = min(self._lost[player.name], MAX_ORGAN_SLOTS - 1)
+                self.stats.organ_losses[order, organ_type] += 1
+                self._lost[player.name] += 1
+            self._organs[player.name] = after
+
+    def end_turn(self):
+        """Count eliminations at the end of a turn."""
+        remaining = len(self.engine.get_active_players())
+        if remaining < self._alive:
+            self.stats.elimination_turns.add(self.engine.turn_count, self._alive - remaining)
+            self._alive = remaining
+
+    def finish(self):
+        """Record the finished game."""
+        stats, engine = self.stats, self.engine
+        stats.games += 1
+        stats.turns += engine.turn_count
+        stats.player_games += len(engine.players)
+        stats.game_lengths.add(engine.turn_count)
+        if engine.winner is None:
+            stats.draws += 1
+            return
+        winner_seat = self._seats[engine.winner.name]
+        stats.wins_by_seat[winner_seat] += 1
+        for (seat, card_name), plays in self._plays.items():
+            if seat == winner_seat:
+                stats.card_winner_plays[card_name] += plays
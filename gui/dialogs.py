@@ -206,6 +206,8 @@ class NewGameDialog:
         self.parent = parent
         self.result: Optional[List[str]] = None
         self.player_entries: List[tk.Entry] = []
+        self.computer_entries: List[tk.Entry] = []
+        self.computer_players: List[str] = []
         self.width = 400
         self.height = 350
         self.dimensions = f"{self.width}x{self.height}"
@@ -258,6 +260,10 @@ class NewGameDialog:
                                 command=self._add_player)
         add_button.pack(side=tk.LEFT)
 
+        computer_button = ttk.Button(button_frame, text="Add Computer",
+                                     command=self._add_computer)
+        computer_button.pack(side=tk.LEFT, padx=(10, 0))
+
         remove_button = ttk.Button(button_frame, text="Remove Player",
                                    command=self._remove_player)
         remove_button.pack(side=tk.LEFT, padx=(10, 0))
@@ -283,7 +289,7 @@ class NewGameDialog:
 
         self.dialog.wait_window()
 
-    def _add_player_entry(self, placeholder: str = ""):
+    def _add_player_entry(self, placeholder: str = "") -> ttk.Entry:
         """Add a new player entry field."""
         entry = ttk.Entry(self.entries_frame, font=('Arial', 11))
         entry.pack(fill=tk.X, pady=2)
@@ -291,16 +297,25 @@ class NewGameDialog:
             entry.insert(0, placeholder)
 
         self.player_entries.append(entry)
+        return entry
 
     def _add_player(self):
         """Add another player entry."""
         if len(self.player_entries) < 4:
             self._add_player_entry(f"Player {len(self.player_entries) + 1}")
 
+    def _add_computer(self):
+        """Add a computer-controlled player entry."""
+        if len(self.player_entries) < 4:
+            entry = self._add_player_entry(f"Computer {len(self.computer_entries) + 1}")
+            self.computer_entries.append(entry)
+
     def _remove_player(self):
         """Remove the last player entry."""
         if len(self.player_entries) > 2:
             entry = self.player_entries.pop()
+            if entry in self.computer_entries:
+                self.computer_entries.remove(entry)
             entry.destroy()
         else:
             messagebox.showwarning("Warning", "At least 2 players required!")
@@ -328,6 +343,8 @@ class NewGameDialog:
                 "Error", "Player names must be 20 characters or less!")
             return
 
+        self.computer_players = [entry.get().strip() for entry in self.computer_entries
+                                 if entry.get().strip()]
         self.result = names
         self.dialog.destroy()
 
@@ -2,13 +2,15 @@ import tkinter as tk
 import asyncio
 import threading
 from tkinter import messagebox, ttk
-from typing import List, Optional
+from typing import Dict, List, Optional
 
+from game.bots import Bot, create_bot
 from game.game_board import GameBoard
 from game.game_engine import GameEngine
+from game.hand import Hand
 from gui.dialogs import NewGameDialog, HostGameDialog, JoinGameDialog
 from gui.player_panel import PlayerPanel
-from game.models import GameState
+from game.models import ActionType, GameAction, GameState
 
 try:
     from server.client import OnlineGameManager
@@ -59,6 +61,9 @@ def _run_async(coro):
 import logging
 logger = logging.getLogger(__name__)
 
+# Pause before a computer player moves so its turn is visible
+BOT_TURN_DELAY_MS = 800
+
 RULES_TEXT = """ORGAN ATTACK - How to Play
 
 GOAL:
@@ -116,11 +121,14 @@ class MainWindow(tk.Tk):
         self.engine: Optional[GameEngine] = None
         self.game_board: Optional[GameBoard] = None
         self.player_panels: List[PlayerPanel] = []
+        self.bots: Dict[str, Bot] = {}
 
         # Online game state
         self.online_manager: Optional[OnlineGameManager] = None
         self.is_online_game: bool = False
         self.lobby_window: Optional[tk.Toplevel] = None
+        # Card counts of online opponents, whose hands the server doesn't send
+        self.hand_sizes: Dict[str, int] = {}
 
         # GUI elements
         self.main_frame = None
@@ -148,9 +156,11 @@ class MainWindow(tk.Tk):
             player_names = dialog.result
             try:
                 self.engine = GameEngine(player_names)
+                self.bots = {name: create_bot(name) for name in dialog.computer_players}
                 self.is_online_game = False
                 self._setup_game_interface()
                 self._update_status("New game started!")
+                self._schedule_bot_turn()
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to start game: {e}")
 
@@ -315,6 +325,7 @@ class MainWindow(tk.Tk):
 
         self.engine.current_player_index = game_state.get("current_player_index", 0)
         self.engine.turn_count = game_state.get("turn_count", 0)
+        self.engine.state_version = game_state.get("state_version", self.engine.state_version + 1)
 
         # Restore player states
         for i, player_data in enumerate(game_state.get("players", [])):
@@ -327,22 +338,23 @@ class MainWindow(tk.Tk):
                         organ.is_removed = org_data.get("is_removed", False)
                         organ.is_protected = org_data.get("is_protected", False)
                         organ.protection_source = org_data.get("protection_source")
-                # Update hand
-                engine_player.hand = []
-                for card_data in player_data.get("hand", []):
-                    from game.models import Card, CardType
-                    card = Card(
-                        id=card_data["id"],
-                        name=card_data["name"],
-                        type=CardType(card_data["type"]),
-                        description=card_data.get("description", "")
-                    )
-                    engine_player.hand.append(card)
+                engine_player.recount_organs()
+                # Update hand; only our own comes with its cards
+                engine_player.hand = Hand(
+                    engine_player.card_from_dict(self.online_manager.client.card(card_data))
+                    for card_data in player_data.get("hand", [])
+                )
+                if "hand" in player_data:
+                    self.hand_sizes.pop(engine_player.name, None)
+                else:
+                    self.hand_sizes[engine_player.name] = player_data.get("hand_size", 0)
                 # Update status
                 from game.models import PlayerStatus
                 engine_player.status = PlayerStatus(player_data.get("status", "active"))
                 engine_player.skip_next_turn = player_data.get("skip_next_turn", False)
 
+        self.engine.sync_players()
+
         # Update game state
         gs = game_state.get("game_state")
         if gs is not None:
@@ -575,15 +587,22 @@ class MainWindow(tk.Tk):
             # Send action to server
             target_name = target_player.name if target_player else None
             _run_async(self.online_manager.play_card(
-                current_player.name, card.id, target_name, target_organ
+                current_player.name, card.id, target_name, target_organ,
+                instance_id=card.instance_id
             ))
         else:
             # Local game: process directly
-            current_player.remove_card_from_hand(card)
-            results = self.engine.effect_processor.process_card_effects(
-                card, current_player, target_player, target_organ
-            )
-            self.engine.discard_pile.append(card)
+            result = self.engine.apply(GameAction(
+                type=ActionType.PLAY_CARD,
+                player=current_player.name,
+                instance_id=card.instance_id,
+                target_player=target_player.name if target_player else None,
+                target_organ=target_organ
+            ))
+            if not result.get("success"):
+                self._update_status(result.get("error", "Could not play card"))
+                self._update_game_display()
+                return
 
         self._update_status(f"Played {card.name}")
         self._update_game_display()
@@ -595,11 +614,11 @@ class MainWindow(tk.Tk):
         if self.is_online_game and self.online_manager:
             _run_async(self.online_manager.draw_card(current_player.name))
         else:
-            card = self.engine.draw_card_for_player(current_player)
-            if card:
-                self._update_status(f"Drew {card.name}")
+            result = self.engine.apply(GameAction(ActionType.DRAW_CARD, current_player.name))
+            if result.get("success"):
+                self._update_status(f"Drew {result['card_drawn']}")
             else:
-                self._update_status("No cards left to draw")
+                self._update_status(result.get("error", "No cards left to draw"))
 
         self._update_game_display()
 
@@ -616,58 +635,41 @@ class MainWindow(tk.Tk):
             self._advance_turn_local()
 
         self._update_game_display()
+        self._schedule_bot_turn()
 
-    def _advance_turn_local(self):
-        """Advance turn for local games."""
-        # Remove non-permanent protections and expired Vaccination protections
-        for player in self.engine.players:
-            for organ in player.organs.values():
-                if organ.is_protected:
-                    # Strip non-Vaccination protections immediately
-                    if organ.protection_source and organ.protection_source != 'Vaccination':
-                        organ.is_protected = False
-                        organ.protection_source = None
-                        organ.protection_expires_at = None
-                    # Strip Vaccination protection if it has expired
-                    elif organ.protection_source == 'Vaccination' and organ.protection_expires_at is not None:
-                        if self.engine.turn_count >= organ.protection_expires_at:
-                            organ.is_protected = False
-                            organ.protection_source = None
-                            organ.protection_expires_at = None
-
-        # Check for game end
-        active_players = self.engine.get_active_players()
-        if len(active_players) == 1:
-            self.engine.game_state = GameState.DONE
-            winner = active_players[0]
-            self._update_status(f"Game over! Winner: {winner.name}")
-            self._update_game_display()
+    def _schedule_bot_turn(self):
+        """Let a computer player take its turn shortly, if it is one's turn."""
+        if self.is_online_game or not self.engine or self.engine.is_game_over():
             return
+        if self.engine.get_current_player().name in self.bots:
+            self.after(BOT_TURN_DELAY_MS, self._play_bot_turn)
 
-        # Advance to next non-eliminated player
-        num_players = len(self.engine.players)
-        for _ in range(num_players):
-            self.engine.current_player_index = (
-                self.engine.current_player_index + 1) % num_players
-            next_player = self.engine.get_current_player()
-            if not next_player.is_eliminated():
-                break
-
-        # Draw cards to replenish hand to 5
-        current_player = self.engine.get_current_player()
-        while len(current_player.hand) < 5:
-            card = self.engine.draw_card_for_player(current_player)
-            if not card:
-                break
+    def _play_bot_turn(self):
+        """Play the current computer player's turn and pass play on."""
+        if not self.engine or self.engine.is_game_over():
+            return
+        bot = self.bots.get(self.engine.get_current_player().name)
+        if not bot:
+            return
 
-        # Reset turn counters
-        current_player.reset_turn_counters()
+        moves = bot.take_turn(self.engine)
+        played = [result["card_played"] for _, result in moves if result.get("card_played")]
+        if played:
+            self._update_status(f"{bot.name} played {', '.join(played)}")
+        self.advance_turn()
 
-        self.engine.game_state = GameState.PLAY
-        self.engine.turn_count += 1
+    def _advance_turn_local(self):
+        """Advance turn for local games."""
+        current_player = self.engine.get_current_player()
+        result = self.engine.apply(GameAction(ActionType.END_TURN, current_player.name))
 
-        self._update_status(
-            f"It's now {current_player.name}'s turn!")
+        if result.get("game_over"):
+            self._update_status(f"Game over! Winner: {result.get('winner')}")
+        elif result.get("extra_turn"):
+            self._update_status(f"{result['current_player']} gets an extra turn!")
+        else:
+            self._update_status(
+                f"It's now {result['current_player']}'s turn!")
 
     def _show_game_over(self):
         winner = None
@@ -96,7 +96,7 @@ class PlayerPanel(ttk.Frame):
 
         # Stats
         organs_count = len(self.player.get_available_organs())
-        hand_count = len(self.player.hand)
+        hand_count = self.main_window.hand_sizes.get(self.player.name, len(self.player.hand))
         stats_text = f"Organs: {organs_count} | Cards: {hand_count}"
         self.stats_label.config(text=stats_text)
 
@@ -12,6 +12,9 @@ from typing import Any, Callable, Dict, List, Optional
 import websockets
 from websockets.client import WebSocketClientProtocol
 
+from game.state_delta import DeltaGap, apply_delta, apply_private
+from server.outbox import EVICTED_CLOSE_CODE
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,13 +25,24 @@ class GameClient:
         self.server_url = server_url
         self.websocket: Optional[WebSocketClientProtocol] = None
         self.player_id: Optional[str] = None
+        # Secret the server gave us for taking our seat back after a disconnect
+        self.resume_token: Optional[str] = None
         self.is_host: bool = False
         self.current_lobby_code: Optional[str] = None
+        # Full game state, kept current by applying the server's deltas
+        self.game_state: Optional[Dict[str, Any]] = None
+        self._resync_pending = False
+        # Card definitions by id, for the id-only cards in hands and the discard pile
+        self.catalog: Dict[str, Dict[str, Any]] = {}
+        self.catalog_etag: Optional[str] = None
+        self._catalog_requested: Optional[str] = None
         self._listeners: Dict[str, List[Callable]] = {
             "connected": [],
             "disconnected": [],
             "lobby_created": [],
             "joined_lobby": [],
+            "resumed": [],
+            "evicted": [],
             "player_joined": [],
             "player_left": [],
             "player_ready": [],
@@ -38,6 +52,7 @@ class GameClient:
             "game_action": [],
             "lobby_info": [],
             "lobby_update": [],
+            "catalog": [],
             "error": [],
         }
         self._receive_task: Optional[asyncio.Task] = None
@@ -62,6 +77,7 @@ class GameClient:
             self.websocket = await websockets.connect(self.server_url)
             self._receive_task = asyncio.create_task(self._receive_loop())
             self._emit("connected", {})
+            await self.get_catalog()
             logger.info(f"Connected to {self.server_url}")
             return True
         except Exception as e:
@@ -99,16 +115,25 @@ class GameClient:
 
                 if msg_type == "lobby_created":
                     self.player_id = data.get("player_id")
+                    self.resume_token = data.get("resume_token")
                     self.is_host = data.get("is_host", False)
                     self.current_lobby_code = data.get("code")
                     self._emit("lobby_created", data)
 
                 elif msg_type == "joined_lobby":
                     self.player_id = data.get("player_id")
+                    self.resume_token = data.get("resume_token")
                     self.is_host = data.get("is_host", False)
                     self.current_lobby_code = data.get("code")
                     self._emit("joined_lobby", data)
 
+                elif msg_type == "resumed":
+                    self.player_id = data.get("player_id")
+                    self.resume_token = data.get("resume_token")
+                    self.is_host = data.get("is_host", False)
+                    self.current_lobby_code = data.get("code")
+                    self._emit("resumed", data)
+
                 elif msg_type == "player_joined":
                     self._emit("player_joined", data)
 
@@ -119,13 +144,17 @@ class GameClient:
                     self._emit("player_ready", data)
 
                 elif msg_type == "game_started":
+                    self._set_state(data)
                     self._emit("game_started", data)
 
                 elif msg_type == "game_state":
+                    self._set_state(data)
+                    self._resync_pending = False
                     self._emit("game_state", data)
 
                 elif msg_type == "game_state_update":
-                    self._emit("game_state_update", data)
+                    if self._apply_update(data):
+                        self._emit("game_state_update", data)
 
                 elif msg_type == "game_action":
                     self._emit("game_action", data)
@@ -136,12 +165,71 @@ class GameClient:
                 elif msg_type == "lobby_update":
                     self._emit("lobby_update", data)
 
+                elif msg_type == "catalog":
+                    self._set_catalog(data)
+                    self._emit("catalog", data)
+
                 elif msg_type == "error":
                     self._emit("error", data)
 
-        except websockets.exceptions.ConnectionClosed:
-            logger.info("Connection closed")
-            self._emit("disconnected", {})
+        except websockets.exceptions.ConnectionClosed as e:
+            if e.rcvd is not None and e.rcvd.code == EVICTED_CLOSE_CODE:
+                # The server dropped us for falling behind but kept our seat
+                logger.info(f"Evicted by server: {e.rcvd.reason}")
+                self._emit("evicted", {"player_id": self.player_id, "reason": e.rcvd.reason})
+            else:
+                logger.info("Connection closed")
+                self._emit("disconnected", {})
+
+    def _set_state(self, data: dict):
+        """Take a full state, merging this player's private view into it."""
+        self.game_state = data.get("game_state")
+        if self.game_state is not None and data.get("private"):
+            apply_private(self.game_state, data["private"])
+        etag = (self.game_state or {}).get("catalog")
+        if etag and etag != self.catalog_etag and etag != self._catalog_requested:
+            # The game uses cards we don't have, e.g. after the server reloaded them
+            self._catalog_requested = etag
+            asyncio.create_task(self.get_catalog())
+
+    def _set_catalog(self, data: dict):
+        """Take a catalog reply; an unchanged one means the cached catalog is current."""
+        if not data.get("unchanged"):
+            self.catalog = data.get("cards", {})
+        self.catalog_etag = data.get("etag")
+        self._catalog_requested = None
+
+    def card(self, card_data: dict) -> Dict[str, Any]:
+        """A hand or discard card, sent by id, filled in from the catalog."""
+        return {**self.catalog.get(card_data["id"], {"name": card_data["id"]}), **card_data}
+
+    def _apply_update(self, data: dict) -> bool:
+        """Bring game_state up to date from an update and fill in its full state.
+
+        Returns False for updates the state already includes, and for a gap
+        after a missed update, in which case the full state is requested.
+        """
+        if "delta" not in data:
+            self._set_state(data)
+            return True
+        delta = data["delta"]
+        if self._resync_pending:
+            return False
+        if self.game_state is not None and delta.get("version", 0) <= self.game_state.get("state_version", 0):
+            return False
+        try:
+            if self.game_state is None:
+                raise DeltaGap("No state to apply the delta to")
+            apply_delta(self.game_state, delta)
+            if data.get("private"):
+                apply_private(self.game_state, data["private"])
+        except DeltaGap as e:
+            logger.info(f"Resyncing game state: {e}")
+            self._resync_pending = True
+            asyncio.create_task(self.get_game_state())
+            return False
+        data["game_state"] = self.game_state
+        return True
 
     async def _send(self, message: dict):
         """Send a message to the server."""
@@ -172,6 +260,18 @@ class GameClient:
             "player_name": player_name
         })
 
+    async def resume(self) -> bool:
+        """Reconnect and take this client's seat back, e.g. after being evicted."""
+        if not self.player_id or not await self.connect():
+            return False
+        # Updates are ignored until the full state arrives
+        self._resync_pending = True
+        return await self._send({
+            "type": "resume",
+            "player_id": self.player_id,
+            "resume_token": self.resume_token
+        })
+
     async def leave_lobby(self):
         """Leave the current lobby."""
         return await self._send({
@@ -203,11 +303,13 @@ class GameClient:
         """Send draw card action to server."""
         return await self.send_game_action("draw_card", {"player_name": player_name})
 
-    async def play_card(self, player_name: str, card_id: str, target_player: str = None, target_organ: str = None):
+    async def play_card(self, player_name: str, card_id: str, target_player: str = None, target_organ: str = None,
+                        instance_id: int = None):
         """Send play card action to server."""
         return await self.send_game_action("play_card", {
             "player_name": player_name,
             "card_id": card_id,
+            "instance_id": instance_id,
             "target_player": target_player,
             "target_organ": target_organ
         })
@@ -222,6 +324,13 @@ class GameClient:
             "type": "get_lobby_info"
         })
 
+    async def get_catalog(self):
+        """Fetch the card catalog, unless the cached one is still current."""
+        return await self._send({
+            "type": "get_catalog",
+            "etag": self.catalog_etag
+        })
+
     async def get_game_state(self):
         """Get current game state."""
         return await self._send({
@@ -257,6 +366,7 @@ class OnlineGameManager:
         self.client.on("disconnected", self._on_disconnected)
         self.client.on("lobby_created", self._on_lobby_created)
         self.client.on("joined_lobby", self._on_joined_lobby)
+        self.client.on("evicted", self._on_evicted)
         self.client.on("player_joined", self._on_player_joined)
         self.client.on("player_left", self._on_player_left)
         self.client.on("player_ready", self._on_player_ready)
@@ -285,6 +395,10 @@ class OnlineGameManager:
         if players_data:
             self.current_players = players_data
 
+    def _on_evicted(self, data):
+        logger.warning(f"Dropped by the server ({data.get('reason')}); resuming")
+        asyncio.create_task(self.client.resume())
+
     def _on_player_joined(self, data):
         players_data = data.get("players", [])
         if players_data:
@@ -354,9 +468,10 @@ class OnlineGameManager:
         """Send draw card action to server."""
         await self.client.draw_card(player_name)
 
-    async def play_card(self, player_name: str, card_id: str, target_player: str = None, target_organ: str = None):
+    async def play_card(self, player_name: str, card_id: str, target_player: str = None, target_organ: str = None,
+                        instance_id: int = None):
         """Send play card action to server."""
-        await self.client.play_card(player_name, card_id, target_player, target_organ)
+        await self.client.play_card(player_name, card_id, target_player, target_organ, instance_id)
 
     async def end_turn(self, player_name: str):
         """Send end turn action to server."""
@@ -0,0 +1,157 @@
+"""
+Per-connection send queues for the game server.
+Each connection gets a bounded outbound queue drained by its own writer task,
+so a slow client only ever holds up itself. State updates that pile up are
+collapsed into one fresh full state, and a client that stays slow is
+disconnected with a close code that tells it to resume.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+import websockets
+
+logger = logging.getLogger(__name__)
+
+# Frames a connection may have waiting before its state updates are collapsed
+MAX_QUEUE = 64
+# Seconds one send may take before the client counts as stalled
+SEND_TIMEOUT = 10.0
+
+# Close code and reason for an evicted client; it may reconnect and send
+# {"type": "resume", "player_id": ..., "resume_token": ...} to take its seat back
+EVICTED_CLOSE_CODE = 4008
+EVICTED_REASON = "Too slow to keep up; reconnect and resume"
+
+# Queue entry kinds: a plain frame, a state update, or a full-state snapshot built when sent
+FRAME, STATE, SNAPSHOT = range(3)
+
+Snapshot = Callable[[], str]
+
+
+class Outbox:
+    """Bounded outbound queue and writer task for one websocket."""
+
+    def __init__(self, websocket, name: Optional[str] = None, max_queue: int = MAX_QUEUE,
+                 send_timeout: float = SEND_TIMEOUT):
+        self.websocket = websocket
+        self.name = name
+        self.max_queue = max_queue
+        self.send_timeout = send_timeout
+        # (kind, frame or snapshot, snapshot for state updates)
+        self._queue: Deque[Tuple[int, Any, Optional[Snapshot]]] = deque()
+        self._ready = asyncio.Event()
+        self._snapshot_pending = False
+        self.closed = False
+        self.evicted = False
+        self.sent = 0
+        self.dropped = 0
+        self.max_depth = 0
+        self._task = asyncio.create_task(self._run())
+
+    def send(self, frame: str):
+        """Queue an encoded frame.
+
+        If the queue is full and collapsing its state updates frees no room,
+        the client is evicted.
+        """
+        if self.closed:
+            return
+        if len(self._queue) >= self.max_queue:
+            self._collapse()
+            if len(self._queue) >= self.max_queue:
+                self.evict()
+                return
+        self._push(FRAME, frame)
+
+    def send_state(self, frame: str, snapshot: Snapshot):
+        """Queue a state update.
+
+        snapshot() encodes the full current state; if updates back up, one
+        snapshot replaces them all.
+        """
+        if self.closed:
+            return
+        if self._snapshot_pending:
+            # The snapshot is built when sent, so it will include this update
+            self.dropped += 1
+            return
+        if len(self._queue) >= self.max_queue:
+            if not self._collapse():
+                self.evict()
+                return
+            # The snapshot just queued covers this update as well
+            self.dropped += 1
+            return
+        self._push(STATE, frame, snapshot)
+
+    def _push(self, kind: int, frame: Any, snapshot: Optional[Snapshot] = None):
+        self._queue.append((kind, frame, snapshot))
+        self.max_depth = max(self.max_depth, len(self._queue))
+        self._ready.set()
+
+    def _collapse(self) -> bool:
+        """Replace every queued state update with one snapshot; False if there were none."""
+        updates = [entry for entry in self._queue if entry[0] == STATE]
+        if not updates:
+            return False
+        self._queue = deque(entry for entry in self._queue if entry[0] != STATE)
+        self.dropped += len(updates)
+        self._queue.append((SNAPSHOT, updates[-1][2], None))
+        self._snapshot_pending = True
+        return True
+
+    async def _run(self):
+        while True:
+            if not self._queue:
+                self._ready.clear()
+                await self._ready.wait()
+                continue
+            kind, frame, _ = self._queue.popleft()
+            if kind == SNAPSHOT:
+                self._snapshot_pending = False
+                frame = frame()
+            try:
+                await asyncio.wait_for(self._write(frame), self.send_timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"Send to {self.name} took over {self.send_timeout}s")
+                self.evict()
+                return
+            except websockets.exceptions.ConnectionClosed:
+                self.close()
+                return
+            except Exception as e:
+                logger.error(f"Error sending to {self.name}: {e}")
+                continue
+            self.sent += 1
+
+    async def _write(self, frame: str):
+        await self.websocket.send(frame)
+
+    def evict(self):
+        """Drop everything queued and disconnect the client, telling it to resume."""
+        if self.closed:
+            return
+        logger.warning(f"Evicting slow client {self.name} with {len(self._queue)} frames queued")
+        self.evicted = True
+        self.dropped += len(self._queue)
+        self.close()
+        asyncio.ensure_future(self.websocket.close(EVICTED_CLOSE_CODE, EVICTED_REASON))
+
+    def close(self):
+        """Stop the writer; anything still queued is discarded."""
+        self.closed = True
+        self._queue.clear()
+        if self._task is not asyncio.current_task():
+            self._task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "depth": len(self._queue),
+            "max_depth": self.max_depth,
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "evicted": self.evicted,
+        }
@@ -8,11 +8,13 @@ import asyncio
 import json
 import logging
 import random
+import secrets
 import string
 import uuid
+from functools import partial
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import websockets
 from websockets.server import WebSocketServerProtocol
@@ -22,7 +24,28 @@ logger = logging.getLogger(__name__)
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from game.game_engine import GameEngine
+from game.catalog import get_catalog
+from game.event_log import EventLog
+from game.game_engine import GameEngine, new_seed
+from game.journal import ActionJournal
+from game.models import ActionType, GameAction
+from game.state_delta import diff_private, diff_state
+from server.outbox import Outbox
+
+
+# Directory for per-game event spill files; unset keeps only recent events in memory
+EVENT_LOG_DIR = os.environ.get("ORGAN_ATTACK_EVENT_LOG_DIR")
+# Directory for per-game action journals, for crash recovery and replays
+JOURNAL_DIR = os.environ.get("ORGAN_ATTACK_JOURNAL_DIR")
+# Action result fields that name cards going into the actor's hand; only the actor sees them
+PRIVATE_RESULT_KEYS = ("card_drawn",)
+
+
+def _split_result(result: dict) -> Tuple[dict, dict]:
+    """Split an action result into the part every player sees and the actor's own part."""
+    shared = {key: value for key, value in result.items() if key not in PRIVATE_RESULT_KEYS}
+    private = {key: result[key] for key in PRIVATE_RESULT_KEYS if key in result}
+    return shared, private
 
 
 def generate_game_code() -> str:
@@ -36,6 +59,11 @@ def generate_player_id() -> str:
     return str(uuid.uuid4())
 
 
+def generate_resume_token() -> str:
+    """Generate the secret a player presents to resume their seat."""
+    return secrets.token_urlsafe(24)
+
+
 @dataclass
 class Player:
     """Represents a player in an online game."""
@@ -44,6 +72,8 @@ class Player:
     websocket: Optional[WebSocketServerProtocol] = None
     is_ready: bool = False
     is_host: bool = False
+    # Sent only to this player's own connection; player ids are shown to the whole lobby
+    resume_token: str = field(default_factory=generate_resume_token)
 
 
 @dataclass
@@ -57,6 +87,13 @@ class GameLobby:
     created_at: datetime = field(default_factory=datetime.now)
     last_activity: datetime = field(default_factory=datetime.now)
     game_engine: Optional[GameEngine] = None
+    # Seed of the current game; each game start draws a new one
+    seed: Optional[int] = None
+    journal: Optional[ActionJournal] = None
+    # The public state and each player's private view as last sent; the next
+    # update is a delta from them
+    sent_state: Optional[Dict[str, Any]] = None
+    sent_private: Dict[str, Dict[str, Any]] = field(default_factory=dict)
 
     def is_full(self) -> bool:
         return len(self.players) >= self.max_players
@@ -69,6 +106,24 @@ class GameLobby:
         """Update last activity timestamp."""
         self.last_activity = datetime.now()
 
+    def event_log_stats(self) -> Dict[str, Any]:
+        """Size of the running game's event log, for lobby info."""
+        if not self.game_engine:
+            return {"events": 0, "in_memory": 0, "memory_bytes": 0}
+        log = self.game_engine.event_log
+        return {
+            "events": len(log),
+            "in_memory": len(log) - log.first_in_memory,
+            "memory_bytes": log.memory_bytes()
+        }
+
+    def close(self):
+        """Release resources held by the lobby's game."""
+        if self.game_engine:
+            self.game_engine.event_log.close()
+        if self.journal:
+            self.journal.close()
+
 
 class LobbyManager:
     """Manages all game lobbies."""
@@ -131,6 +186,7 @@ class LobbyManager:
         lobby.players = [p for p in lobby.players if p.id != player_id]
 
         if not lobby.players:
+            lobby.close()
             del self.lobbies[code]
             return None
 
@@ -170,11 +226,15 @@ class GameServer:
         self.port = port
         self.lobby_manager = LobbyManager()
         self.active_connections: Dict[str, WebSocketServerProtocol] = {}
+        # Every open connection's send queue
+        self.outboxes: Dict[WebSocketServerProtocol, Outbox] = {}
         self._server = None
 
     async def handle_connection(self, websocket: WebSocketServerProtocol):
         """Handle a new WebSocket connection."""
         player_id = None
+        outbox = Outbox(websocket)
+        self.outboxes[websocket] = outbox
         try:
             async for message in websocket:
                 try:
@@ -192,6 +252,8 @@ class GameServer:
                     player_id = await self._handle_create_lobby(websocket, data)
                 elif msg_type == "join_lobby":
                     player_id = await self._handle_join_lobby(websocket, data)
+                elif msg_type == "resume":
+                    player_id = await self._handle_resume(websocket, data) or player_id
                 elif msg_type == "leave_lobby":
                     await self._handle_leave_lobby(websocket, data, player_id)
                 elif msg_type == "player_ready":
@@ -204,12 +266,23 @@ class GameServer:
                     await self._handle_get_game_state(websocket, data, player_id)
                 elif msg_type == "get_lobby_info":
                     await self._handle_get_lobby_info(websocket, data, player_id)
+                elif msg_type == "get_catalog":
+                    await self._handle_get_catalog(websocket, data, player_id)
 
         except websockets.exceptions.ConnectionClosed:
             logger.info("Connection closed")
         finally:
-            if player_id:
-                lobby = self.lobby_manager.get_lobby_by_player(player_id)
+            outbox.close()
+            self.outboxes.pop(websocket, None)
+            lobby = self.lobby_manager.get_lobby_by_player(player_id) if player_id else None
+            player = next((p for p in lobby.players if p.id == player_id), None) if lobby else None
+            # A player who has resumed on another connection keeps their seat, and
+            # so does an evicted one, until they resume
+            resumed = player is not None and player.websocket is not websocket
+            if player is not None and outbox.evicted and not resumed:
+                player.websocket = None
+                self.active_connections.pop(player_id, None)
+            elif player_id and not resumed:
                 lobby_code = lobby.code if lobby else None
                 self.lobby_manager.leave_lobby(player_id)
                 self.active_connections.pop(player_id, None)
@@ -223,11 +296,13 @@ class GameServer:
 
         player.websocket = websocket
         self.active_connections[player.id] = websocket
+        self.outboxes[websocket].name = player.name
 
         await self._send(websocket, {
             "type": "lobby_created",
             "code": lobby.code,
             "player_id": player.id,
+            "resume_token": player.resume_token,
             "is_host": True,
             "players": [{"id": p.id, "name": p.name, "is_host": p.is_host} for p in lobby.players]
         })
@@ -247,11 +322,13 @@ class GameServer:
 
         player.websocket = websocket
         self.active_connections[player.id] = websocket
+        self.outboxes[websocket].name = player.name
 
         await self._send(websocket, {
             "type": "joined_lobby",
             "code": lobby.code,
             "player_id": player.id,
+            "resume_token": player.resume_token,
             "is_host": False,
             "players": [{"id": p.id, "name": p.name, "is_host": p.is_host} for p in lobby.players]
         })
@@ -310,17 +387,28 @@ class GameServer:
             return
 
         player_names = [p.name for p in lobby.players]
-        lobby.game_engine = GameEngine(player_names)
+        # A fresh seed per game, so a restart deals a new game with its own journal and spill files
+        lobby.seed = new_seed()
+        game_id = f"{lobby.code}-{lobby.seed}"
+        spill_path = os.path.join(EVENT_LOG_DIR, f"{game_id}.jsonl") if EVENT_LOG_DIR else None
+        journal_path = os.path.join(JOURNAL_DIR, f"{game_id}.journal") if JOURNAL_DIR else None
+        lobby.close()
+        lobby.game_engine = GameEngine(player_names, seed=lobby.seed, event_log=EventLog(spill_path=spill_path))
+        lobby.journal = ActionJournal(lobby.seed, player_names, path=journal_path,
+                                      catalog_id=lobby.game_engine.card_manager.catalog.identity)
+        logger.info(f"Starting game {lobby.code} with seed {lobby.seed}")
         lobby.game_started = True
         lobby.touch()
 
-        game_state = lobby.game_engine.to_dict()
+        engine = lobby.game_engine
+        lobby.sent_state = engine.public_dict()
+        lobby.sent_private = {name: engine.private_dict(name) for name in player_names}
 
-        await self._broadcast_to_lobby(lobby.code, {
+        self._broadcast_views(lobby, {
             "type": "game_started",
-            "game_state": game_state,
-            "current_player": lobby.game_engine.get_current_player().name
-        })
+            "game_state": lobby.sent_state,
+            "current_player": engine.get_current_player().name
+        }, lobby.sent_private)
 
     async def _handle_game_action(self, websocket: WebSocketServerProtocol, data: dict, player_id: str):
         """Handle in-game actions. Server is authoritative — processes action on its engine."""
@@ -337,47 +425,63 @@ class GameServer:
         engine = lobby.game_engine
         lobby.touch()
 
-        # Find the player by name in the engine (server maps player_id -> engine player)
-        requesting_engine_player = None
-        for p in engine.players:
-            if p.name == action_data.get("player_name"):
-                requesting_engine_player = p
-                break
-
+        # The connection's own seat acts; a client can't act for anyone else by naming them
+        seat = next((p for p in lobby.players if p.id == player_id), None)
+        requesting_engine_player = engine.get_player(seat.name) if seat else None
         if not requesting_engine_player:
             await self._send(websocket, {"type": "error", "message": "Player not found in game"})
             return
+        claimed = action_data.get("player_name")
+        if claimed is not None and claimed != requesting_engine_player.name:
+            await self._send(websocket, {"type": "error", "message": "Cannot act for another player"})
+            return
 
-        result = None
+        try:
+            action_type = ActionType(action)
+        except ValueError:
+            await self._send(websocket, {"type": "error", "message": f"Unknown action: {action}"})
+            return
 
+        version = engine.state_version
         try:
-            if action == "draw_card":
-                result = self._process_draw_card(engine, requesting_engine_player)
-            elif action == "play_card":
-                result = self._process_play_card(engine, requesting_engine_player, action_data)
-            elif action == "discard_card":
-                result = self._process_discard_card(engine, requesting_engine_player, action_data)
-            elif action == "end_turn":
-                result = self._process_end_turn(engine)
-            elif action == "block_attack":
-                result = self._process_block_attack(engine, requesting_engine_player, action_data)
-            else:
-                await self._send(websocket, {"type": "error", "message": f"Unknown action: {action}"})
-                return
+            game_action = self._build_action(action_type, requesting_engine_player, action_data)
+            result = engine.apply(game_action)
+            if result.get("success"):
+                lobby.journal.record(game_action)
         except Exception as e:
             logger.error(f"Error processing action '{action}': {e}", exc_info=True)
             result = {"success": False, "error": str(e)}
 
-        # Always broadcast updated state, even if processing failed
-        try:
-            game_state = engine.to_dict()
-            await self._broadcast_to_lobby(lobby.code, {
-                "type": "game_state_update",
-                "game_state": game_state,
+        if not result.get("success"):
+            # A rejected action may leave the state version alone, and clients drop
+            # deltas they already have, so the actor hears about it directly
+            await self._send(websocket, {
+                "type": "error",
+                "message": result.get("error") or "Action failed",
                 "action": action,
-                "action_data": action_data,
                 "result": result
             })
+            if engine.state_version == version:
+                return
+            result = None
+
+        # Broadcast what changed, even if processing failed; clients that
+        # missed an update ask for the full state with get_game_state
+        try:
+            public = engine.public_dict()
+            delta = diff_state(lobby.sent_state or {}, public)
+            lobby.sent_state = public
+            private_deltas = {}
+            for name in engine.player_names:
+                private = engine.private_dict(name)
+                private_deltas[name] = diff_private(lobby.sent_private.get(name, {}), private)
+                lobby.sent_private[name] = private
+            message = {"type": "game_state_update", "delta": delta, "action": action, "action_data": action_data}
+            if result is not None:
+                message["result"], private_result = _split_result(result)
+                if private_result:
+                    private_deltas[requesting_engine_player.name]["result"] = private_result
+            self._broadcast_views(lobby, message, private_deltas, state_update=True)
         except Exception as e:
             logger.error(f"Error broadcasting state: {e}", exc_info=True)
             await self._send(websocket, {
@@ -385,206 +489,27 @@ class GameServer:
                 "message": f"Failed to update game state: {e}"
             })
 
-    def _process_draw_card(self, engine: GameEngine, player) -> dict:
-        """Process a draw card action on the server engine."""
-        if engine.game_state.value != 1:  # GameState.PLAY
-            return {"success": False, "error": "Not in play phase"}
-
-        card = engine.draw_card_for_player(player)
-        if card:
-            return {"success": True, "card_drawn": card.name}
-        return {"success": False, "error": "No cards to draw"}
-
-    def _process_play_card(self, engine: GameEngine, player, action_data: dict) -> dict:
-        """Process a play card action on the server engine. Max 2 cards per turn."""
-        if engine.game_state.value != 1:  # GameState.PLAY
-            return {"success": False, "error": "Not in play phase"}
-
-        if player.cards_played_this_turn >= 2:
-            return {"success": False, "error": "Already played 2 cards this turn"}
-
-        card_id = action_data.get("card_id")
-        target_player_name = action_data.get("target_player")
-        target_organ = action_data.get("target_organ")
-
-        # Find the card in the player's hand
-        card = None
-        for c in player.hand:
-            if c.id == card_id:
-                card = c
-                break
-
-        if not card:
-            return {"success": False, "error": "Card not in hand"}
-
-        # Validate card conditions
-        valid, reason = engine.card_manager.validate_card_play(card, player, engine)
-        if not valid:
-            return {"success": False, "error": reason}
-
-        # Find target player in engine
-        target_engine_player = None
-        if target_player_name:
-            for p in engine.players:
-                if p.name == target_player_name:
-                    target_engine_player = p
-                    break
-
-        # Validate target_organ_must_be_present condition
-        if card.conditions and card.conditions.target_organ_must_be_present:
-            if target_engine_player and target_organ:
-                if not target_engine_player.has_organ(target_organ):
-                    return {"success": False, "error": f"{target_engine_player.name} does not have {target_organ}"}
-
-        # Validate target organ is not protected for attacks
-        if target_engine_player and target_organ:
-            if card.conditions and not card.conditions.organ_must_not_be_protected:
-                pass  # Protection is checked in the effect processor
-            if card.conditions and card.conditions.organ_must_not_be_protected:
-                if target_engine_player.is_organ_protected(target_organ):
-                    return {"success": False, "error": f"{target_organ} is protected"}
-
-        # Remove card from hand
-        player.remove_card_from_hand(card)
-
-        # Process card effects
-        results = engine.effect_processor.process_card_effects(
-            card, player, target_engine_player, target_organ
+    def _build_action(self, action_type: ActionType, player, action_data: dict) -> GameAction:
+        """Translate a client action message into an engine action."""
+        instance_id = None
+        if action_type in (ActionType.PLAY_CARD, ActionType.DISCARD_CARD):
+            card = self._find_hand_card(player, action_data)
+            instance_id = card.instance_id if card else None
+
+        return GameAction(
+            type=action_type,
+            player=player.name,
+            instance_id=instance_id,
+            target_player=action_data.get("target_player"),
+            target_organ=action_data.get("target_organ")
         )
 
-        # Add card to discard pile
-        engine.discard_pile.append(card)
-
-        player.cards_played_this_turn += 1
-
-        return {
-            "success": True,
-            "card_played": card.name,
-            "cards_remaining": 2 - player.cards_played_this_turn,
-            "effects": results
-        }
-
-    def _process_discard_card(self, engine: GameEngine, player, action_data: dict) -> dict:
-        """Process discarding a card without playing it. Counts toward the 2-card limit."""
-        if engine.game_state.value != 1:  # GameState.PLAY
-            return {"success": False, "error": "Not in play phase"}
-
-        if player.cards_played_this_turn >= 2:
-            return {"success": False, "error": "Already played 2 cards this turn"}
-
-        card_id = action_data.get("card_id")
-
-        # Find the card in the player's hand
-        card = None
-        for c in player.hand:
-            if c.id == card_id:
-                card = c
-                break
-
-        if not card:
-            return {"success": False, "error": "Card not in hand"}
-
-        # Remove from hand and add to discard
-        player.remove_card_from_hand(card)
-        engine.discard_pile.append(card)
-        player.cards_played_this_turn += 1
-
-        return {
-            "success": True,
-            "card_discarded": card.name,
-            "cards_remaining": 2 - player.cards_played_this_turn
-        }
-
-    def _process_block_attack(self, engine: GameEngine, player, action_data: dict) -> dict:
-        """Process a block attack action."""
-        if engine.current_attack:
-            engine.current_attack['blocked'] = True
-            engine.current_attack['blocked_by'] = player.name
-            return {"success": True, "blocked_by": player.name}
-        return {"success": False, "error": "No attack to block"}
-
-    def _process_end_turn(self, engine: GameEngine) -> dict:
-        """Process end turn on the server engine."""
-        # Remove non-permanent protections and expired Vaccination protections
-        for player in engine.players:
-            for organ in player.organs.values():
-                if organ.is_protected:
-                    # Strip non-Vaccination protections immediately
-                    if organ.protection_source and organ.protection_source != 'Vaccination':
-                        organ.is_protected = False
-                        organ.protection_source = None
-                        organ.protection_expires_at = None
-                    # Strip Vaccination protection if it has expired
-                    elif organ.protection_source == 'Vaccination' and organ.protection_expires_at is not None:
-                        if engine.turn_count >= organ.protection_expires_at:
-                            organ.is_protected = False
-                            organ.protection_source = None
-                            organ.protection_expires_at = None
-
-        # Check if current player has an extra turn (Caffeine Rush)
-        current_player = engine.get_current_player()
-        if current_player.can_draw_extra:
-            # Grant extra turn: replenish hand, reset counters, stay on same player
-            current_player.can_draw_extra = False
-            while len(current_player.hand) < 5:
-                card = engine.draw_card_for_player(current_player)
-                if not card:
-                    break
-            current_player.reset_turn_counters()
-            engine.turn_count += 1
-            return {
-                "success": True,
-                "game_over": False,
-                "extra_turn": True,
-                "current_player": current_player.name,
-                "hand_size": len(current_player.hand)
-            }
-
-        # Check for game end
-        active_players = engine.get_active_players()
-        if len(active_players) <= 1:
-            engine.game_state = engine.game_state.DONE
-            winner = active_players[0] if active_players else None
-            return {
-                "success": True,
-                "game_over": True,
-                "winner": winner.name if winner else None
-            }
-
-        # Advance to next non-eliminated player, skipping those with skip_next_turn
-        num_players = len(engine.players)
-        for _ in range(num_players):
-            engine.current_player_index = (engine.current_player_index + 1) % num_players
-            next_player = engine.get_current_player()
-            if next_player.is_eliminated():
-                continue
-            if next_player.skip_next_turn:
-                next_player.skip_next_turn = False
-                continue
-            break
-
-        # Replenish hand to 5 cards for the new current player
-        current_player = engine.get_current_player()
-        cards_drawn = 0
-        while len(current_player.hand) < 5:
-            card = engine.draw_card_for_player(current_player)
-            if not card:
-                break
-            cards_drawn += 1
-
-        # Reset turn counters
-        current_player.reset_turn_counters()
-
-        engine.game_state = engine.game_state.PLAY
-        engine.turn_count += 1
-
-        return {
-            "success": True,
-            "game_over": False,
-            "current_player": current_player.name,
-            "cards_drawn": cards_drawn,
-            "hand_size": len(current_player.hand)
-        }
+    def _find_hand_card(self, player, action_data: dict):
+        """Find the card an action refers to, by instance id or (for older clients) card id."""
+        instance_id = action_data.get("instance_id")
+        if instance_id is not None:
+            return player.hand.get(instance_id)
+        return player.hand.find(action_data.get("card_id"))
 
     async def _handle_get_game_state(self, websocket: WebSocketServerProtocol, data: dict, player_id: str):
         """Get current game state."""
@@ -596,10 +521,65 @@ class GameServer:
             await self._send(websocket, {"type": "error", "message": "Game not started"})
             return
 
-        await self._send(websocket, {
+        player = next(p for p in lobby.players if p.id == player_id)
+        await self._send(websocket, self._state_message(lobby, player.name))
+
+    def _state_message(self, lobby: GameLobby, player_name: str) -> dict:
+        """The full game state as one player sees it."""
+        engine = lobby.game_engine
+        return {
             "type": "game_state",
-            "game_state": lobby.game_engine.to_dict()
+            "game_state": engine.public_dict(),
+            "private": engine.private_dict(player_name) if engine.get_player(player_name) else None
+        }
+
+    async def _handle_resume(self, websocket: WebSocketServerProtocol, data: dict) -> Optional[str]:
+        """Put a player back in their seat on this connection, e.g. after being evicted."""
+        player_id = data.get("player_id")
+        lobby = self.lobby_manager.get_lobby_by_player(player_id) if player_id else None
+        player = next((p for p in lobby.players if p.id == player_id), None) if lobby else None
+        token = data.get("resume_token")
+        if not player or not isinstance(token, str) or not secrets.compare_digest(token, player.resume_token):
+            await self._send(websocket, {"type": "error", "message": "Nothing to resume"})
+            return None
+
+        # A connection the player left behind is dropped without giving up the seat
+        previous = self.outboxes.get(player.websocket) if player.websocket is not websocket else None
+        if previous:
+            previous.evict()
+        player.websocket = websocket
+        self.active_connections[player.id] = websocket
+        self.outboxes[websocket].name = player.name
+        lobby.touch()
+
+        await self._send(websocket, {
+            "type": "resumed",
+            "code": lobby.code,
+            "player_id": player.id,
+            "resume_token": player.resume_token,
+            "is_host": player.is_host,
+            "players": [{"id": p.id, "name": p.name, "is_host": p.is_host} for p in lobby.players],
+            "game_started": lobby.game_started
         })
+        if lobby.game_engine:
+            await self._send(websocket, self._state_message(lobby, player.name))
+        return player.id
+
+    async def _handle_get_catalog(self, websocket: WebSocketServerProtocol, data: dict, player_id: Optional[str]):
+        """Send the card catalog, or just its etag if the client already has that version.
+
+        Players in a game get the catalog their game uses; everyone else the current one.
+        """
+        lobby = self.lobby_manager.get_lobby_by_player(player_id) if player_id else None
+        catalog = lobby.game_engine.card_manager.catalog if lobby and lobby.game_engine else get_catalog()
+        if data.get("etag") == catalog.etag:
+            await self._send(websocket, {"type": "catalog", "etag": catalog.etag, "unchanged": True})
+            return
+        # Spliced in rather than re-encoded; the catalog caches its encoding
+        header = json.dumps({"type": "catalog", "etag": catalog.etag, "version": catalog.version})
+        outbox = self.outboxes.get(websocket)
+        if outbox:
+            outbox.send(f'{header[:-1]}, "cards": {catalog.to_json()}}}')
 
     async def _handle_get_lobby_info(self, websocket: WebSocketServerProtocol, data: dict, player_id: str):
         """Get current lobby information."""
@@ -618,21 +598,62 @@ class GameServer:
                 {"id": p.id, "name": p.name, "is_ready": p.is_ready, "is_host": p.is_host}
                 for p in lobby.players
             ],
-            "game_started": lobby.game_started
+            "game_started": lobby.game_started,
+            "event_log": lobby.event_log_stats(),
+            "connections": {p.name: self._connection_stats(p) for p in lobby.players}
         })
 
+    def _connection_stats(self, player: Player) -> Optional[Dict[str, Any]]:
+        """Send queue depth and drop counters for a player's connection, or None if disconnected."""
+        outbox = self.outboxes.get(player.websocket)
+        return outbox.stats() if outbox else None
+
+    def connection_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Send queue stats for every open connection, by player name."""
+        return {outbox.name or "(no player)": outbox.stats() for outbox in self.outboxes.values()}
+
     async def _broadcast_to_lobby(self, code: str, message: dict, exclude_id: str = None):
         """Broadcast message to all players in a lobby."""
         lobby = self.lobby_manager.get_lobby(code)
         if not lobby:
             return
 
+        text = json.dumps(message)
+        self._fan_out([(player, text) for player in lobby.players if player.id != exclude_id])
+
+    def _broadcast_views(self, lobby: GameLobby, message: dict, private: Dict[str, Any],
+                         state_update: bool = False):
+        """Send a message to every player in a lobby, each with their own "private" entry.
+
+        The shared part is encoded once; only the small per-player part is
+        encoded per recipient and spliced in before the closing brace. State
+        updates may be collapsed into a full state for players who fall behind.
+        """
+        shared = json.dumps(message)[:-1]
         for player in lobby.players:
-            if player.id != exclude_id and player.websocket:
-                try:
-                    await self._send(player.websocket, message)
-                except Exception as e:
-                    logger.error(f"Error sending to {player.name}: {e}")
+            outbox = self.outboxes.get(player.websocket)
+            if not outbox:
+                continue
+            frame = f'{shared}, "private": {json.dumps(private.get(player.name))}}}'
+            if state_update:
+                outbox.send_state(frame, partial(self._encode_state, lobby, player.name))
+            else:
+                outbox.send(frame)
+
+    def _encode_state(self, lobby: GameLobby, player_name: str) -> str:
+        return json.dumps(self._state_message(lobby, player_name))
+
+    def _fan_out(self, frames: List[Tuple[Player, str]]):
+        """Queue encoded frames on their players' connections.
+
+        Nothing is awaited here: each connection's outbox writes from its own
+        task, so the sends run concurrently and a slow or failing one doesn't
+        hold up the others.
+        """
+        for player, text in frames:
+            outbox = self.outboxes.get(player.websocket)
+            if outbox:
+                outbox.send(text)
 
     async def _broadcast_lobby_update(self, lobby_code: str):
         """Broadcast lobby update to all players in lobby."""
@@ -647,14 +668,15 @@ class GameServer:
             })
 
     async def _send(self, websocket: WebSocketServerProtocol, message: dict):
-        """Send a message to a WebSocket."""
-        try:
-            await websocket.send(json.dumps(message))
-        except Exception as e:
-            logger.error(f"Error sending message: {e}")
+        """Queue a message on a WebSocket's connection."""
+        outbox = self.outboxes.get(websocket)
+        if outbox:
+            outbox.send(json.dumps(message))
 
     async def start(self):
         """Start the WebSocket server."""
+        # Load the shared card catalog up front so the first game start doesn't pay for it
+        get_catalog()
         self._server = await websockets.serve(
             self.handle_connection,
             self.host,
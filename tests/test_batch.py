@@ -0,0 +1,72 @@
+"""
+Cross-check of the NumPy batch engine against the scalar engine.
+Plays random-policy games with a fixed seed on both and checks that game
+lengths, win rates and card plays agree within sampling error.
+
+Run with: python -m unittest tests.test_batch
+"""
+
+import math
+import unittest
+
+try:
+    import numpy  # noqa: F401
+except ImportError:
+    numpy = None
+
+from game.simulate import game_seed, play_game
+from game.stats import SimulationStats
+
+SEED = 0
+PLAYERS = 4
+SCALAR_GAMES = 400
+BATCH_GAMES = 20000
+# Standard errors the two engines' means may differ by
+MAX_Z = 4.0
+# Relative difference allowed in each card's plays per game
+CARD_PLAYS_TOLERANCE = 0.15
+
+
+@unittest.skipIf(numpy is None, "the batch engine needs NumPy")
+class BatchEngineAgreesWithScalarEngine(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        from game.batch import BatchEngine, supported_catalog
+
+        catalog = supported_catalog()
+        cls.scalar = SimulationStats()
+        cls.lengths = []
+        for i in range(SCALAR_GAMES):
+            turns = cls.scalar.turns
+            play_game(game_seed(SEED, i), PLAYERS, ["random"], cls.scalar, catalog=catalog)
+            cls.lengths.append(cls.scalar.turns - turns)
+        cls.batch = BatchEngine(BATCH_GAMES, PLAYERS, seed=SEED, catalog=catalog).run()
+
+    def test_game_length(self):
+        mean = sum(self.lengths) / len(self.lengths)
+        sd = math.sqrt(sum((n - mean) ** 2 for n in self.lengths) / (len(self.lengths) - 1))
+        error = sd * math.sqrt(1 / self.scalar.games + 1 / self.batch.games)
+        batch_mean = self.batch.turns / self.batch.games
+        self.assertLessEqual(abs(batch_mean - mean), MAX_Z * error,
+                             f"mean game length: scalar {mean:.2f}, batch {batch_mean:.2f}")
+
+    def test_win_rate_by_seat(self):
+        for seat in range(PLAYERS):
+            rate = self.scalar.wins_by_seat[seat] / self.scalar.games
+            batch_rate = self.batch.wins_by_seat[seat] / self.batch.games
+            error = math.sqrt(batch_rate * (1 - batch_rate) * (1 / self.scalar.games + 1 / self.batch.games))
+            self.assertLessEqual(abs(batch_rate - rate), MAX_Z * error,
+                                 f"seat {seat} win rate: scalar {rate:.3f}, batch {batch_rate:.3f}")
+
+    def test_card_plays(self):
+        self.assertEqual(set(self.scalar.card_plays), set(self.batch.card_plays))
+        for name, plays in self.batch.card_plays.items():
+            per_game = self.scalar.card_plays[name] / self.scalar.games
+            batch_per_game = plays / self.batch.games
+            self.assertLessEqual(abs(per_game - batch_per_game), CARD_PLAYS_TOLERANCE * batch_per_game,
+                                 f"{name} plays per game: scalar {per_game:.2f}, batch {batch_per_game:.2f}")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,184 @@
+"""
+Tests for the game's indexed containers: Hand, DiscardPile and the
+incrementally kept organ counters on Player.
+
+Run with: python -m unittest tests.test_containers
+"""
+
+import random
+import unittest
+
+from game.discard_pile import DiscardPile
+from game.game_engine import GameEngine
+from game.hand import Hand
+from game.models import CardType, PlayerStatus
+from game.player import Player
+
+SEED = 5
+# Random organ operations in the counter test
+OPERATIONS = 2000
+
+
+def cards():
+    """Every card instance of a fresh game, in deck order."""
+    return GameEngine(["Ann", "Bob"], seed=SEED).card_instances[1:]
+
+
+class HandTests(unittest.TestCase):
+
+    def setUp(self):
+        self.cards = cards()[:6]
+        self.hand = Hand(self.cards[:4])
+
+    def test_keeps_draw_order(self):
+        self.hand.add(self.cards[4])
+        self.assertEqual(list(self.hand), self.cards[:5])
+        self.assertEqual(list(self.hand.ids()), [card.instance_id for card in self.cards[:5]])
+        self.assertEqual(len(self.hand), 5)
+
+    def test_lookups(self):
+        card = self.cards[2]
+        self.assertIs(self.hand.get(card.instance_id), card)
+        self.assertIsNone(self.hand.get(self.cards[5].instance_id))
+        self.assertIs(self.hand.find(card.id), next(c for c in self.cards[:4] if c.id == card.id))
+        self.assertIsNone(self.hand.find("no-such-card"))
+        self.assertIn(card, self.hand)
+        self.assertNotIn(self.cards[5], self.hand)
+        self.assertNotIn(None, self.hand)
+
+    def test_remove_by_card_or_id(self):
+        first, second = self.cards[0], self.cards[1]
+        self.assertIs(self.hand.remove(first), first)
+        self.assertIs(self.hand.remove(second.instance_id), second)
+        self.assertIsNone(self.hand.remove(first))
+        self.assertEqual(list(self.hand), self.cards[2:4])
+
+    def test_copy_is_independent(self):
+        twin = self.hand.copy()
+        twin.remove(self.cards[0])
+        twin.add(self.cards[5])
+        self.assertEqual(list(self.hand), self.cards[:4])
+        self.hand.clear()
+        self.assertEqual(list(twin), self.cards[1:4] + [self.cards[5]])
+        self.assertEqual(len(self.hand), 0)
+
+
+class DiscardPileTests(unittest.TestCase):
+
+    def setUp(self):
+        self.cards = cards()
+        self.pile = DiscardPile(self.cards[:30])
+
+    def test_indexes_agree_with_a_scan(self):
+        for card_type in CardType:
+            of_type = [card for card in self.cards[:30] if card.type == card_type]
+            self.assertEqual(self.pile.count(card_type), len(of_type))
+            self.assertIs(self.pile.most_recent(card_type), of_type[-1] if of_type else None)
+        self.assertIs(self.pile.top(), self.cards[29])
+        self.assertEqual(list(self.pile), self.cards[:30])
+
+    def test_summary(self):
+        summary = self.pile.summary()
+        self.assertEqual(summary["size"], 30)
+        self.assertEqual(summary["top"]["instance_id"], self.cards[29].instance_id)
+        self.assertEqual(sum(summary["counts"].values()), 30)
+        self.assertEqual(DiscardPile().summary(), {"size": 0, "top": None, "counts": {}})
+
+    def test_drain_empties_every_index(self):
+        self.assertEqual(self.pile.drain(), self.cards[:30])
+        self.assertEqual(len(self.pile), 0)
+        self.assertIsNone(self.pile.top())
+        for card_type in CardType:
+            self.assertEqual(self.pile.count(card_type), 0)
+            self.assertIsNone(self.pile.most_recent(card_type))
+
+    def test_copy_is_independent(self):
+        twin = self.pile.copy()
+        twin.append(self.cards[30])
+        self.pile.drain()
+        self.assertEqual(list(twin), self.cards[:31])
+        self.assertEqual(twin.count(self.cards[30].type),
+                         sum(card.type == self.cards[30].type for card in self.cards[:31]))
+
+    def test_from_groups_round_trips(self):
+        groups = [(card_type, list(type_cards)) for card_type, type_cards in self.pile.groups()]
+        self.assertTrue(all(type_cards for _, type_cards in groups))
+        twin = DiscardPile.from_groups(list(self.pile), groups)
+        self.assertEqual(twin.summary(), self.pile.summary())
+        for card_type in CardType:
+            self.assertIs(twin.most_recent(card_type), self.pile.most_recent(card_type))
+        twin.append(self.cards[30])
+        self.assertEqual(twin.count(self.cards[30].type), self.pile.count(self.cards[30].type) + 1)
+
+
+class OrganCounterTests(unittest.TestCase):
+
+    def assertCountersMatch(self, player: Player):
+        alive = [organ for organ in player.organs.values() if not organ.is_removed]
+        self.assertEqual(player.alive_organ_count(), len(alive))
+        self.assertEqual(player.protected_organ_count(), sum(organ.is_protected for organ in alive))
+        self.assertEqual(player.unprotected_organ_count(), sum(not organ.is_protected for organ in alive))
+        self.assertEqual(player.vital_organ_count(), sum(organ.is_vital for organ in alive))
+
+    def test_new_player(self):
+        player = Player("Ann", rng=random.Random(SEED))
+        self.assertEqual(player.alive_organ_count(), 6)
+        self.assertEqual(player.protected_organ_count(), 0)
+        self.assertCountersMatch(player)
+
+    def test_counters_follow_random_operations(self):
+        rng = random.Random(SEED)
+        players = [Player(name, rng=rng) for name in ("Ann", "Bob")]
+        for step in range(OPERATIONS):
+            player, other = rng.sample(players, 2)
+            if not player.organs:
+                continue
+            organ_type = rng.choice(list(player.organs))
+            operation = rng.randrange(6)
+            if operation == 0:
+                player.damage_organ(organ_type)
+            elif operation == 1:
+                player.protect_organ(organ_type, "Test", expires_at=step + 3)
+            elif operation == 2:
+                player.unprotect_organ(organ_type)
+            elif operation == 3:
+                player.remove_organ(organ_type)
+            elif operation == 4:
+                organ = player.take_organ(organ_type)
+                if organ is not None:
+                    other.receive_organ(organ)
+            else:
+                # Heal by hand, the way syncing from a serialized state does
+                player.organs[organ_type].is_removed = False
+                player.organs[organ_type].hit_points = 1
+                player.recount_organs()
+            for p in players:
+                self.assertCountersMatch(p)
+
+    def test_losing_the_last_organ_eliminates(self):
+        eliminated = []
+        player = Player("Ann", rng=random.Random(SEED), on_eliminated=eliminated.append)
+        for organ_type in list(player.organs)[:-1]:
+            player.remove_organ(organ_type)
+        self.assertEqual(player.status, PlayerStatus.ACTIVE)
+        player.take_organ(list(player.organs)[-1])
+        self.assertEqual(player.alive_organ_count(), 0)
+        self.assertEqual(player.status, PlayerStatus.ELIMINATED)
+        self.assertEqual(eliminated, [player])
+
+    def test_copy_keeps_counters(self):
+        player = Player("Ann", rng=random.Random(SEED))
+        organ_types = list(player.organs)
+        player.protect_organ(organ_types[0], "Test")
+        player.remove_organ(organ_types[1])
+        twin = player.copy()
+        self.assertCountersMatch(twin)
+        twin.unprotect_organ(organ_types[0])
+        twin.remove_organ(organ_types[2])
+        self.assertCountersMatch(player)
+        self.assertCountersMatch(twin)
+        self.assertEqual(player.protected_organ_count(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
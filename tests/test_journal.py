@@ -0,0 +1,141 @@
+"""
+Tests for the action journal and replayer.
+Journals random-policy games and checks that the binary format round-trips,
+that a torn last record is dropped, and that replaying, seeking and seeking
+by turn rebuild the positions the live game went through.
+
+Run with: python -m unittest tests.test_journal
+"""
+
+import os
+import tempfile
+import unittest
+
+from game.catalog import get_catalog
+from game.game_engine import GameEngine
+from game.journal import CHECKPOINT_INTERVAL, RECORD, ActionJournal, Replayer, replay
+from game.policies import RandomPolicy
+from game.simulate import MAX_TURNS, policy_rng
+
+SEED = 7
+NAMES = ["Ann", "Bob", "Cat"]
+
+
+def state(engine: GameEngine) -> dict:
+    """The engine's full state, minus the counter every restore bumps."""
+    data = engine.to_dict()
+    data.pop("state_version")
+    if data["legal_moves"] is not None:
+        # A copy: the engine caches this dict
+        data["legal_moves"] = {key: value for key, value in data["legal_moves"].items() if key != "version"}
+    return data
+
+
+def play(seed: int = SEED):
+    """Play a journaled random game; return the journal and the state after each action."""
+    engine = GameEngine(NAMES, seed=seed)
+    journal = ActionJournal(seed, NAMES)
+    policy, rng = RandomPolicy(), policy_rng(seed)
+    states = [state(engine)]
+    turns = {0: 0}
+    while not engine.is_game_over() and engine.turn_count < MAX_TURNS:
+        action = policy.choose_action(engine, engine.get_current_player(), rng)
+        if engine.apply(action).get("success"):
+            journal.record(action)
+            states.append(state(engine))
+            turns.setdefault(engine.turn_count, len(journal))
+    return journal, states, turns
+
+
+class ActionJournalTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.journal, cls.states, cls.turns = play()
+
+    def test_game_spans_several_checkpoints(self):
+        self.assertGreater(len(self.journal), 2 * CHECKPOINT_INTERVAL + 5)
+
+    def test_bytes_round_trip(self):
+        copy = ActionJournal.from_bytes(self.journal.to_bytes())
+        self.assertEqual(copy.seed, SEED)
+        self.assertEqual(copy.player_names, NAMES)
+        self.assertEqual(copy.catalog_id, get_catalog().identity)
+        self.assertEqual(list(copy), list(self.journal))
+        self.assertEqual(copy[-1], self.journal[len(self.journal) - 1])
+
+    def test_torn_last_record_is_dropped(self):
+        data = self.journal.to_bytes()
+        for cut in range(1, RECORD.size):
+            copy = ActionJournal.from_bytes(data[:-cut])
+            self.assertEqual(len(copy), len(self.journal) - 1)
+            self.assertEqual(list(copy), list(self.journal)[:-1])
+
+    def test_unknown_version_is_rejected(self):
+        data = self.journal.to_bytes().replace(b'"version":2', b'"version":99', 1)
+        with self.assertRaises(ValueError):
+            ActionJournal.from_bytes(data)
+
+    def test_other_catalog_is_rejected(self):
+        journal = ActionJournal(SEED, NAMES, catalog_id="not-this-catalog")
+        with self.assertRaises(ValueError):
+            Replayer(journal)
+
+    def test_file_is_written_as_actions_are_recorded(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "game.journal")
+            journal = ActionJournal(SEED, NAMES, path=path)
+            for action in list(self.journal)[:10]:
+                journal.record(action)
+            # Still open, as after a crash
+            self.assertEqual(list(ActionJournal.load(path)), list(self.journal)[:10])
+            journal.close()
+
+
+class ReplayerTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.journal, cls.states, cls.turns = play()
+
+    def test_replay_reaches_final_state(self):
+        self.assertEqual(state(replay(self.journal)), self.states[-1])
+
+    def test_step_follows_live_game(self):
+        replayer = Replayer(self.journal)
+        for position in range(1, len(self.journal) + 1):
+            self.assertTrue(replayer.step().get("success"))
+            self.assertEqual(state(replayer.engine), self.states[position], position)
+        self.assertIsNone(replayer.step())
+
+    def test_seek_backwards_and_forwards(self):
+        replayer = Replayer(self.journal)
+        replayer.seek(len(self.journal))
+        positions = [len(self.journal) - 1, 2 * CHECKPOINT_INTERVAL, 2 * CHECKPOINT_INTERVAL + 5,
+                     CHECKPOINT_INTERVAL - 1, 0, CHECKPOINT_INTERVAL + 1, 1]
+        for position in positions:
+            engine = replayer.seek(position)
+            self.assertEqual(replayer.position, position)
+            self.assertEqual(state(engine), self.states[position], position)
+
+    def test_seek_is_clamped(self):
+        replayer = Replayer(self.journal)
+        self.assertEqual(state(replayer.seek(len(self.journal) + 10)), self.states[-1])
+        self.assertEqual(state(replayer.seek(-3)), self.states[0])
+
+    def test_seek_turn(self):
+        replayer = Replayer(self.journal)
+        replayer.seek(len(self.journal))
+        for turn in sorted(self.turns, reverse=True)[::7] + [3, 40, 1]:
+            engine = replayer.seek_turn(turn)
+            self.assertEqual(engine.turn_count, turn)
+            self.assertEqual(replayer.position, self.turns[turn], turn)
+            self.assertEqual(state(engine), self.states[self.turns[turn]], turn)
+
+    def test_seek_turn_past_the_end(self):
+        engine = replay(self.journal, turn=max(self.turns) + 100)
+        self.assertEqual(state(engine), self.states[-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+"""
+Tests for the server's per-connection send queues.
+Drives an Outbox against a fake websocket that can be held back, and checks
+that backed-up state updates collapse into one snapshot and that a client
+that cannot keep up is evicted.
+
+Run with: python -m unittest tests.test_outbox
+"""
+
+import asyncio
+import unittest
+
+import websockets.exceptions
+
+from server.outbox import EVICTED_CLOSE_CODE, EVICTED_REASON, Outbox
+
+
+class FakeWebSocket:
+    """Records sent frames; while `flowing` is cleared, sends wait until it is set."""
+
+    def __init__(self):
+        self.frames = []
+        self.flowing = asyncio.Event()
+        self.flowing.set()
+        self.close_args = None
+        self.fail_with = None
+
+    async def send(self, frame: str):
+        await self.flowing.wait()
+        if self.fail_with is not None:
+            raise self.fail_with
+        self.frames.append(frame)
+
+    async def close(self, code: int, reason: str):
+        self.close_args = (code, reason)
+
+
+async def settle():
+    """Let the writer task run until it is waiting again."""
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+class OutboxTests(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.websocket = FakeWebSocket()
+        self.full_state = "full-0"
+
+    def snapshot(self) -> str:
+        return self.full_state
+
+    async def test_frames_are_sent_in_order(self):
+        outbox = Outbox(self.websocket, name="ann")
+        for frame in ("a", "b", "c"):
+            outbox.send(frame)
+        outbox.send_state("s", self.snapshot)
+        await settle()
+        self.assertEqual(self.websocket.frames, ["a", "b", "c", "s"])
+        self.assertEqual(outbox.stats(), {"depth": 0, "max_depth": 4, "sent": 4, "dropped": 0,
+                                          "evicted": False})
+        outbox.close()
+
+    async def test_backed_up_state_updates_collapse_into_one_snapshot(self):
+        outbox = Outbox(self.websocket, max_queue=4)
+        self.websocket.flowing.clear()
+        outbox.send_state("s0", self.snapshot)
+        await settle()
+        # s0 is being sent; these fill the queue
+        outbox.send("f1")
+        outbox.send_state("s1", self.snapshot)
+        outbox.send_state("s2", self.snapshot)
+        outbox.send("f2")
+        # No room: s1 and s2 become a snapshot, which covers s3 and s4 too
+        outbox.send_state("s3", self.snapshot)
+        outbox.send_state("s4", self.snapshot)
+        outbox.send("f3")
+        self.full_state = "full-4"
+
+        self.websocket.flowing.set()
+        await settle()
+        self.assertEqual(self.websocket.frames, ["s0", "f1", "f2", "full-4", "f3"])
+        self.assertEqual(outbox.dropped, 4)
+        self.assertFalse(outbox.evicted)
+
+        # With the snapshot sent, updates queue normally again
+        outbox.send_state("s5", self.snapshot)
+        await settle()
+        self.assertEqual(self.websocket.frames[-1], "s5")
+        outbox.close()
+
+    async def test_full_queue_of_frames_evicts(self):
+        outbox = Outbox(self.websocket, max_queue=2)
+        self.websocket.flowing.clear()
+        outbox.send("a")
+        await settle()
+        outbox.send("b")
+        outbox.send("c")
+        outbox.send("d")
+        self.assertTrue(outbox.evicted)
+        self.assertTrue(outbox.closed)
+        self.assertEqual(outbox.dropped, 2)
+        await settle()
+        self.assertEqual(self.websocket.close_args, (EVICTED_CLOSE_CODE, EVICTED_REASON))
+
+        outbox.send("e")
+        outbox.send_state("s", self.snapshot)
+        self.assertEqual(outbox.stats()["depth"], 0)
+
+    async def test_state_update_without_state_to_collapse_evicts(self):
+        outbox = Outbox(self.websocket, max_queue=2)
+        self.websocket.flowing.clear()
+        outbox.send("a")
+        await settle()
+        outbox.send("b")
+        outbox.send("c")
+        outbox.send_state("s", self.snapshot)
+        self.assertTrue(outbox.evicted)
+
+    async def test_stalled_send_evicts(self):
+        outbox = Outbox(self.websocket, send_timeout=0.01)
+        self.websocket.flowing.clear()
+        outbox.send("a")
+        await asyncio.sleep(0.05)
+        await settle()
+        self.assertTrue(outbox.evicted)
+        self.assertEqual(self.websocket.close_args, (EVICTED_CLOSE_CODE, EVICTED_REASON))
+
+    async def test_closed_connection_stops_without_evicting(self):
+        outbox = Outbox(self.websocket)
+        self.websocket.fail_with = websockets.exceptions.ConnectionClosed(None, None)
+        outbox.send("a")
+        await settle()
+        self.assertTrue(outbox.closed)
+        self.assertFalse(outbox.evicted)
+        self.assertIsNone(self.websocket.close_args)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+"""
+Tests for game snapshots and clones.
+Checks that restore() puts a game back exactly where snapshot() found it,
+and that a clone is an independent game that plays on like the original.
+
+Run with: python -m unittest tests.test_snapshot
+"""
+
+import dataclasses
+import random
+import unittest
+
+from game.game_engine import GameEngine
+from game.policies import RandomPolicy
+from game.simulate import policy_rng
+
+SEED = 3
+NAMES = ["Ann", "Bob", "Cat"]
+# Actions played before the position under test, and after it
+OPENING = 40
+CONTINUATION = 60
+
+
+def state(engine: GameEngine) -> dict:
+    """The engine's full state, minus the counter every restore bumps."""
+    data = engine.to_dict()
+    data.pop("state_version")
+    if data["legal_moves"] is not None:
+        # A copy: the engine caches this dict
+        data["legal_moves"] = {key: value for key, value in data["legal_moves"].items() if key != "version"}
+    return data
+
+
+def play(engine: GameEngine, actions: int, rng: random.Random):
+    """Play up to `actions` random moves; return the state after each."""
+    policy = RandomPolicy()
+    states = []
+    for _ in range(actions):
+        if engine.is_game_over():
+            break
+        engine.apply(policy.choose_action(engine, engine.get_current_player(), rng))
+        states.append(state(engine))
+    return states
+
+
+def organ_counters(engine: GameEngine) -> list:
+    return [(p.alive_organ_count(), p.protected_organ_count(), p.vital_organ_count()) for p in engine.players]
+
+
+class SnapshotTests(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = GameEngine(NAMES, seed=SEED)
+        self.rng = policy_rng(SEED)
+        play(self.engine, OPENING, self.rng)
+
+    def test_restore_returns_to_snapshot(self):
+        before = state(self.engine)
+        snapshot = self.engine.snapshot()
+        play(self.engine, CONTINUATION, self.rng)
+        self.assertNotEqual(state(self.engine), before)
+        self.engine.restore(snapshot)
+        self.assertEqual(state(self.engine), before)
+
+    def test_restore_rebuilds_organ_counters(self):
+        snapshot = self.engine.snapshot()
+        counters = organ_counters(self.engine)
+        player = self.engine.players[0]
+        for organ_type in list(player.organs):
+            player.take_organ(organ_type)
+        self.engine.players[1].protect_organ(next(iter(self.engine.players[1].organs)))
+        self.engine.restore(snapshot)
+        self.assertEqual(organ_counters(self.engine), counters)
+        for player in self.engine.players:
+            player.recount_organs()
+        self.assertEqual(organ_counters(self.engine), counters)
+
+    def test_replay_after_restore_is_identical(self):
+        snapshot = self.engine.snapshot()
+        rng_state = self.rng.getstate()
+        first = play(self.engine, CONTINUATION, self.rng)
+        self.engine.restore(snapshot)
+        self.rng.setstate(rng_state)
+        self.assertEqual(play(self.engine, CONTINUATION, self.rng), first)
+
+    def test_snapshot_without_rng_keeps_the_stream(self):
+        snapshot = self.engine.snapshot(include_rng=False)
+        self.assertIsNone(snapshot.rng_state)
+        play(self.engine, CONTINUATION, self.rng)
+        rng_state = self.engine.rng.getstate()
+        self.engine.restore(snapshot)
+        self.assertEqual(self.engine.rng.getstate(), rng_state)
+
+    def test_restore_bumps_the_state_version(self):
+        version = self.engine.state_version
+        self.engine.restore(self.engine.snapshot())
+        self.assertGreater(self.engine.state_version, version)
+
+    def test_snapshot_is_immutable(self):
+        snapshot = self.engine.snapshot()
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            snapshot.turn_count = 0
+
+
+class CloneTests(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = GameEngine(NAMES, seed=SEED)
+        self.rng = policy_rng(SEED)
+        play(self.engine, OPENING, self.rng)
+
+    def test_clone_matches_original(self):
+        self.assertEqual(state(self.engine.clone()), state(self.engine))
+        self.assertEqual(organ_counters(self.engine.clone()), organ_counters(self.engine))
+
+    def test_clone_plays_on_like_the_original(self):
+        twin = self.engine.clone()
+        twin_rng = random.Random()
+        twin_rng.setstate(self.rng.getstate())
+        self.assertEqual(play(twin, CONTINUATION, twin_rng), play(self.engine, CONTINUATION, self.rng))
+
+    def test_clone_is_independent(self):
+        before = state(self.engine)
+        rng_state = self.engine.rng.getstate()
+        twin = self.engine.clone(rng=random.Random(1))
+        play(twin, CONTINUATION, random.Random(2))
+        for player in twin.players:
+            for organ_type in list(player.organs):
+                player.damage_organ(organ_type)
+            player.hand.clear()
+        twin.discard_pile.clear()
+        self.assertEqual(state(self.engine), before)
+        # A clone given its own rng never draws from the original's
+        self.assertEqual(self.engine.rng.getstate(), rng_state)
+
+    def test_clone_players_share_nothing_mutable(self):
+        twin = self.engine.clone()
+        for player, copy in zip(self.engine.players, twin.players):
+            self.assertIsNot(copy, player)
+            self.assertIsNot(copy.hand, player.hand)
+            self.assertEqual(list(copy.hand), list(player.hand))
+            for organ_type, organ in player.organs.items():
+                self.assertIsNot(copy.organs[organ_type], organ)
+                self.assertEqual(copy.organs[organ_type], organ)
+
+    def test_organ_copy_keeps_every_field(self):
+        for player in self.engine.players:
+            for organ in player.organs.values():
+                twin = organ.copy()
+                self.assertIsNot(twin, organ)
+                for field in dataclasses.fields(organ):
+                    self.assertEqual(getattr(twin, field.name), getattr(organ, field.name), field.name)
+
+
+if __name__ == "__main__":
+    unittest.main()
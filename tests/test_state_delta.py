@@ -0,0 +1,106 @@
+"""
+Tests for state deltas.
+Follows a random-policy game the way an online client does, applying the
+public and private delta after every action, and checks that its copy of
+the state always matches the server's.
+
+Run with: python -m unittest tests.test_state_delta
+"""
+
+import copy
+import json
+import unittest
+
+from game.game_engine import GameEngine
+from game.policies import RandomPolicy
+from game.simulate import MAX_TURNS, policy_rng
+from game.state_delta import DeltaGap, apply_delta, apply_private, diff_private, diff_state
+
+SEED = 11
+NAMES = ["Ann", "Bob", "Cat", "Dan"]
+
+
+def view(engine: GameEngine, name: str) -> dict:
+    """What a client seated as `name` should hold: the public state plus its private view."""
+    return apply_private(engine.public_dict(), engine.private_dict(name))
+
+
+def wire(data: dict) -> dict:
+    """The data as a client receives it, sharing nothing with the server."""
+    return json.loads(json.dumps(data))
+
+
+class StateDeltaTests(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = GameEngine(NAMES, seed=SEED)
+        self.policy, self.rng = RandomPolicy(), policy_rng(SEED)
+
+    def step(self):
+        engine = self.engine
+        engine.apply(self.policy.choose_action(engine, engine.get_current_player(), self.rng))
+
+    def test_client_follows_game(self):
+        engine = self.engine
+        clients = {name: wire(view(engine, name)) for name in NAMES}
+        public = engine.public_dict()
+        private = {name: engine.private_dict(name) for name in NAMES}
+        actions = 0
+        while not engine.is_game_over() and engine.turn_count < MAX_TURNS:
+            self.step()
+            actions += 1
+            new_public = engine.public_dict()
+            delta = wire(diff_state(public, new_public))
+            for name in NAMES:
+                new_private = engine.private_dict(name)
+                apply_delta(clients[name], delta)
+                apply_private(clients[name], wire(diff_private(private[name], new_private)))
+                self.assertEqual(clients[name], wire(view(engine, name)), (actions, name))
+                private[name] = new_private
+            public = new_public
+        self.assertGreater(actions, 50)
+
+    def test_delta_of_equal_states_changes_only_the_version(self):
+        before = self.engine.public_dict()
+        after = copy.deepcopy(before)
+        after["state_version"] += 1
+        self.assertEqual(diff_state(before, after), {"base": before["state_version"],
+                                                     "version": after["state_version"]})
+
+    def test_removed_organ_is_sent_as_none(self):
+        before = self.engine.public_dict()
+        player = self.engine.players[1]
+        organ_type = next(iter(player.organs))
+        player.take_organ(organ_type)
+        self.engine.state_version += 1
+        after = self.engine.public_dict()
+        delta = diff_state(before, after)
+        self.assertIsNone(delta["players"]["1"]["organs"][organ_type])
+        self.assertEqual(apply_delta(wire(before), wire(delta)), wire(after))
+
+    def test_hand_changes_are_adds_and_removes(self):
+        name = self.engine.get_current_player().name
+        before = self.engine.private_dict(name)
+        while self.engine.get_current_player().name == name:
+            self.step()
+        after = self.engine.private_dict(name)
+        delta = diff_private(before, after)
+        old_ids = {card["instance_id"] for card in before["hand"]}
+        new_ids = {card["instance_id"] for card in after["hand"]}
+        self.assertEqual(set(delta.get("hand_remove", ())), old_ids - new_ids)
+        self.assertEqual({card["instance_id"] for card in delta.get("hand_add", ())}, new_ids - old_ids)
+
+    def test_missed_delta_is_a_gap(self):
+        state = wire(self.engine.public_dict())
+        self.step()
+        middle = self.engine.public_dict()
+        self.step()
+        delta = diff_state(middle, self.engine.public_dict())
+        with self.assertRaises(DeltaGap):
+            apply_delta(state, delta)
+        # A gap leaves the state untouched, ready for a full resync
+        self.assertEqual(state["state_version"], self.engine.state_version - 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,6 +3,11 @@ import { WebSocketManager } from './websocket.js';
 import { Lobby } from './lobby.js';
 import { GameBoard } from './game.js';
 import { TargetSelector } from './target.js';
+import { applyDelta, applyPrivate, DeltaGap } from './state.js';
+import { CardCatalog } from './catalog.js';
+
+// Close code the server uses when it drops a client for falling behind (server/outbox.py)
+const EVICTED_CLOSE_CODE = 4008;
 
 class App {
     constructor() {
@@ -10,11 +15,16 @@ class App {
         this.lobby = new Lobby(this);
         this.gameBoard = new GameBoard(this);
         this.targetSelector = new TargetSelector();
+        this.catalog = new CardCatalog(); // card definitions for the id-only cards in game states
+        this.catalogRequested = null; // etag of a catalog we've asked the server for
 
         this.myName = '';
         this.myPlayerId = null;
+        this.resumeToken = null; // secret for taking our seat back; never shared with other players
         this.isHost = false;
         this.engine = null; // local copy of game state for target selection
+        this.resyncPending = false; // asked for the full state after missing an update
+        this.resumeOnConnect = false; // evicted for falling behind; take the seat back on reconnect
 
         this.views = {
             home: document.getElementById('view-home'),
@@ -82,6 +92,7 @@ class App {
     _setupWebSocketEvents() {
         this.ws.on('lobby_created', (data) => {
             this.myPlayerId = data.player_id;
+            this.resumeToken = data.resume_token;
             this.isHost = true;
             this.lobby.show(data.code, data.players || [], true);
             this.showView('lobby');
@@ -89,6 +100,7 @@ class App {
 
         this.ws.on('joined_lobby', (data) => {
             this.myPlayerId = data.player_id;
+            this.resumeToken = data.resume_token;
             this.isHost = false;
             this.lobby.show(data.code, data.players || [], false);
             this.showView('lobby');
@@ -107,16 +119,19 @@ class App {
         });
 
         this.ws.on('game_started', (data) => {
-            this._handleGameState(data.game_state);
+            this._handleGameState(applyPrivate(data.game_state, data.private));
             this.showView('game');
         });
 
         this.ws.on('game_state_update', (data) => {
-            this._handleGameState(data.game_state);
+            if (!this._applyUpdate(data)) return;
             if (data.result) {
                 let msg = data.result.success ?
                     (data.result.card_played ? `Played ${data.result.card_played}` : 'Action completed') :
                     (data.result.error || 'Action failed');
+                // What we drew comes only in our own private part of the update
+                const mine = data.private && data.private.result;
+                if (mine && mine.card_drawn) msg = `Drew ${mine.card_drawn}`;
                 if (data.result.extra_turn) {
                     msg = `${data.result.current_player} gets an extra turn!`;
                 }
@@ -151,7 +166,8 @@ class App {
         });
 
         this.ws.on('game_state', (data) => {
-            this._handleGameState(data.game_state);
+            this.resyncPending = false;
+            this._handleGameState(applyPrivate(data.game_state, data.private));
         });
 
         this.ws.on('error', (data) => {
@@ -159,14 +175,65 @@ class App {
             this.gameBoard.showMessage(data.message || 'Error', 'error');
         });
 
-        this.ws.on('disconnected', () => {
+        this.ws.on('disconnected', (data) => {
+            if (data.code === EVICTED_CLOSE_CODE && this.myPlayerId) {
+                this.resumeOnConnect = true;
+                this.gameBoard.showMessage('Connection fell behind — reconnecting...', 'error');
+                return;
+            }
             this.gameBoard.showMessage('Disconnected from server', 'error');
         });
+
+        this.ws.on('connected', () => {
+            this.ws.send({ type: 'get_catalog', etag: this.catalog.etag });
+            if (!this.resumeOnConnect) return;
+            this.resumeOnConnect = false;
+            this.resyncPending = true;
+            this.ws.send({ type: 'resume', player_id: this.myPlayerId, resume_token: this.resumeToken });
+        });
+
+        this.ws.on('catalog', (data) => {
+            this.catalog.update(data);
+            this.catalogRequested = null;
+            if (this.engine) this.gameBoard.setState(this.engine, this.myName);
+        });
+
+        this.ws.on('resumed', (data) => {
+            this.myPlayerId = data.player_id;
+            this.resumeToken = data.resume_token;
+            this.isHost = data.is_host;
+            this.gameBoard.showMessage('Reconnected', 'success');
+        });
+    }
+
+    // Applies an update's delta to the local state; on a gap, asks for the full state instead
+    _applyUpdate(data) {
+        if (!data.delta) {
+            this._handleGameState(applyPrivate(data.game_state, data.private));
+            return true;
+        }
+        if (this.resyncPending) return false;
+        if (this.engine && data.delta.version <= this.engine.state_version) return false;
+        try {
+            if (!this.engine) throw new DeltaGap('No state to apply the delta to');
+            this._handleGameState(applyPrivate(applyDelta(this.engine, data.delta), data.private));
+            return true;
+        } catch (e) {
+            if (!(e instanceof DeltaGap)) throw e;
+            this.resyncPending = true;
+            this.ws.send({ type: 'get_game_state' });
+            return false;
+        }
     }
 
     _handleGameState(gameState) {
         if (!gameState) return;
         this.engine = gameState;
+        if (gameState.catalog && gameState.catalog !== this.catalog.etag && gameState.catalog !== this.catalogRequested) {
+            // The game uses cards we don't have, e.g. after the server reloaded them
+            this.catalogRequested = gameState.catalog;
+            this.ws.send({ type: 'get_catalog', etag: this.catalog.etag });
+        }
         this.gameBoard.setState(gameState, this.myName);
 
         // Check for game over
@@ -299,7 +366,8 @@ class App {
             action: 'discard_card',
             data: {
                 player_name: this.myName,
-                card_id: card.id
+                card_id: card.id,
+                instance_id: card.instance_id
             }
         });
         this.gameBoard.discardMode = false;
@@ -308,8 +376,10 @@ class App {
     async playCard(card) {
         if (!this.engine) return;
 
-        // If card has a target, show target selector
-        if (card.target) {
+        // Cards with a target, or that the server says can't be played, go through the target selector
+        const legal = this.engine.legal_moves;
+        const unplayable = legal && legal.player === this.myName && !legal.moves[card.id];
+        if (card.target || unplayable) {
             const result = await this.targetSelector.show(card, this.engine, this.myName);
             if (!result) return; // cancelled
 
@@ -329,6 +399,7 @@ class App {
                 data: {
                     player_name: this.myName,
                     card_id: card.id,
+                    instance_id: card.instance_id,
                     target_player: targetName,
                     target_organ: targetOrgan
                 }
@@ -339,7 +410,8 @@ class App {
                 action: 'play_card',
                 data: {
                     player_name: this.myName,
-                    card_id: card.id
+                    card_id: card.id,
+                    instance_id: card.instance_id
                 }
             });
         }
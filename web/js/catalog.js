@@ -0,0 +1,38 @@
+// Card catalog cache (see CardCatalog.to_json in game/catalog.py)
+// Game states send cards as { id, instance_id }; this fills in the rest. The
+// catalog is kept in localStorage and only refetched when its etag changes.
+const STORAGE_KEY = 'organ-attack-catalog';
+
+export class CardCatalog {
+    constructor() {
+        this.etag = null;
+        this.cards = {};
+        try {
+            const saved = JSON.parse(localStorage.getItem(STORAGE_KEY) || 'null');
+            if (saved) {
+                this.etag = saved.etag;
+                this.cards = saved.cards;
+            }
+        } catch (e) {
+            // A corrupt or unavailable cache just means fetching the catalog again
+        }
+    }
+
+    // Takes a 'catalog' message; an unchanged one confirms the cached cards
+    update(data) {
+        if (!data.unchanged) {
+            this.cards = data.cards || {};
+            try {
+                localStorage.setItem(STORAGE_KEY, JSON.stringify({ etag: data.etag, cards: this.cards }));
+            } catch (e) {
+                // Storage full or disabled; the catalog still works for this session
+            }
+        }
+        this.etag = data.etag;
+    }
+
+    // A card sent by id, with its name, type, description and target filled in
+    card(ref) {
+        return { ...(this.cards[ref.id] || { name: ref.id }), ...ref };
+    }
+}
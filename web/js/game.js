@@ -55,7 +55,7 @@ export class GameBoard {
         this.el.phaseInfo.className = `phase-badge ${gs === 1 ? 'play' : 'done'}`;
 
         const deckLen = this.state.deck_size || 0;
-        const discardLen = (this.state.discard_pile || []).length;
+        const discardLen = (this.state.discard_summary || {}).size || 0;
         this.el.deckCount.textContent = `Deck: ${deckLen}`;
         this.el.discardCount.textContent = `Discard: ${discardLen}`;
 
@@ -99,7 +99,8 @@ export class GameBoard {
                 }
             }
 
-            (myPlayer.hand || []).forEach(card => {
+            (myPlayer.hand || []).forEach(ref => {
+                const card = this.app.catalog.card(ref);
                 const canPlay = canAct && (cardsPlayed < 2 || this.discardMode);
                 const cardEl = this._createCard(card, canPlay);
                 this.el.myHand.appendChild(cardEl);
@@ -134,7 +135,7 @@ export class GameBoard {
 
         const handInfo = document.createElement('div');
         handInfo.style.cssText = 'margin-top:0.5rem;font-size:0.8rem;color:var(--text-muted)';
-        handInfo.textContent = `Cards: ${(player.hand || []).length}`;
+        handInfo.textContent = `Cards: ${player.hand_size ?? (player.hand || []).length}`;
         panel.appendChild(handInfo);
 
         return panel;
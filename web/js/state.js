@@ -0,0 +1,53 @@
+// Game state deltas from the server (see game/state_delta.py)
+export class DeltaGap extends Error {}
+
+export function applyDelta(state, delta) {
+    if (state.state_version !== delta.base) {
+        throw new DeltaGap(`State is at version ${state.state_version}, delta is based on ${delta.base}`);
+    }
+
+    Object.assign(state, delta.set || {});
+    state.players = state.players || [];
+    Object.entries(delta.players || {}).forEach(([index, playerDelta]) => {
+        while (state.players.length <= Number(index)) state.players.push({ organs: {}, hand: [] });
+        applyPlayerDelta(state.players[Number(index)], playerDelta);
+    });
+    state.state_version = delta.version;
+    return state;
+}
+
+function applyPlayerDelta(player, delta) {
+    Object.assign(player, delta.set || {});
+
+    player.organs = player.organs || {};
+    Object.entries(delta.organs || {}).forEach(([organType, changes]) => {
+        if (changes === null) {
+            delete player.organs[organType];
+        } else if (player.organs[organType]) {
+            Object.assign(player.organs[organType], changes);
+        } else {
+            player.organs[organType] = changes;
+        }
+    });
+
+    if (delta.hand_add || delta.hand_remove) {
+        const removed = new Set(delta.hand_remove || []);
+        player.hand = (player.hand || []).filter(card => !removed.has(card.instance_id));
+        player.hand.push(...(delta.hand_add || []));
+    }
+}
+
+// Merges this player's private view (seat, hand, legal moves), full or a delta, into the state
+export function applyPrivate(state, priv) {
+    if (!priv) return state;
+    const player = state.players[priv.seat];
+    if (priv.hand) {
+        player.hand = priv.hand;
+    } else if (priv.hand_add || priv.hand_remove) {
+        const removed = new Set(priv.hand_remove || []);
+        player.hand = (player.hand || []).filter(card => !removed.has(card.instance_id));
+        player.hand.push(...(priv.hand_add || []));
+    }
+    if ('legal_moves' in priv) state.legal_moves = priv.legal_moves;
+    return state;
+}
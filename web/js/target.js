@@ -28,13 +28,26 @@ export class TargetSelector {
             this.selectedOrgan = null;
             this.okBtn.disabled = true;
 
+            // Targets the server says this card can be played at, when the state carries them
+            const legal = engine.legal_moves;
+            this.legalTargets = legal && legal.player === myName ? (legal.moves[card.id] || []) : null;
+
             // Show discard option for cards with targets
-            if (card.target) {
+            if (card.target || this.legalTargets?.length === 0) {
                 this.discardBtn.classList.remove('hidden');
             } else {
                 this.discardBtn.classList.add('hidden');
             }
 
+            if (this.legalTargets?.length === 0) {
+                this.title.textContent = card.name;
+                this.desc.textContent = 'This card cannot be played right now. You can discard it instead.';
+                this.playersDiv.innerHTML = '';
+                this.organsDiv.classList.add('hidden');
+                this._show();
+                return;
+            }
+
             if (!card.target) {
                 this._confirm();
                 return;
@@ -70,7 +83,12 @@ export class TargetSelector {
                 players = (engine.players || []).filter(p => p.status !== 'eliminated');
             } else if (target.player_scope === 'Self') {
                 players = (engine.players || []).filter(p => p.name === myName);
-            } else if (target.player_scope === 'All') {
+            }
+            if (this.legalTargets) {
+                players = players.filter(p => this.legalTargets.some(([name]) => name === p.name));
+            }
+
+            if (target.player_scope === 'All') {
                 this.selectedPlayer = null;
                 this.selectedOrgan = target.organ_type !== 'Any' ? target.organ_type : null;
                 if (target.organ_type && target.organ_type !== 'Any') {
@@ -131,7 +149,11 @@ export class TargetSelector {
     }
 
     _updateOrgans(player) {
-        const organs = Object.values(player.organs || {}).filter(o => !o.is_removed);
+        let organs = Object.values(player.organs || {}).filter(o => !o.is_removed);
+        if (this.legalTargets) {
+            organs = organs.filter(o => this.legalTargets.some(
+                ([name, organType]) => name === player.name && organType === o.organ_type));
+        }
         if (organs.length === 0) return;
 
         this.organsDiv.classList.remove('hidden');
@@ -26,8 +26,8 @@ export class WebSocketManager {
                 }
             };
 
-            this.ws.onclose = () => {
-                this._emit('disconnected', {});
+            this.ws.onclose = (event) => {
+                this._emit('disconnected', { code: event.code, reason: event.reason });
                 this._tryReconnect(url);
             };
 